@@ -0,0 +1,29 @@
+import sys
+import os
+import asyncio
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from deepwork_sdk import AsyncDeepWorkClient
+
+
+async def run_session(client, n):
+    session = await client.create_session(
+        title=f"Async Deep Work {n}",
+        goal="Testing the async SDK",
+        scheduled_duration=30,
+    )
+    await client.start_session(session["id"])
+    await client.pause_session(session["id"], "Quick break")
+    await client.resume_session(session["id"])
+    return await client.complete_session(session["id"])
+
+
+async def main():
+    async with AsyncDeepWorkClient(pool_size=20) as client:
+        print("Driving 20 sessions concurrently...")
+        completed = await asyncio.gather(*(run_session(client, n) for n in range(20)))
+        print("Completed:", [s["id"] for s in completed])
+        print("Weekly Report:", await client.get_weekly_report())
+
+
+asyncio.run(main())
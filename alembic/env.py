@@ -11,12 +11,17 @@ from alembic import context
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import Base and models
+from app.config import DATABASE_URL
 from app.database import Base
 from app import models  # ensures models are registered
 
 # this is the Alembic Config object
 config = context.config
 
+# Migrate the database the app uses (DEEPWORK_DATABASE_URL), not alembic.ini's default;
+# % is escaped because the value goes through configparser interpolation
+config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
+
 # Setup logging
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -25,6 +30,13 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # FTS5 virtual tables (and their shadow tables) are managed by raw DDL, not the models
+    if type_ == "table" and name.startswith(models.FTS_TABLES):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
 
@@ -32,6 +44,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -52,7 +65,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
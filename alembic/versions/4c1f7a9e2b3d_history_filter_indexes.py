@@ -0,0 +1,31 @@
+"""history filter indexes
+
+Revision ID: 4c1f7a9e2b3d
+Revises: 68e83b340514
+Create Date: 2026-10-18 10:12:41.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4c1f7a9e2b3d'
+down_revision: Union[str, Sequence[str], None] = '68e83b340514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_sessions_created_at'), 'sessions', ['created_at'], unique=False)
+    op.create_index('ix_sessions_status_created_at', 'sessions', ['status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_sessions_title'), 'sessions', ['title'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sessions_title'), table_name='sessions')
+    op.drop_index('ix_sessions_status_created_at', table_name='sessions')
+    op.drop_index(op.f('ix_sessions_created_at'), table_name='sessions')
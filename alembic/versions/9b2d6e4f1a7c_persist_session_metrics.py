@@ -0,0 +1,76 @@
+"""persist session metrics
+
+Revision ID: 9b2d6e4f1a7c
+Revises: 4c1f7a9e2b3d
+Create Date: 2026-10-18 11:02:17.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9b2d6e4f1a7c'
+down_revision: Union[str, Sequence[str], None] = '4c1f7a9e2b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sessions', sa.Column('pause_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('sessions', sa.Column('actual_duration', sa.Float(), nullable=True))
+    op.add_column('sessions', sa.Column('completion_ratio', sa.Float(), nullable=True))
+    op.add_column('sessions', sa.Column('focus_score', sa.Float(), nullable=True))
+
+    # Backfill existing rows in id-range batches so each UPDATE stays small
+    conn = op.get_bind()
+    last_id = 0
+
+    while True:
+        batch_end = conn.execute(
+            sa.text(
+                "SELECT MAX(id) FROM "
+                "(SELECT id FROM sessions WHERE id > :last_id ORDER BY id LIMIT :batch_size)"
+            ),
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+
+        if batch_end is None:
+            break
+
+        params = {"first_id": last_id, "last_id": batch_end}
+
+        conn.execute(
+            sa.text(
+                "UPDATE sessions SET "
+                "pause_count = (SELECT COUNT(*) FROM interruptions WHERE interruptions.session_id = sessions.id), "
+                "actual_duration = ROUND((julianday(end_time) - julianday(start_time)) * 1440, 2) "
+                "WHERE id > :first_id AND id <= :last_id"
+            ),
+            params,
+        )
+        conn.execute(
+            sa.text(
+                "UPDATE sessions SET "
+                "completion_ratio = ROUND(actual_duration / scheduled_duration, 2), "
+                "focus_score = CASE WHEN scheduled_duration > 0 "
+                "THEN ROUND((1 - pause_count * 1.0 / scheduled_duration) * 100, 2) END "
+                "WHERE id > :first_id AND id <= :last_id"
+            ),
+            params,
+        )
+
+        last_id = batch_end
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('focus_score')
+        batch_op.drop_column('completion_ratio')
+        batch_op.drop_column('actual_duration')
+        batch_op.drop_column('pause_count')
@@ -0,0 +1,32 @@
+"""interruption index, drop redundant sessions.id index
+
+Revision ID: a3f9c7e1b5d2
+Revises: e7c4b2a9d0f1
+Create Date: 2026-10-18 13:05:42.618230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a3f9c7e1b5d2'
+down_revision: Union[str, Sequence[str], None] = 'e7c4b2a9d0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_interruptions_session_id_pause_time', 'interruptions', ['session_id', 'pause_time'], unique=False
+    )
+    # sessions.id is the rowid alias; the planner never needs this copy of it
+    op.drop_index(op.f('ix_sessions_id'), table_name='sessions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_sessions_id'), 'sessions', ['id'], unique=False)
+    op.drop_index('ix_interruptions_session_id_pause_time', table_name='interruptions')
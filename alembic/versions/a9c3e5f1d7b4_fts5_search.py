@@ -0,0 +1,76 @@
+"""FTS5 search over session titles/goals and interruption reasons
+
+Revision ID: a9c3e5f1d7b4
+Revises: f2a6c8e4b7d3
+Create Date: 2026-10-18 19:27:33.905166
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'a9c3e5f1d7b4'
+down_revision: Union[str, Sequence[str], None] = 'f2a6c8e4b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same DDL as app.models (which covers create_all); external-content tables, so
+# the text lives only in sessions/interruptions and the index just points at rows.
+UPGRADE = (
+    """CREATE VIRTUAL TABLE sessions_fts USING fts5(
+        title, goal, content='sessions', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER sessions_fts_ai AFTER INSERT ON sessions BEGIN
+        INSERT INTO sessions_fts(rowid, title, goal) VALUES (new.id, new.title, new.goal);
+    END""",
+    """CREATE TRIGGER sessions_fts_ad AFTER DELETE ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, title, goal) VALUES ('delete', old.id, old.title, old.goal);
+    END""",
+    """CREATE TRIGGER sessions_fts_au AFTER UPDATE OF title, goal ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, title, goal) VALUES ('delete', old.id, old.title, old.goal);
+        INSERT INTO sessions_fts(rowid, title, goal) VALUES (new.id, new.title, new.goal);
+    END""",
+    """CREATE VIRTUAL TABLE interruptions_fts USING fts5(
+        reason, session_id UNINDEXED, content='interruptions', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER interruptions_fts_ai AFTER INSERT ON interruptions BEGIN
+        INSERT INTO interruptions_fts(rowid, reason, session_id) VALUES (new.id, new.reason, new.session_id);
+    END""",
+    """CREATE TRIGGER interruptions_fts_ad AFTER DELETE ON interruptions BEGIN
+        INSERT INTO interruptions_fts(interruptions_fts, rowid, reason, session_id)
+        VALUES ('delete', old.id, old.reason, old.session_id);
+    END""",
+    """CREATE TRIGGER interruptions_fts_au AFTER UPDATE OF reason, session_id ON interruptions BEGIN
+        INSERT INTO interruptions_fts(interruptions_fts, rowid, reason, session_id)
+        VALUES ('delete', old.id, old.reason, old.session_id);
+        INSERT INTO interruptions_fts(rowid, reason, session_id) VALUES (new.id, new.reason, new.session_id);
+    END""",
+    # index the rows that already exist
+    "INSERT INTO sessions_fts(sessions_fts) VALUES ('rebuild')",
+    "INSERT INTO interruptions_fts(interruptions_fts) VALUES ('rebuild')",
+)
+
+DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS interruptions_fts_au",
+    "DROP TRIGGER IF EXISTS interruptions_fts_ad",
+    "DROP TRIGGER IF EXISTS interruptions_fts_ai",
+    "DROP TABLE IF EXISTS interruptions_fts",
+    "DROP TRIGGER IF EXISTS sessions_fts_au",
+    "DROP TRIGGER IF EXISTS sessions_fts_ad",
+    "DROP TRIGGER IF EXISTS sessions_fts_ai",
+    "DROP TABLE IF EXISTS sessions_fts",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in UPGRADE:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in DOWNGRADE:
+        op.execute(statement)
@@ -0,0 +1,41 @@
+"""change_seq on sessions and interruptions
+
+Revision ID: b8d1f4a6c2e9
+Revises: a3f9c7e1b5d2
+Create Date: 2026-10-18 15:21:07.402918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b8d1f4a6c2e9'
+down_revision: Union[str, Sequence[str], None] = 'a3f9c7e1b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sessions', sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('interruptions', sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+
+    # Existing rows count as one write, so a client syncing from token 0 receives them
+    op.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    op.execute("UPDATE sessions SET change_seq = (SELECT version FROM data_version WHERE id = 1)")
+    op.execute("UPDATE interruptions SET change_seq = (SELECT version FROM data_version WHERE id = 1)")
+
+    op.create_index(op.f('ix_sessions_change_seq'), 'sessions', ['change_seq'], unique=False)
+    op.create_index(op.f('ix_interruptions_change_seq'), 'interruptions', ['change_seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_interruptions_change_seq'), table_name='interruptions')
+    op.drop_index(op.f('ix_sessions_change_seq'), table_name='sessions')
+    with op.batch_alter_table('interruptions') as batch_op:
+        batch_op.drop_column('change_seq')
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('change_seq')
@@ -0,0 +1,51 @@
+"""resume_time on interruptions, paused/focused minutes on sessions
+
+Revision ID: c4e7a2d9f8b1
+Revises: b8d1f4a6c2e9
+Create Date: 2026-10-18 16:40:12.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c4e7a2d9f8b1'
+down_revision: Union[str, Sequence[str], None] = 'b8d1f4a6c2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Resumes were never recorded before this revision, so how long a past pause
+# lasted is unknown: paused_minutes stays 0 and focused_minutes stays NULL for
+# any session that was interrupted. Only sessions that never paused get a real
+# value (all of their actual duration was focused).
+BACKFILL_FOCUSED_MINUTES = """
+UPDATE sessions
+SET focused_minutes = actual_duration
+WHERE actual_duration IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM interruptions i WHERE i.session_id = sessions.id)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('interruptions', sa.Column('resume_time', sa.TIMESTAMP(), nullable=True))
+    op.add_column('sessions', sa.Column('paused_minutes', sa.Float(), server_default='0', nullable=False))
+    op.add_column('sessions', sa.Column('focused_minutes', sa.Float(), nullable=True))
+
+    op.execute(BACKFILL_FOCUSED_MINUTES)
+
+    # every session row gained fields, so delta-sync clients pick them all up once
+    op.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    op.execute("UPDATE sessions SET change_seq = (SELECT version FROM data_version WHERE id = 1)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('focused_minutes')
+        batch_op.drop_column('paused_minutes')
+    with op.batch_alter_table('interruptions') as batch_op:
+        batch_op.drop_column('resume_time')
@@ -0,0 +1,48 @@
+"""overdue_at on sessions: running overruns stay active
+
+Revision ID: d1b7e3f5a2c8
+Revises: a9c3e5f1d7b4
+Create Date: 2026-10-18 21:05:37.402918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd1b7e3f5a2c8'
+down_revision: Union[str, Sequence[str], None] = 'a9c3e5f1d7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The sweeper used to set status "overdue" on sessions that were still running.
+# Those rows go back to "active", and overdue_at gets the moment they passed 110%
+# of their schedule.
+RESTORE_RUNNING_OVERDUE = """
+UPDATE sessions
+SET status = 'active',
+    overdue_at = datetime(start_time, '+' || (scheduled_duration * 1.1) || ' minutes'),
+    version = version + 1,
+    change_seq = COALESCE((SELECT version FROM data_version WHERE id = 1), 0)
+WHERE status = 'overdue' AND end_time IS NULL AND start_time IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # plain ADD COLUMN: a batch rebuild of sessions would drop the FTS triggers
+    op.add_column('sessions', sa.Column('overdue_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('sessions_archive', sa.Column('overdue_at', sa.TIMESTAMP(), nullable=True))
+
+    op.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    op.execute(RESTORE_RUNNING_OVERDUE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE sessions SET status = 'overdue' WHERE overdue_at IS NOT NULL AND end_time IS NULL")
+    with op.batch_alter_table('sessions_archive') as batch_op:
+        batch_op.drop_column('overdue_at')
+    op.drop_column('sessions', 'overdue_at')
@@ -0,0 +1,28 @@
+"""session version
+
+Revision ID: d5e8a1c3f6b9
+Revises: 9b2d6e4f1a7c
+Create Date: 2026-10-18 11:48:53.120447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd5e8a1c3f6b9'
+down_revision: Union[str, Sequence[str], None] = '9b2d6e4f1a7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sessions', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('version')
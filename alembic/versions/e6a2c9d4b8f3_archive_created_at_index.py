@@ -0,0 +1,26 @@
+"""created_at index on sessions_archive for weekly report ranges
+
+Revision ID: e6a2c9d4b8f3
+Revises: d1b7e3f5a2c8
+Create Date: 2026-10-18 21:48:10.557204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e6a2c9d4b8f3'
+down_revision: Union[str, Sequence[str], None] = 'd1b7e3f5a2c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_sessions_archive_created_at', 'sessions_archive', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_archive_created_at', table_name='sessions_archive')
@@ -0,0 +1,70 @@
+"""archive tables, never-reused session and interruption ids
+
+Revision ID: f2a6c8e4b7d3
+Revises: c4e7a2d9f8b1
+Create Date: 2026-10-18 18:02:51.730644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f2a6c8e4b7d3'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a2d9f8b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # AUTOINCREMENT needs a table rebuild; without it SQLite hands out max(id) + 1,
+    # which can collide with an id that was just moved to the archive
+    for table in ('sessions', 'interruptions'):
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+            pass
+
+    op.create_table(
+        'sessions_archive',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('goal', sa.Text(), nullable=True),
+        sa.Column('scheduled_duration', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.TIMESTAMP(), nullable=True),
+        sa.Column('end_time', sa.TIMESTAMP(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('pause_count', sa.Integer(), nullable=False),
+        sa.Column('actual_duration', sa.Float(), nullable=True),
+        sa.Column('completion_ratio', sa.Float(), nullable=True),
+        sa.Column('focus_score', sa.Float(), nullable=True),
+        sa.Column('paused_minutes', sa.Float(), nullable=False),
+        sa.Column('focused_minutes', sa.Float(), nullable=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('change_seq', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'interruptions_archive',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.Integer(), nullable=True),
+        sa.Column('reason', sa.Text(), nullable=False),
+        sa.Column('pause_time', sa.TIMESTAMP(), nullable=True),
+        sa.Column('resume_time', sa.TIMESTAMP(), nullable=True),
+        sa.Column('change_seq', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_interruptions_archive_session_id', 'interruptions_archive', ['session_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interruptions_archive_session_id', table_name='interruptions_archive')
+    op.drop_table('interruptions_archive')
+    op.drop_table('sessions_archive')
+    for table in ('interruptions', 'sessions'):
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+            pass
@@ -0,0 +1,158 @@
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import select
+
+from app.config import CACHE_BACKEND, CACHE_MAXSIZE, CACHE_REDIS_URL, CACHE_TTL_SECONDS
+from app.models import DataVersion
+
+
+# 🔹 CACHE KEY VERSION
+# Entries are keyed by the shared data_version row that every write transaction
+# bumps, read before the cached function runs. A value is therefore never older
+# than its key, whichever process (worker, sweeper, CLI tool) made the write, and
+# the ETag routes build from the same row always matches the body.
+def data_version(db):
+    # a transaction that has written sees its own uncommitted rows; those are never cached
+    transaction = db.get_transaction()
+    if transaction is not None and db.info.get("change_seq_transaction") is transaction:
+        return None
+    return db.execute(select(DataVersion.version).where(DataVersion.id == 1)).scalar() or 0
+
+
+# 🔹 BACKENDS
+class MemoryBackend:
+    """Per-process LRU with a TTL on every entry."""
+
+    name = "memory"
+
+    def __init__(self, maxsize=CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self):
+        # entries for older versions are never read again; drop them now instead of waiting for the LRU
+        with self.lock:
+            self.entries.clear()
+
+    def size(self):
+        return len(self.entries)
+
+
+class RedisBackend:
+    """Shared across uvicorn workers; needs the optional `redis` package."""
+
+    name = "redis"
+
+    def __init__(self, url=CACHE_REDIS_URL, maxsize=CACHE_MAXSIZE):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("DEEPWORK_CACHE_BACKEND=redis requires the 'redis' package") from exc
+
+        # maxsize is left to Redis' own maxmemory/eviction policy
+        self.maxsize = maxsize
+        self.client = redis.Redis.from_url(url)
+
+    def _redis_key(self, key):
+        return "deepwork:cache:" + ":".join(map(str, key))
+
+    def get(self, key):
+        raw = self.client.get(self._redis_key(key))
+        return None if raw is None else (None, json.loads(raw))
+
+    def set(self, key, value, ttl):
+        self.client.set(self._redis_key(key), json.dumps(value), ex=max(1, int(ttl)))
+
+    def invalidate(self):
+        # entries for older versions are never read again and expire on their TTL
+        pass
+
+    def size(self):
+        return None
+
+
+# 🔹 SERVICE CACHE (wraps read-only service functions, cleared by every write)
+class ServiceCache:
+    def __init__(self, backend, ttl=CACHE_TTL_SECONDS, version=data_version):
+        self.backend = backend
+        self.ttl = ttl
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, fn):
+        """Cache fn(db, *args, **kwargs) by everything except the db session."""
+
+        @functools.wraps(fn)
+        def wrapper(db, *args, **kwargs):
+            version = None if self.backend is None else self.version(db)
+            if version is None:
+                return fn(db, *args, **kwargs)
+
+            key = (version, fn.__name__, repr(args), repr(sorted(kwargs.items())))
+            entry = self.backend.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            value = fn(db, *args, **kwargs)
+            self.backend.set(key, value, self.ttl)
+            return value
+
+        return wrapper
+
+    def invalidate(self):
+        if self.backend is not None:
+            self.backend.invalidate()
+
+    def clear(self):
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name if self.backend else "none",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "size": self.backend.size() if self.backend else 0,
+            "ttl_seconds": self.ttl,
+        }
+
+
+def make_backend(kind=CACHE_BACKEND):
+    if kind == "memory":
+        return MemoryBackend()
+    if kind == "redis":
+        return RedisBackend()
+    return None
+
+
+cache = ServiceCache(make_backend())
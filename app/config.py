@@ -0,0 +1,65 @@
+import os
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+# 🔹 DATABASE
+DATABASE_URL = os.getenv("DEEPWORK_DATABASE_URL", "sqlite:///./deepwork.db")
+
+# "sync"  -> blocking SessionLocal, service calls run on the threadpool
+# "async" -> AsyncSession over aiosqlite, service calls are awaited on the event loop
+DB_MODE = os.getenv("DEEPWORK_DB_MODE", "sync").lower()
+
+if DB_MODE not in ("sync", "async"):
+    raise ValueError(f"DEEPWORK_DB_MODE must be 'sync' or 'async', got {DB_MODE!r}")
+
+# 🔹 CONNECTION POOL (file databases; in-memory SQLite keeps SQLAlchemy's default pool)
+DB_POOL_SIZE = _env_int("DEEPWORK_DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = _env_int("DEEPWORK_DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT = _env_int("DEEPWORK_DB_POOL_TIMEOUT", 30)
+
+# 🔹 SQLITE PRAGMAS (applied on every new connection)
+# WAL lets /history readers run while pause/complete writers commit;
+# busy_timeout makes a writer wait for the lock instead of failing with "database is locked".
+SQLITE_BUSY_TIMEOUT_MS = _env_int("DEEPWORK_SQLITE_BUSY_TIMEOUT_MS", 5000)
+SQLITE_JOURNAL_MODE = os.getenv("DEEPWORK_SQLITE_JOURNAL_MODE", "WAL").upper()
+SQLITE_SYNCHRONOUS = os.getenv("DEEPWORK_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+SQLITE_MMAP_SIZE = _env_int("DEEPWORK_SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_CACHE_SIZE = _env_int("DEEPWORK_SQLITE_CACHE_SIZE", -64000)  # negative = KiB, i.e. 64 MB
+
+# 🔹 LIVE EVENTS (/sessions/events)
+EVENT_QUEUE_SIZE = _env_int("DEEPWORK_EVENT_QUEUE_SIZE", 100)  # per subscriber; overflow -> "resync"
+EVENT_HEARTBEAT_SECONDS = _env_int("DEEPWORK_EVENT_HEARTBEAT_SECONDS", 15)
+
+# 🔹 READ CACHE (history / weekly report; cleared by every create and transition)
+# "memory" -> per-process LRU, "redis" -> shared by all workers (needs `redis`), "none" -> off
+CACHE_BACKEND = os.getenv("DEEPWORK_CACHE_BACKEND", "memory").lower()
+
+if CACHE_BACKEND not in ("memory", "redis", "none"):
+    raise ValueError(f"DEEPWORK_CACHE_BACKEND must be 'memory', 'redis' or 'none', got {CACHE_BACKEND!r}")
+
+CACHE_MAXSIZE = _env_int("DEEPWORK_CACHE_MAXSIZE", 256)
+CACHE_TTL_SECONDS = _env_int("DEEPWORK_CACHE_TTL_SECONDS", 30)
+CACHE_REDIS_URL = os.getenv("DEEPWORK_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+# 🔹 METRICS (Prometheus text format at /metrics; per-process, so scrape each worker)
+METRICS_ENABLED = os.getenv("DEEPWORK_METRICS_ENABLED", "1") not in ("0", "false", "no")
+
+# 🔹 PROFILING (off by default; when on, a request opts in with X-Deepwork-Profile: 1|inline or ?profile=1|inline)
+PROFILING_ENABLED = os.getenv("DEEPWORK_PROFILING_ENABLED", "0") not in ("0", "false", "no")
+PROFILE_DIR = os.getenv("DEEPWORK_PROFILE_DIR", "./profiles")
+PROFILE_TOP = _env_int("DEEPWORK_PROFILE_TOP", 40)  # functions listed in the text report
+
+# 🔹 SWEEPER (background job: paused too long -> abandoned, active past 110% -> overdue)
+SWEEP_ENABLED = os.getenv("DEEPWORK_SWEEP_ENABLED", "1") not in ("0", "false", "no")
+SWEEP_INTERVAL_SECONDS = _env_int("DEEPWORK_SWEEP_INTERVAL_SECONDS", 60)
+SWEEP_BATCH_SIZE = _env_int("DEEPWORK_SWEEP_BATCH_SIZE", 200)  # sessions per write transaction
+SWEEP_ABANDON_AFTER_MINUTES = _env_int("DEEPWORK_SWEEP_ABANDON_AFTER_MINUTES", 120)
+
+# 🔹 ARCHIVAL (finished sessions older than this move to the archive tables; 0 = off)
+# Run by the sweeper each interval, or once with `python -m app.tools.archive`.
+ARCHIVE_AFTER_DAYS = _env_int("DEEPWORK_ARCHIVE_AFTER_DAYS", 0)
+ARCHIVE_BATCH_SIZE = _env_int("DEEPWORK_ARCHIVE_BATCH_SIZE", 500)  # sessions per transaction
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+from app.config import EVENT_QUEUE_SIZE
+
+
+# 🔹 IN-PROCESS BROADCAST HUB
+# Service functions publish small per-session deltas; every /sessions/events
+# stream owns a bounded asyncio.Queue. publish() is thread-safe because sync
+# services run on the threadpool while subscribers live on the event loop.
+class EventHub:
+    def __init__(self, queue_size=EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        queue = asyncio.Queue(self.queue_size)
+        subscriber = (asyncio.get_running_loop(), queue)
+
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            loop, queue = subscriber
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # the subscriber's event loop is gone
+                self.unsubscribe(subscriber)
+
+    @staticmethod
+    def _deliver(queue, event):
+        if queue.full():
+            # Slow consumer: drop its backlog and ask it to reload a snapshot
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "resync"})
+        else:
+            queue.put_nowait(event)
+
+
+hub = EventHub()
@@ -1,9 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from app.cache import cache
+from app.config import METRICS_ENABLED, PROFILING_ENABLED, SWEEP_ENABLED
 from app.database import engine, Base
+from app.metrics import MetricsMiddleware, metrics
+from app.profiling import ProfilingMiddleware
 from app.routers import sessions
+from app.sweeper import Sweeper
+
+
+# 🔹 Lifespan: background sweeper for abandoned / overdue sessions (one per worker process)
+@asynccontextmanager
+async def lifespan(app):
+    sweeper = Sweeper() if SWEEP_ENABLED else None
+    if sweeper:
+        sweeper.start()
+    try:
+        yield
+    finally:
+        if sweeper:
+            await sweeper.stop()
 
 
 app = FastAPI(
+    lifespan=lifespan,
     title="🚀 Deep Work Tracker API",
     description="""
 A comprehensive full-stack productivity tracking system for managing deep work sessions.
@@ -18,6 +40,7 @@ A comprehensive full-stack productivity tracking system for managing deep work s
 * `scheduled` ➔ `active` ➔ `paused` ➔ `active` ➔ `completed`
 * `active` ➔ `overdue` (if > 110% duration)
 * `paused` ➔ `interrupted` (if > 3 pauses)
+* `paused` ➔ `abandoned` (left paused too long; background sweeper)
     """,
     version="1.0.0",
     contact={
@@ -37,4 +60,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+
+# 🔹 Profiling (opt-in per request; not installed at all unless enabled)
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# 🔹 Metrics (outermost, so CORS and routing are inside the timed span)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    stats = cache.stats()
+    cache_lines = [
+        "# HELP deepwork_cache_requests_total Read-cache lookups.",
+        "# TYPE deepwork_cache_requests_total counter",
+        f'deepwork_cache_requests_total{{result="hit"}} {stats["hits"]}',
+        f'deepwork_cache_requests_total{{result="miss"}} {stats["misses"]}',
+    ]
+    return PlainTextResponse(metrics.render(cache_lines), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,178 @@
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 🔹 BUCKETS (upper bounds; +Inf is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+# [statement count, seconds spent in SQL] for the request being served
+_request_sql = ContextVar("deepwork_request_sql", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.series = defaultdict(lambda: [[0] * (len(buckets) + 1), 0.0, 0])
+
+    def observe(self, labels, value):
+        counts, _, _ = entry = self.series[labels]
+        counts[bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self, name, help_text, label_names):
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, (counts, total, count) in sorted(self.series.items()):
+            base = _labels(label_names, labels)
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{base}{"," if base else ""}le="{bound}"}} {cumulative}')
+            selector = f"{{{base}}}" if base else ""
+            lines.append(f"{name}_sum{selector} {total}")
+            lines.append(f"{name}_count{selector} {count}")
+        return lines
+
+
+def _labels(names, values):
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+
+
+class Metrics:
+    def __init__(self):
+        self.in_flight = 0
+        self.requests = defaultdict(int)
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.sql_statements = Histogram(STATEMENT_BUCKETS)
+        self.sql_seconds = Histogram(LATENCY_BUCKETS)
+        self.sweep_runs = defaultdict(int)
+        self.sweep_sessions = defaultdict(int)
+        self.sweep_seconds = Histogram(LATENCY_BUCKETS)
+        self.sweep_batch_seconds = Histogram(LATENCY_BUCKETS)
+        self.sweep_last_run = 0.0
+
+    def record(self, method, route, status, seconds, size, sql):
+        self.requests[(method, route, str(status))] += 1
+        key = (method, route)
+        self.latency.observe(key, seconds)
+        self.response_size.observe(key, size)
+        self.sql_statements.observe(key, sql[0])
+        self.sql_seconds.observe(key, sql[1])
+
+    def record_sweep_batch(self, kind, seconds, swept):
+        self.sweep_batch_seconds.observe((kind,), seconds)
+        self.sweep_sessions[kind] += swept
+
+    def record_sweep(self, result, seconds):
+        self.sweep_runs[result] += 1
+        self.sweep_seconds.observe((), seconds)
+        self.sweep_last_run = time.time()
+
+    def render(self, extra_lines=()):
+        lines = [
+            "# HELP deepwork_http_requests_in_flight Requests currently being served.",
+            "# TYPE deepwork_http_requests_in_flight gauge",
+            f"deepwork_http_requests_in_flight {self.in_flight}",
+            "# HELP deepwork_http_requests_total Requests served, by route and status.",
+            "# TYPE deepwork_http_requests_total counter",
+        ]
+        for labels, count in sorted(self.requests.items()):
+            lines.append(f"deepwork_http_requests_total{{{_labels(('method', 'route', 'status'), labels)}}} {count}")
+
+        route_labels = ("method", "route")
+        lines += self.latency.render(
+            "deepwork_http_request_duration_seconds", "Time to the last response byte.", route_labels)
+        lines += self.response_size.render(
+            "deepwork_http_response_size_bytes", "Response body size.", route_labels)
+        lines += self.sql_statements.render(
+            "deepwork_sql_statements_per_request", "SQL statements executed per request.", route_labels)
+        lines += self.sql_seconds.render(
+            "deepwork_sql_seconds_per_request", "Time spent in SQL per request.", route_labels)
+
+        lines += [
+            "# HELP deepwork_sweep_runs_total Background sweeps, by result.",
+            "# TYPE deepwork_sweep_runs_total counter",
+            *(f'deepwork_sweep_runs_total{{result="{result}"}} {count}'
+              for result, count in sorted(self.sweep_runs.items())),
+            "# HELP deepwork_sweep_sessions_total Sessions moved by the sweeper, by new status.",
+            "# TYPE deepwork_sweep_sessions_total counter",
+            *(f'deepwork_sweep_sessions_total{{kind="{kind}"}} {count}'
+              for kind, count in sorted(self.sweep_sessions.items())),
+            "# HELP deepwork_sweep_last_run_timestamp_seconds When the last sweep finished.",
+            "# TYPE deepwork_sweep_last_run_timestamp_seconds gauge",
+            f"deepwork_sweep_last_run_timestamp_seconds {self.sweep_last_run}",
+        ]
+        lines += self.sweep_seconds.render(
+            "deepwork_sweep_duration_seconds", "Wall time of one full sweep.", ())
+        lines += self.sweep_batch_seconds.render(
+            "deepwork_sweep_batch_seconds", "Time per sweep batch, i.e. per write transaction.", ("kind",))
+        lines += extra_lines
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+# 🔹 SQL COUNTING (every engine; only does work inside a tracked request)
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_sql.get() is not None:
+        conn.info.setdefault("deepwork_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    sql = _request_sql.get()
+    starts = conn.info.get("deepwork_query_start")
+    if sql is not None and starts:
+        sql[0] += 1
+        sql[1] += time.perf_counter() - starts.pop()
+
+
+# 🔹 ASGI MIDDLEWARE (pure ASGI, so streaming responses are timed to their last byte)
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+        sql = [0, 0.0]
+        token = _request_sql.set(sql)
+        metrics.in_flight += 1
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.in_flight -= 1
+            _request_sql.reset(token)
+            # Route template, not the raw path, keeps label cardinality bounded
+            route = scope.get("route")
+            metrics.record(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status,
+                time.perf_counter() - started,
+                size,
+                sql,
+            )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, Float, String, Text, ForeignKey, TIMESTAMP, Index, Table, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from .database import Base
@@ -10,17 +10,38 @@ created_at = Column(DateTime, default=datetime.utcnow)
 class Session(Base):
     __tablename__ = "sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
+    id = Column(Integer, primary_key=True)  # rowid alias; a separate index on it is redundant
+    title = Column(String, nullable=False, index=True)
     goal = Column(Text)
     scheduled_duration = Column(Integer, nullable=False)
     start_time = Column(TIMESTAMP)
     end_time = Column(TIMESTAMP)
     status = Column(String, default="scheduled")
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+
+    # Derived metrics, maintained by the transitions in session_services
+    pause_count = Column(Integer, nullable=False, default=0, server_default="0")
+    actual_duration = Column(Float)
+    completion_ratio = Column(Float)
+    focus_score = Column(Float)
+    paused_minutes = Column(Float, nullable=False, default=0, server_default="0")  # closed pauses only
+    focused_minutes = Column(Float)  # actual_duration - paused_minutes, set on completion
+    overdue_at = Column(TIMESTAMP)  # when the sweeper found it still running past 110% of its schedule
+
+    # Bumped by every state transition; clients send it back in If-Match
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Data version of the transaction that last wrote the row; drives /sessions/changes
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0", index=True)
 
     interruptions = relationship("Interruption", back_populates="session", cascade="all, delete")
 
+    __table_args__ = (
+        Index("ix_sessions_status_created_at", "status", "created_at"),
+        # ids are never reused, so archived sessions keep theirs
+        {"sqlite_autoincrement": True},
+    )
+
 
 class Interruption(Base):
     __tablename__ = "interruptions"
@@ -29,5 +50,88 @@ class Interruption(Base):
     session_id = Column(Integer, ForeignKey("sessions.id"))
     reason = Column(Text, nullable=False)
     pause_time = Column(TIMESTAMP, server_default=func.now())
+    resume_time = Column(TIMESTAMP)  # null while paused, and for pauses a session never came back from
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+
+    session = relationship("Session", back_populates="interruptions")
+
+    __table_args__ = (
+        # per-session lookups (relationship loads, cascades), in pause order
+        Index("ix_interruptions_session_id_pause_time", "session_id", "pause_time"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+# Single-row counter bumped by every write in session_services; cheap source of ETags
+class DataVersion(Base):
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# 🔹 ARCHIVE (finished sessions moved out of the hot tables; same columns, no secondary indexes)
+def _archive_columns(table):
+    return [Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in table.columns]
+
+
+class ArchivedSession(Base):
+    __table__ = Table(
+        "sessions_archive",
+        Base.metadata,
+        *_archive_columns(Session.__table__),
+        Index("ix_sessions_archive_created_at", "created_at"),  # weekly report ranges
+    )
+
+
+class ArchivedInterruption(Base):
+    __table__ = Table(
+        "interruptions_archive",
+        Base.metadata,
+        *_archive_columns(Interruption.__table__),
+        Index("ix_interruptions_archive_session_id", "session_id"),
+    )
+
+
+# 🔹 FULL-TEXT SEARCH (FTS5 external-content indexes, kept in sync by triggers)
+# The same DDL is applied by the alembic migration; these listeners cover create_all.
+# Title/goal/reason updates re-index; status transitions never touch the index.
+FTS_TABLES = ("sessions_fts", "interruptions_fts")
+
+SESSIONS_FTS_DDL = (
+    """CREATE VIRTUAL TABLE sessions_fts USING fts5(
+        title, goal, content='sessions', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER sessions_fts_ai AFTER INSERT ON sessions BEGIN
+        INSERT INTO sessions_fts(rowid, title, goal) VALUES (new.id, new.title, new.goal);
+    END""",
+    """CREATE TRIGGER sessions_fts_ad AFTER DELETE ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, title, goal) VALUES ('delete', old.id, old.title, old.goal);
+    END""",
+    """CREATE TRIGGER sessions_fts_au AFTER UPDATE OF title, goal ON sessions BEGIN
+        INSERT INTO sessions_fts(sessions_fts, rowid, title, goal) VALUES ('delete', old.id, old.title, old.goal);
+        INSERT INTO sessions_fts(rowid, title, goal) VALUES (new.id, new.title, new.goal);
+    END""",
+)
+
+INTERRUPTIONS_FTS_DDL = (
+    """CREATE VIRTUAL TABLE interruptions_fts USING fts5(
+        reason, session_id UNINDEXED, content='interruptions', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER interruptions_fts_ai AFTER INSERT ON interruptions BEGIN
+        INSERT INTO interruptions_fts(rowid, reason, session_id) VALUES (new.id, new.reason, new.session_id);
+    END""",
+    """CREATE TRIGGER interruptions_fts_ad AFTER DELETE ON interruptions BEGIN
+        INSERT INTO interruptions_fts(interruptions_fts, rowid, reason, session_id)
+        VALUES ('delete', old.id, old.reason, old.session_id);
+    END""",
+    """CREATE TRIGGER interruptions_fts_au AFTER UPDATE OF reason, session_id ON interruptions BEGIN
+        INSERT INTO interruptions_fts(interruptions_fts, rowid, reason, session_id)
+        VALUES ('delete', old.id, old.reason, old.session_id);
+        INSERT INTO interruptions_fts(rowid, reason, session_id) VALUES (new.id, new.reason, new.session_id);
+    END""",
+)
 
-    session = relationship("Session", back_populates="interruptions")
\ No newline at end of file
+for _table, _statements in ((Session.__table__, SESSIONS_FTS_DDL), (Interruption.__table__, INTERRUPTIONS_FTS_DDL)):
+    for _statement in _statements:
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
\ No newline at end of file
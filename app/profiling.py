@@ -0,0 +1,244 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from urllib.parse import parse_qs
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import PROFILE_DIR, PROFILE_TOP
+
+PROFILE_HEADER = b"x-deepwork-profile"
+PROFILE_QUERY = "profile"
+SQL_PARAMS_LIMIT = 200  # characters of bound parameters kept per traced statement
+
+# The profile of the request being served, if that request asked for one
+_active = ContextVar("deepwork_profile", default=None)
+
+# cProfile can only follow one request on the event-loop thread at a time
+_loop_profiler_busy = threading.Lock()
+
+
+class RequestProfile:
+    def __init__(self):
+        self.profilers = []
+        self.sql = []
+        self.lock = threading.Lock()
+
+    def add_profiler(self, profiler):
+        with self.lock:
+            self.profilers.append(profiler)
+
+    def stats(self):
+        stream = io.StringIO()
+        stats = pstats.Stats(*self.profilers, stream=stream)
+        return stats, stream
+
+    def report(self, top=PROFILE_TOP):
+        stats, stream = self.stats()
+        stats.sort_stats("cumulative").print_stats(top)
+
+        sql_ms = sum(entry["duration_ms"] for entry in self.sql)
+        stream.write(f"\n{len(self.sql)} SQL statements, {sql_ms:.2f} ms\n")
+        for entry in self.sql:
+            stream.write(f"\n[{entry['duration_ms']:.3f} ms, {entry['thread']}]\n{entry['statement']}\n")
+        return stream.getvalue()
+
+
+# 🔹 WORKER-THREAD PROFILING (cProfile only sees the thread that enabled it)
+def _enable(profiler):
+    try:
+        profiler.enable()
+        return True
+    except ValueError:
+        # 3.12+: the request's loop profiler already observes every thread
+        return False
+
+
+def in_thread(fn):
+    """Wrap a blocking call so its worker thread is profiled too; a no-op when not profiling."""
+    profile = _active.get()
+    if profile is None:
+        return fn
+
+    def profiled(*args, **kwargs):
+        profiler = cProfile.Profile()
+        if not _enable(profiler):
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            profile.add_profiler(profiler)
+
+    return profiled
+
+
+def iterate_in_thread(iterator):
+    """Same as in_thread for a sync generator that Starlette drains on the threadpool."""
+    profile = _active.get()
+    # async generators run on the event loop, which the request's loop profiler already covers
+    if profile is None or hasattr(iterator, "__aiter__"):
+        return iterator
+
+    def profiled():
+        profiler = cProfile.Profile()
+        items = iter(iterator)
+        enabled_once = False
+        while True:
+            enabled = _enable(profiler)
+            enabled_once = enabled_once or enabled
+            try:
+                item = next(items)
+            except StopIteration:
+                break
+            finally:
+                if enabled:
+                    profiler.disable()
+            yield item
+        if enabled_once:
+            profile.add_profiler(profiler)
+
+    return profiled()
+
+
+# 🔹 SQL TRACE (only does work inside a profiled request)
+# Registered by ProfilingMiddleware, so with profiling disabled no statement pays for it
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active.get() is not None:
+        conn.info.setdefault("deepwork_profile_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _active.get()
+    starts = conn.info.get("deepwork_profile_start")
+    if profile is None or not starts:
+        return
+
+    duration = time.perf_counter() - starts.pop()
+    entry = {
+        "statement": statement,
+        "parameters": repr(parameters)[:SQL_PARAMS_LIMIT],
+        "duration_ms": round(duration * 1000, 3),
+        "thread": threading.current_thread().name,
+    }
+    with profile.lock:
+        profile.sql.append(entry)
+
+
+def install_sql_trace():
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# 🔹 ASGI MIDDLEWARE
+def _requested_mode(scope):
+    for name, value in scope.get("headers", ()):
+        if name == PROFILE_HEADER:
+            return value.decode().lower()
+
+    query = parse_qs(scope.get("query_string", b"").decode())
+    return query.get(PROFILE_QUERY, [None])[0]
+
+
+class ProfilingMiddleware:
+    """Profiles one request when it sends `X-Deepwork-Profile: 1` (or `?profile=1`).
+
+    Mode "1" writes <name>.prof, <name>.txt and <name>.sql.json under PROFILE_DIR and
+    names them in the X-Profile response header; mode "inline" replaces the
+    response body with the text report.
+    """
+
+    def __init__(self, app, directory=PROFILE_DIR):
+        self.app = app
+        self.directory = directory
+        install_sql_trace()
+
+    async def __call__(self, scope, receive, send):
+        mode = _requested_mode(scope) if scope["type"] == "http" else None
+        if mode not in ("1", "true", "inline"):
+            await self.app(scope, receive, send)
+            return
+
+        if not _loop_profiler_busy.acquire(blocking=False):
+            await self.app(scope, receive, self._with_header(send, b"x-profile-skipped", b"busy"))
+            return
+
+        profile = RequestProfile()
+        token = _active.set(profile)
+        loop_profiler = cProfile.Profile()
+        name = self._name(scope)
+
+        try:
+            if mode == "inline":
+                response = []
+                loop_profiler.enable()
+                try:
+                    await self.app(scope, receive, self._collect(response))
+                finally:
+                    loop_profiler.disable()
+                profile.add_profiler(loop_profiler)
+                await self._send_report(send, profile.report(), response[0]["status"])
+            else:
+                loop_profiler.enable()
+                try:
+                    await self.app(scope, receive, self._with_header(send, b"x-profile", name.encode()))
+                finally:
+                    loop_profiler.disable()
+                profile.add_profiler(loop_profiler)
+                self._write(name, profile)
+        finally:
+            _active.reset(token)
+            _loop_profiler_busy.release()
+
+    @staticmethod
+    def _name(scope):
+        slug = scope["path"].strip("/").replace("/", "_") or "root"
+        return f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{scope['method']}-{slug}"
+
+    @staticmethod
+    def _with_header(send, name, value):
+        async def wrapped(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (name, value)]}
+            await send(message)
+        return wrapped
+
+    @staticmethod
+    def _collect(messages):
+        async def collect(message):
+            if message["type"] == "http.response.start":
+                messages.append(message)
+        return collect
+
+    @staticmethod
+    async def _send_report(send, report, status):
+        body = report.encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profile-status", str(status).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _write(self, name, profile):
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, name)
+
+        stats, _ = profile.stats()
+        stats.dump_stats(f"{base}.prof")
+        with open(f"{base}.txt", "w") as fh:
+            fh.write(profile.report())
+        with open(f"{base}.sql.json", "w") as fh:
+            json.dump(profile.sql, fh, indent=2)
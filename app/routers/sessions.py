@@ -1,30 +1,39 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from fastapi.responses import FileResponse
+import asyncio
+import hashlib
+import inspect
+import json
+from datetime import date, datetime
+from typing import Optional
 
-from app.database import SessionLocal
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.cache import cache
+from app.config import DB_MODE, EVENT_HEARTBEAT_SECONDS
+from app.database import SessionLocal, AsyncSessionLocal
+from app.events import hub
+from app.profiling import in_thread, iterate_in_thread
 from app.schemas import (
     SessionCreate,
     SessionResponse,
     PauseRequest,
     SessionHistory,
+    SearchResult,
+    BatchRequest,
+    BatchResult,
 )
-from app.services.session_services import (
-    create_session,
-    start_session,
-    pause_session,
-    resume_session,
-    complete_session,
-    get_session_history,
-    get_weekly_report,
-    export_sessions_csv,
-)
+from app.services import analytics_services, session_services, async_session_services
 
 router = APIRouter(prefix="/sessions", tags=["Sessions"])
 
+# 🔹 Service layer for the configured DB mode
+services = async_session_services if DB_MODE == "async" else session_services
+analytics = async_session_services if DB_MODE == "async" else analytics_services
+
 
-# 🔹 DB Dependency
-def get_db():
+# 🔹 DB Dependencies
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
@@ -32,54 +41,251 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_db = get_async_db if DB_MODE == "async" else get_sync_db
+
+
+# 🔹 Await async services directly, keep blocking ones off the event loop
+async def run_service(fn, *args, **kwargs):
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+    return await run_in_threadpool(in_thread(fn), *args, **kwargs)
+
+
+# 🔹 If-Match: optional session version for optimistic concurrency
+def if_match_version(if_match: Optional[str] = Header(None)):
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a session version")
+
+
+# 🔹 Conditional GET: ETag from the data-version counter plus the request's own inputs
+def make_etag(version, request, *extra):
+    material = "|".join([request.url.path, request.url.query, *map(str, extra)])
+    digest = hashlib.blake2s(material.encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(request, etag):
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag):
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
 # 🔹 Create Session
 @router.post("/", response_model=SessionResponse)
-def create(session: SessionCreate, db: Session = Depends(get_db)):
-    return create_session(db, session)
+async def create(session: SessionCreate, db=Depends(get_db)):
+    return await run_service(services.create_session, db, session)
+
+
+# 🔹 Batch: bulk creates and transitions in one transaction
+@router.post("/batch", response_model=list[BatchResult])
+async def batch(request: BatchRequest, db=Depends(get_db)):
+    return await run_service(services.apply_batch, db, request.items)
 
 
 # 🔹 Start Session
 @router.patch("/{session_id}/start", response_model=SessionResponse)
-def start(session_id: int, db: Session = Depends(get_db)):
-    return start_session(db, session_id)
+async def start(session_id: int, version=Depends(if_match_version), db=Depends(get_db)):
+    return await run_service(services.start_session, db, session_id, version)
 
 
 # 🔹 Pause Session
 @router.patch("/{session_id}/pause", response_model=SessionResponse)
-def pause(session_id: int, request: PauseRequest, db: Session = Depends(get_db)):
-    return pause_session(db, session_id, request.reason)
+async def pause(
+    session_id: int,
+    request: PauseRequest,
+    version=Depends(if_match_version),
+    db=Depends(get_db),
+):
+    return await run_service(services.pause_session, db, session_id, request.reason, version)
 
 
 # 🔹 Resume Session
 @router.patch("/{session_id}/resume", response_model=SessionResponse)
-def resume(session_id: int, db: Session = Depends(get_db)):
-    return resume_session(db, session_id)
+async def resume(session_id: int, version=Depends(if_match_version), db=Depends(get_db)):
+    return await run_service(services.resume_session, db, session_id, version)
 
 
 # 🔹 Complete Session
 @router.patch("/{session_id}/complete", response_model=SessionResponse)
-def complete(session_id: int, db: Session = Depends(get_db)):
-    return complete_session(db, session_id)
+async def complete(session_id: int, version=Depends(if_match_version), db=Depends(get_db)):
+    return await run_service(services.complete_session, db, session_id, version)
 
 
-# 🔹 Session History
+# 🔹 Session History (newest first, keyset paginated, 304 when unchanged)
 @router.get("/history", response_model=list[SessionHistory])
-def history(db: Session = Depends(get_db)):
-    return get_session_history(db)
+async def history(
+    request: Request,
+    response: Response,
+    # omitted: every matching session, as before paging existed
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; pages continue via X-Next-Cursor"),
+    cursor: Optional[int] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    status: Optional[list[str]] = Query(None),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    title_prefix: Optional[str] = None,
+    include_archived: bool = Query(False, description="Also return sessions moved to the archive"),
+    db=Depends(get_db),
+):
+    version = await run_service(services.get_data_version, db)
+    etag = make_etag(version, request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    items, next_cursor = await run_service(
+        services.get_session_history_page,
+        db,
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        created_from=created_from,
+        created_to=created_to,
+        title_prefix=title_prefix,
+        include_archived=include_archived,
+    )
 
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
 
-# 🔹 Weekly Report
+    return items
+
+
+# 🔹 Search (FTS5 over titles, goals and interruption reasons; best match first)
+@router.get("/search", response_model=list[SearchResult])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to match; end one with * for a prefix"),
+    limit: int = Query(session_services.SEARCH_LIMIT, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=0, description="Value of X-Next-Cursor from the previous page"),
+    db=Depends(get_db),
+):
+    items, next_cursor = await run_service(services.search_sessions, db, q, limit=limit, cursor=cursor)
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+
+    return items
+
+
+# 🔹 Changes (rows written after ?since=<token>; send the returned token next time)
+@router.get("/changes")
+async def changes(
+    since: str = Query("0", description="Token from the previous call; 0 for everything"),
+    limit: int = Query(session_services.CHANGES_LIMIT, ge=1, le=10000),
+    db=Depends(get_db),
+):
+    return await run_service(services.get_changes, db, since=since, limit=limit)
+
+
+# 🔹 Weekly Report (current week, or ?from=&to= for a multi-week trend)
 @router.get("/weekly-report")
-def weekly_report(db: Session = Depends(get_db)):
-    return get_weekly_report(db)
+async def weekly_report(
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    db=Depends(get_db),
+):
+    version = await run_service(services.get_data_version, db)
+    # the default range is "this week", so the tag has to roll over with the date
+    etag = make_etag(version, request, datetime.utcnow().date())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    report = await run_service(services.get_weekly_report, db, date_from=date_from, date_to=date_to)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+    return report
 
 
-# 🔹 Export CSV
+# 🔹 Analytics (percentiles, per-status / per-hour breakdowns, rolling focus; NumPy-vectorized)
+@router.get("/analytics")
+async def session_analytics(
+    days: int = Query(30, ge=1, le=3650, description="Days of rolling focus averages to return"),
+    window: int = Query(7, ge=1, le=365, description="Rolling window in days"),
+    include_archived: bool = Query(False, description="Also count sessions moved to the archive"),
+    db=Depends(get_db),
+):
+    return await run_service(
+        analytics.get_analytics, db, days=days, window=window, include_archived=include_archived
+    )
+
+
+# 🔹 Read-cache hit/miss counters (for monitoring)
+@router.get("/cache-stats")
+async def cache_stats():
+    return cache.stats()
+
+
+# 🔹 Export (CSV, or typed Parquet / Arrow IPC stream; all streamed from the DB cursor)
 @router.get("/export")
-def export(db: Session = Depends(get_db)):
-    file_path = export_sessions_csv(db)
-    return FileResponse(
-        file_path,
-        media_type="text/csv",
-        filename="sessions.csv"
-    )
\ No newline at end of file
+async def export(
+    format: str = Query("csv", pattern="^(csv|parquet|arrow)$"),
+    table: str = Query("sessions", pattern="^(sessions|interruptions)$"),
+    include_archived: bool = Query(False, description="Also export rows moved to the archive"),
+    db=Depends(get_db),
+):
+    if format == "csv":
+        if table != "sessions":
+            raise HTTPException(status_code=400, detail="CSV export only covers sessions")
+        return StreamingResponse(
+            iterate_in_thread(services.export_sessions_csv(db, include_archived=include_archived)),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="sessions.csv"'}
+        )
+
+    media_type, extension = session_services.COLUMNAR_FORMATS[format]
+    return StreamingResponse(
+        iterate_in_thread(services.export_sessions_columnar(db, format, table, include_archived=include_archived)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{table}.{extension}"'}
+    )
+
+
+# 🔹 Live Events (Server-Sent Events: one small delta per session change)
+@router.get("/events")
+async def events(request: Request):
+    subscriber = hub.subscribe()
+    _, queue = subscriber
+
+    async def stream():
+        try:
+            yield "retry: 3000\n\n"
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
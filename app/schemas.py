@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 
 # 🔹 Create Session Request
@@ -25,6 +25,7 @@ class SessionResponse(BaseModel):
     end_time: Optional[datetime] = None
     status: str
     created_at: datetime
+    version: Optional[int] = None  # send back as If-Match to detect concurrent changes
 
     class Config:
         from_attributes = True  # ✅ Pydantic v2
@@ -36,6 +37,7 @@ class InterruptionResponse(BaseModel):
     session_id: int
     reason: str
     pause_time: datetime
+    resume_time: Optional[datetime] = None
 
     class Config:
         from_attributes = True  # ✅ Pydantic v2
@@ -52,8 +54,53 @@ class SessionHistory(BaseModel):
     status: str
     completion_ratio: Optional[float] = None
     focus_score: Optional[float] = None
+    paused_minutes: Optional[float] = None
+    focused_minutes: Optional[float] = None
+    overdue_at: Optional[datetime] = None
     start_time: Optional[datetime] = None   # ✅ ADD THIS
     end_time: Optional[datetime] = None     # ✅ Optional but good
 
     class Config:
         from_attributes = True
+
+
+# 🔹 Search Result (a history row plus its relevance; higher is better)
+class SearchResult(SessionHistory):
+    score: float
+
+
+# 🔹 Batch Item (create, or a transition by id)
+class BatchItem(BaseModel):
+    op: Literal["create", "start", "pause", "resume", "complete"]
+    id: Optional[int] = None
+    version: Optional[int] = None
+    title: Optional[str] = None
+    goal: Optional[str] = None
+    scheduled_duration: Optional[int] = None
+    reason: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.op == "create":
+            if self.title is None or self.scheduled_duration is None:
+                raise ValueError("create needs title and scheduled_duration")
+        elif self.id is None:
+            raise ValueError(f"{self.op} needs id")
+        if self.op == "pause" and not self.reason:
+            raise ValueError("pause needs reason")
+        return self
+
+
+# 🔹 Batch Request
+class BatchRequest(BaseModel):
+    items: list[BatchItem] = Field(min_length=1, max_length=1000)
+
+
+# 🔹 Batch Item Result
+class BatchResult(BaseModel):
+    index: int
+    op: str
+    ok: bool
+    status_code: int
+    session: Optional[SessionResponse] = None
+    detail: Optional[str] = None
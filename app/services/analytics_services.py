@@ -0,0 +1,190 @@
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import Integer, cast, func, select, union_all
+
+from app.cache import cache
+from app.models import ArchivedSession, Session
+
+# 🔹 ANALYTICS
+# One query pulls the needed columns for every session; all statistics are then
+# computed column-wise with NumPy instead of looping over rows in Python.
+# Hours and days are IST, like every other time the API shows. Archived sessions
+# are included only on request, like history and export.
+PERCENTILES = (50, 90, 95, 99)
+FOCUS_BINS = np.arange(0, 110, 10)  # 0-10, 10-20, ... 90-100 (last bin includes 100)
+IST_OFFSET_SECONDS = 5 * 3600 + 30 * 60
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+EPOCH = date(1970, 1, 1)
+
+
+def _analytics_query(model=Session):
+    return select(
+        model.status,
+        model.pause_count,
+        model.focus_score,
+        model.completion_ratio,
+        model.actual_duration,
+        # epoch seconds, so no datetime objects are built per row
+        cast(func.strftime("%s", model.start_time), Integer),
+        cast(func.strftime("%s", model.created_at), Integer),
+    )
+
+
+def _load_columns(db, include_archived=False):
+    query = _analytics_query()
+    if include_archived:
+        query = union_all(query, _analytics_query(ArchivedSession))
+
+    # Core execution on the session's connection skips ORM result processing
+    rows = db.connection().execute(query).all()
+    if not rows:
+        return None
+
+    status, pauses, focus, completion, actual, started, created = zip(*rows)
+    as_float = lambda values: np.array(values, dtype=float)  # None -> nan
+
+    started = as_float(started) + IST_OFFSET_SECONDS
+    created = as_float(created) + IST_OFFSET_SECONDS
+
+    return {
+        "status": np.array(status, dtype=object),
+        "pause_count": as_float(pauses),
+        "focus_score": as_float(focus),
+        "completion_ratio": as_float(completion),
+        "actual_duration": as_float(actual),
+        "hour": np.floor(started / SECONDS_PER_HOUR) % 24,
+        "day": np.floor(created / SECONDS_PER_DAY),
+    }
+
+
+def _number(value):
+    return None if value is None or np.isnan(value) else round(float(value), 2)
+
+
+def _summary(values):
+    present = values[~np.isnan(values)]
+    if not present.size:
+        return {"count": 0, "mean": None, "min": None, "max": None, **{f"p{p}": None for p in PERCENTILES}}
+
+    quantiles = np.percentile(present, PERCENTILES)
+    return {
+        "count": int(present.size),
+        "mean": _number(present.mean()),
+        "min": _number(present.min()),
+        "max": _number(present.max()),
+        **{f"p{p}": _number(q) for p, q in zip(PERCENTILES, quantiles)},
+    }
+
+
+def _group_means(groups, group_count, values):
+    """Per-group mean of values, ignoring nans; nan for groups with no values."""
+    present = ~np.isnan(values)
+    sums = np.bincount(groups[present], weights=values[present], minlength=group_count)
+    counts = np.bincount(groups[present], minlength=group_count)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def _by_status(columns):
+    names, groups = np.unique(columns["status"].astype(str), return_inverse=True)
+    counts = np.bincount(groups, minlength=len(names))
+    focus = _group_means(groups, len(names), columns["focus_score"])
+    completion = _group_means(groups, len(names), columns["completion_ratio"])
+    pauses = _group_means(groups, len(names), columns["pause_count"])
+
+    return {
+        name: {
+            "count": int(counts[i]),
+            "avg_focus_score": _number(focus[i]),
+            "avg_completion_ratio": _number(completion[i]),
+            "avg_pause_count": _number(pauses[i]),
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def _by_hour(columns):
+    started = ~np.isnan(columns["hour"])
+    hours = columns["hour"][started].astype(int)
+    counts = np.bincount(hours, minlength=24)
+    focus = _group_means(hours, 24, columns["focus_score"][started])
+    completed = np.bincount(hours, weights=columns["status"][started] == "completed", minlength=24)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        completion_rate = completed / counts
+
+    return [
+        {
+            "hour": hour,
+            "sessions": int(counts[hour]),
+            "avg_focus_score": _number(focus[hour]),
+            "completion_rate": _number(completion_rate[hour]),
+        }
+        for hour in range(24)
+    ]
+
+
+def _focus_distribution(columns):
+    present = columns["focus_score"][~np.isnan(columns["focus_score"])]
+    counts, edges = np.histogram(np.clip(present, FOCUS_BINS[0], FOCUS_BINS[-1]), bins=FOCUS_BINS)
+    return [
+        {"from": int(low), "to": int(high), "sessions": int(count)}
+        for low, high, count in zip(edges[:-1], edges[1:], counts)
+    ]
+
+
+def _rolling_focus(columns, days, window):
+    day = columns["day"]
+    last_day = int(np.nanmax(day))
+    first_day = last_day - days - window + 2  # extra leading days so the first point has a full window
+
+    in_range = day >= first_day
+    offsets = (day[in_range] - first_day).astype(int)
+    span = last_day - first_day + 1
+
+    daily_counts = np.bincount(offsets, minlength=span)
+    focus = columns["focus_score"][in_range]
+    present = ~np.isnan(focus)
+    daily_sums = np.bincount(offsets[present], weights=focus[present], minlength=span)
+    scored = np.bincount(offsets[present], minlength=span)
+
+    kernel = np.ones(window)
+    rolling_sums = np.convolve(daily_sums, kernel)[:span]
+    rolling_counts = np.convolve(scored, kernel)[:span]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        daily_avg = daily_sums / scored
+        rolling_avg = rolling_sums / rolling_counts
+
+    return [
+        {
+            "date": (EPOCH + timedelta(days=first_day + i)).isoformat(),
+            "sessions": int(daily_counts[i]),
+            "avg_focus_score": _number(daily_avg[i]),
+            "rolling_avg_focus_score": _number(rolling_avg[i]),
+        }
+        for i in range(window - 1, span)
+    ]
+
+
+@cache.cached
+def get_analytics(db, days=30, window=7, include_archived=False):
+    columns = _load_columns(db, include_archived)
+    if columns is None:
+        empty = _summary(np.array([]))
+        return {
+            "sessions": 0, "focus_score": empty, "completion_ratio": empty, "actual_duration": empty,
+            "by_status": {}, "by_hour": [], "focus_distribution": [], "rolling_focus": [],
+        }
+
+    return {
+        "sessions": int(columns["status"].size),
+        "focus_score": _summary(columns["focus_score"]),
+        "completion_ratio": _summary(columns["completion_ratio"]),
+        "actual_duration": _summary(columns["actual_duration"]),
+        "by_status": _by_status(columns),
+        "by_hour": _by_hour(columns),
+        "focus_distribution": _focus_distribution(columns),
+        "rolling_focus": _rolling_focus(columns, days, window),
+    }
@@ -0,0 +1,114 @@
+from app.services import analytics_services, session_services
+from app.services.session_services import (
+    CSV_HEADER,
+    EXPORT_BATCH_SIZE,
+    _csv_row,
+    _csv_text,
+    _export_query,
+    _ColumnarWriter,
+    _columnar_query,
+)
+
+# 🔹 ASYNC SERVICE LAYER
+# Same business rules as session_services, driven through AsyncSession.run_sync:
+# the sync implementation runs inside SQLAlchemy's greenlet bridge while every
+# statement is awaited on aiosqlite, so no threadpool slot is held during I/O.
+
+
+# 🔹 DATA VERSION
+async def get_data_version(db):
+    return await db.run_sync(session_services.get_data_version)
+
+
+# 🔹 CREATE SESSION
+async def create_session(db, session_data):
+    return await db.run_sync(session_services.create_session, session_data)
+
+
+# 🔹 START SESSION
+async def start_session(db, session_id: int, expected_version=None):
+    return await db.run_sync(session_services.start_session, session_id, expected_version)
+
+
+# 🔹 PAUSE SESSION
+async def pause_session(db, session_id: int, reason: str, expected_version=None):
+    return await db.run_sync(session_services.pause_session, session_id, reason, expected_version)
+
+
+# 🔹 RESUME SESSION
+async def resume_session(db, session_id: int, expected_version=None):
+    return await db.run_sync(session_services.resume_session, session_id, expected_version)
+
+
+# 🔹 COMPLETE SESSION
+async def complete_session(db, session_id: int, expected_version=None):
+    return await db.run_sync(session_services.complete_session, session_id, expected_version)
+
+
+# 🔹 BATCH
+async def apply_batch(db, items):
+    return await db.run_sync(session_services.apply_batch, items)
+
+
+# 🔹 SESSION HISTORY PAGE
+async def get_session_history_page(db, limit=None, cursor=None, include_archived=False, **filters):
+    return await db.run_sync(
+        session_services.get_session_history_page,
+        limit=limit, cursor=cursor, include_archived=include_archived, **filters
+    )
+
+
+# 🔹 SESSION HISTORY
+async def get_session_history(db, limit=None, cursor=None, include_archived=False, **filters):
+    return await db.run_sync(
+        session_services.get_session_history,
+        limit=limit, cursor=cursor, include_archived=include_archived, **filters
+    )
+
+
+# 🔹 CHANGES
+async def get_changes(db, since="0", limit=session_services.CHANGES_LIMIT):
+    return await db.run_sync(session_services.get_changes, since=since, limit=limit)
+
+
+# 🔹 SEARCH
+async def search_sessions(db, q, limit=session_services.SEARCH_LIMIT, cursor=None):
+    return await db.run_sync(session_services.search_sessions, q, limit=limit, cursor=cursor)
+
+
+# 🔹 ANALYTICS
+async def get_analytics(db, days=30, window=7, include_archived=False):
+    return await db.run_sync(
+        analytics_services.get_analytics, days=days, window=window, include_archived=include_archived
+    )
+
+
+# 🔹 WEEKLY REPORT
+async def get_weekly_report(db, date_from=None, date_to=None):
+    return await db.run_sync(
+        session_services.get_weekly_report, date_from=date_from, date_to=date_to
+    )
+
+
+# 🔹 EXPORT CSV (async generator over AsyncSession.stream)
+async def export_sessions_csv(db, batch_size=EXPORT_BATCH_SIZE, include_archived=False):
+    yield _csv_text([CSV_HEADER])
+
+    result = await db.stream(_export_query(batch_size, include_archived))
+
+    async for rows in result.partitions():
+        yield _csv_text(_csv_row(row) for row in rows)
+
+
+# 🔹 EXPORT PARQUET / ARROW
+async def _columnar_chunks(db, writer, table, batch_size, include_archived):
+    result = await db.stream(_columnar_query(table, batch_size, include_archived))
+
+    async for rows in result.partitions():
+        yield writer.write(rows)
+
+    yield writer.close()
+
+
+def export_sessions_columnar(db, fmt, table="sessions", batch_size=EXPORT_BATCH_SIZE, include_archived=False):
+    return _columnar_chunks(db, _ColumnarWriter(fmt, table), table, batch_size, include_archived)
@@ -1,8 +1,13 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
 from fastapi import HTTPException
-from app.models import Session, Interruption
-from fastapi.responses import FileResponse
+from sqlalchemy import select, insert, update, delete, func, case, null, text, tuple_, union_all
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models import Session, Interruption, DataVersion, ArchivedSession, ArchivedInterruption
+from app.events import hub
+from app.cache import cache
 import csv
+import io
 
 # 🔹 CONVERT UTC TO IST
 def to_ist(utc_dt):
@@ -10,242 +15,993 @@ def to_ist(utc_dt):
         return None
     return utc_dt + timedelta(hours=5, minutes=30)
 
+# 🔹 DERIVED METRICS (persisted on the session row by the transitions below)
+def _focus_score(scheduled_duration, pause_count):
+    if scheduled_duration > 0:
+        return round((1 - (pause_count / scheduled_duration)) * 100, 2)
+    return None
+
+
+# 🔹 DATA VERSION (monotonic counter, one row, bumped inside every write transaction)
+def _bump_data_version(db):
+    return db.execute(
+        sqlite_insert(DataVersion)
+        .values(id=1, version=1)
+        .on_conflict_do_update(index_elements=[DataVersion.id], set_={"version": DataVersion.version + 1})
+        .returning(DataVersion.version)
+    ).scalar_one()
+
+
+# 🔹 CHANGE SEQUENCE
+# The first write in a transaction bumps the counter and every row it touches is
+# stamped with the new value, so change_seq orders rows by the commit that last
+# wrote them (SQLite runs one writer at a time).
+def _change_seq(db):
+    transaction = db.get_transaction()
+    if transaction is None or db.info.get("change_seq_transaction") is not transaction:
+        db.info["change_seq"] = _bump_data_version(db)
+        db.info["change_seq_transaction"] = db.get_transaction()
+    return db.info["change_seq"]
+
+
+def _commit(db):
+    _change_seq(db)
+    db.commit()
+    cache.invalidate()
+
+
+def get_data_version(db):
+    return db.execute(select(DataVersion.version).where(DataVersion.id == 1)).scalar() or 0
+
+
+# 🔹 LIVE EVENTS (published after commit, consumed by /sessions/events)
+def _publish(action, session):
+    hub.publish({
+        "type": "session",
+        "action": action,
+        "version": session.version,
+        "session": _history_item(session)
+    })
+
+
 # 🔹 CREATE SESSION
 def create_session(db, session_data):
     new_session = Session(
         title=session_data.title,
         goal=session_data.goal,
         scheduled_duration=session_data.scheduled_duration,
-        status="scheduled"
+        status="scheduled",
+        pause_count=0,
+        focus_score=_focus_score(session_data.scheduled_duration, 0),
+        change_seq=_change_seq(db)
     )
 
     db.add(new_session)
-    db.commit()
+    _commit(db)
     db.refresh(new_session)
 
+    _publish("create", new_session)
+
     return new_session
 
 
-# 🔹 START SESSION
-def start_session(db, session_id: int):
-    session = db.query(Session).filter(Session.id == session_id).first()
+# 🔹 SQL-SIDE METRICS (same formulas, evaluated inside the transition UPDATE)
+OVERDUE_FACTOR = 1.1  # running past 110% of the scheduled duration
+
+
+def _minutes_since(start_column, now):
+    return func.round((func.julianday(now) - func.julianday(start_column)) * 1440, 2)
+
 
-    if not session:
+# When the session's current pause began (its interruption with no resume yet)
+def _open_pause_time():
+    return (
+        select(func.max(Interruption.pause_time))
+        .where(Interruption.session_id == Session.id, Interruption.resume_time.is_(None))
+        .scalar_subquery()
+    )
+
+
+# Interruptions with no resume time besides the pause the session is in right now:
+# pauses from before resumes were recorded, whose length is unknown
+def _unmeasured_pauses():
+    unresumed = (
+        select(func.count())
+        .where(Interruption.session_id == Session.id, Interruption.resume_time.is_(None))
+        .scalar_subquery()
+    )
+    return unresumed - case((Session.status == "paused", 1), else_=0)
+
+
+def _closing_pause_minutes(now):
+    # minutes of the open pause, if the session is paused right now
+    return case(
+        (Session.status == "paused", func.coalesce(_minutes_since(_open_pause_time(), now), 0)),
+        else_=0
+    )
+
+
+def _focus_score_sql(pause_count):
+    return case(
+        (Session.scheduled_duration > 0,
+         func.round((1 - pause_count * 1.0 / Session.scheduled_duration) * 100, 2)),
+        else_=None
+    )
+
+
+# 🔹 ATOMIC TRANSITION
+# A single UPDATE ... WHERE id = ? AND status IN (...) RETURNING: the row only
+# changes if it is still in an allowed state (and at the expected version, when
+# the caller sent one), so two workers can never both apply a transition.
+def _transition(db, session_id, allowed, values, expected_version=None, conditions=()):
+    statement = (
+        update(Session)
+        .where(Session.id == session_id, Session.status.in_(allowed), *conditions)
+        .values(version=Session.version + 1, change_seq=_change_seq(db), **values)
+        .returning(Session)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+    if expected_version is not None:
+        statement = statement.where(Session.version == expected_version)
+
+    return db.scalars(statement).first()
+
+
+# Only runs when the UPDATE matched nothing, to tell the caller why
+def _transition_failed(db, session_id, allowed, detail, expected_version=None):
+    current = db.execute(
+        select(Session.status, Session.version, Session.start_time, Session.end_time).where(Session.id == session_id)
+    ).first()
+
+    if current is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    if session.status != "scheduled":
-        raise HTTPException(status_code=400, detail="Session already started")
+    if expected_version is not None and current.version != expected_version:
+        raise HTTPException(status_code=409, detail="Session was modified by another request")
 
-    session.status = "active"
-    session.start_time = datetime.utcnow()
+    if current.status not in allowed:
+        raise HTTPException(status_code=400, detail=detail)
+
+    return current
 
-    db.commit()
-    db.refresh(session)
+
+def _lost_race():
+    return HTTPException(status_code=409, detail="Session was modified by another request")
+
+
+# 🔹 TRANSITION STEPS (no commit; shared by the single-session endpoints and the batch API)
+def _apply_start(db, session_id, expected_version=None):
+    allowed = ("scheduled",)
+    session = _transition(
+        db, session_id, allowed,
+        {"status": "active", "start_time": datetime.utcnow()},
+        expected_version
+    )
+
+    if session is None:
+        _transition_failed(db, session_id, allowed, "Session already started", expected_version)
+        raise _lost_race()
 
     return session
 
 
-# 🔹 PAUSE SESSION
-def pause_session(db, session_id: int, reason: str):
-    session = db.query(Session).filter(Session.id == session_id).first()
+def _apply_pause(db, session_id, reason, expected_version=None):
+    allowed = ("active",)
+    pause_count = Session.pause_count + 1
+    session = _transition(
+        db, session_id, allowed,
+        {
+            "pause_count": pause_count,
+            "focus_score": _focus_score_sql(pause_count),
+            "status": case((pause_count >= 4, "interrupted"), else_="paused"),
+        },
+        expected_version
+    )
 
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    if session is None:
+        _transition_failed(db, session_id, allowed, "Session is not active", expected_version)
+        raise _lost_race()
 
-    if session.status != "active":
-        raise HTTPException(status_code=400, detail="Session is not active")
+    # Core INSERT, not db.add(): with autoflush off a pending row would be invisible
+    # to a later resume or complete of the same session in this transaction (batch API)
+    db.execute(insert(Interruption).values(
+        session_id=session_id, reason=reason, pause_time=datetime.utcnow(), change_seq=_change_seq(db)
+    ))
 
-    interruption = Interruption(
-        session_id=session.id,
-        reason=reason
+    return session
+
+
+def _apply_resume(db, session_id, expected_version=None):
+    allowed = ("paused",)
+    now = datetime.utcnow()
+    session = _transition(
+        db, session_id, allowed,
+        {"status": "active", "paused_minutes": func.round(Session.paused_minutes + _closing_pause_minutes(now), 2)},
+        expected_version
     )
 
-    db.add(interruption)
-    db.commit()
+    if session is None:
+        _transition_failed(db, session_id, allowed, "Session is not paused", expected_version)
+        raise _lost_race()
 
-    pause_count = db.query(Interruption).filter(
-        Interruption.session_id == session.id
-    ).count()
+    _close_open_pause(db, session_id, now)
 
-    if pause_count >= 4:
-        session.status = "interrupted"
-    else:
-        session.status = "paused"
+    return session
 
-    db.commit()
-    db.refresh(session)
+
+# Ends the pause a resume (or a complete while paused) finishes: the session's latest interruption
+def _close_open_pause(db, session_id, now):
+    db.execute(
+        update(Interruption)
+        .where(
+            Interruption.id == select(func.max(Interruption.id))
+            .where(Interruption.session_id == session_id)
+            .scalar_subquery(),
+            Interruption.resume_time.is_(None),
+        )
+        .values(resume_time=now, change_seq=_change_seq(db))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _apply_complete(db, session_id, expected_version=None):
+    allowed = ("active", "paused")
+    now = datetime.utcnow()
+    # the bump takes the write lock, so the status read here still holds at the UPDATE
+    _change_seq(db)
+    was_paused = db.scalar(select(Session.status).where(Session.id == session_id)) == "paused"
+    actual_minutes = _minutes_since(Session.start_time, now)
+    # completing while paused ends that pause at end_time
+    paused_minutes = func.round(Session.paused_minutes + _closing_pause_minutes(now), 2)
+
+    session = _transition(
+        db, session_id, allowed,
+        {
+            "end_time": now,
+            "actual_duration": actual_minutes,
+            "paused_minutes": paused_minutes,
+            # unknown when any pause length is unknown, rather than counting those breaks as focus
+            "focused_minutes": case(
+                (_unmeasured_pauses() > 0, null()),
+                else_=func.max(func.round(actual_minutes - paused_minutes, 2), 0)
+            ),
+            "completion_ratio": case(
+                (Session.scheduled_duration != 0,
+                 func.round(actual_minutes / Session.scheduled_duration, 2)),
+                else_=None
+            ),
+            "status": case(
+                (actual_minutes > Session.scheduled_duration * OVERDUE_FACTOR, "overdue"),
+                else_="completed"
+            ),
+        },
+        expected_version,
+        conditions=(Session.start_time.is_not(None), Session.end_time.is_(None))
+    )
+
+    if session is None:
+        current = _transition_failed(db, session_id, allowed, "Cannot complete session", expected_version)
+
+        if not current.start_time:
+            raise HTTPException(status_code=400, detail="Session was never started")
+
+        if current.end_time:
+            raise HTTPException(status_code=400, detail="Cannot complete session")
+
+        raise _lost_race()
+
+    if was_paused:
+        _close_open_pause(db, session_id, now)
 
     return session
 
 
-# 🔹 RESUME SESSION
-def resume_session(db, session_id: int):
-    session = db.query(Session).filter(Session.id == session_id).first()
+# 🔹 START SESSION
+def start_session(db, session_id: int, expected_version=None):
+    session = _apply_start(db, session_id, expected_version)
+    _commit(db)
+
+    _publish("start", session)
+
+    return session
 
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
 
-    if session.status != "paused":
-        raise HTTPException(status_code=400, detail="Session is not paused")
+# 🔹 PAUSE SESSION
+def pause_session(db, session_id: int, reason: str, expected_version=None):
+    session = _apply_pause(db, session_id, reason, expected_version)
 
-    session.status = "active"
+    # session UPDATE and interruption INSERT commit together
+    _commit(db)
 
-    db.commit()
-    db.refresh(session)
+    _publish("pause", session)
+
+    return session
+
+
+# 🔹 RESUME SESSION
+def resume_session(db, session_id: int, expected_version=None):
+    session = _apply_resume(db, session_id, expected_version)
+    _commit(db)
+
+    _publish("resume", session)
 
     return session
 
 
 # 🔹 COMPLETE SESSION
-def complete_session(db, session_id: int):
-    session = db.query(Session).filter(Session.id == session_id).first()
+def complete_session(db, session_id: int, expected_version=None):
+    session = _apply_complete(db, session_id, expected_version)
+    _commit(db)
 
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    _publish("complete", session)
 
-    if session.status not in ["active", "paused"]:
-        raise HTTPException(status_code=400, detail="Cannot complete session")
+    return session
 
-    if not session.start_time:
-        raise HTTPException(status_code=400, detail="Session was never started")
 
-    session.end_time = datetime.utcnow()
+# 🔹 BATCH (bulk creates + transitions, one transaction)
+# Creates go out as one executemany INSERT ... RETURNING; transitions are then
+# applied in request order. A transition either matches its conditional UPDATE
+# or changes nothing, so a failed item never leaves partial writes behind and
+# the rest of the batch still commits.
+def _snapshot(session):
+    # later UPDATE ... RETURNING on the same id refreshes the identity-map object in place
+    return SimpleNamespace(**{column.key: getattr(session, column.key) for column in Session.__table__.columns})
+
+
+def apply_batch(db, items):
+    results = [None] * len(items)
+
+    creates = [(index, item) for index, item in enumerate(items) if item.op == "create"]
+    if creates:
+        change_seq = _change_seq(db)
+        created = db.scalars(
+            # render_nulls keeps rows with and without a goal in the same INSERT batch
+            insert(Session).returning(Session).execution_options(render_nulls=True),
+            [
+                {
+                    "title": item.title,
+                    "goal": item.goal,
+                    "scheduled_duration": item.scheduled_duration,
+                    "status": "scheduled",
+                    "pause_count": 0,
+                    "focus_score": _focus_score(item.scheduled_duration, 0),
+                    "change_seq": change_seq,
+                }
+                for _, item in creates
+            ]
+        ).all()
+
+        # rowids are handed out in VALUES order, so ascending id == request order
+        created = sorted(created, key=lambda session: session.id)
+
+        for (index, item), session in zip(creates, created):
+            results[index] = {"index": index, "op": item.op, "ok": True, "status_code": 200, "session": _snapshot(session)}
+
+    for index, item in enumerate(items):
+        if item.op == "create":
+            continue
+
+        try:
+            if item.op == "start":
+                session = _apply_start(db, item.id, item.version)
+            elif item.op == "pause":
+                session = _apply_pause(db, item.id, item.reason, item.version)
+            elif item.op == "resume":
+                session = _apply_resume(db, item.id, item.version)
+            else:
+                session = _apply_complete(db, item.id, item.version)
+        except HTTPException as exc:
+            results[index] = {
+                "index": index, "op": item.op, "ok": False,
+                "status_code": exc.status_code, "detail": exc.detail
+            }
+            continue
+
+        results[index] = {"index": index, "op": item.op, "ok": True, "status_code": 200, "session": _snapshot(session)}
+
+    _commit(db)
+
+    for result in results:
+        if result["ok"]:
+            _publish(result["op"], result["session"])
+
+    return results
+
+
+# 🔹 SWEEPS (run by app.sweeper; one batch per call, each its own short write transaction)
+def _abandoned_conditions(cutoff):
+    return (Session.status == "paused", _open_pause_time() < cutoff)
+
+
+def _overrun_conditions(now):
+    return (
+        Session.status == "active",
+        Session.overdue_at.is_(None),
+        Session.start_time.is_not(None),
+        _minutes_since(Session.start_time, now) > Session.scheduled_duration * OVERDUE_FACTOR,
+    )
 
-    actual_minutes = (
-        session.end_time - session.start_time
-    ).total_seconds() / 60
 
-    actual_minutes = round(actual_minutes, 2)
+def _sweep(db, conditions, action, values, batch_size):
+    # Pick the batch in a read transaction first, so a sweep that finds nothing never takes the write lock
+    ids = db.scalars(select(Session.id).where(*conditions).order_by(Session.id).limit(batch_size)).all()
+    db.rollback()
+    if not ids:
+        return 0
 
-    if actual_minutes > session.scheduled_duration * 1.1:
-        session.status = "overdue"
-    else:
-        session.status = "completed"
+    # Conditions are re-checked in the UPDATE, so a session resumed or completed meanwhile is left alone
+    swept = db.scalars(
+        update(Session)
+        .where(Session.id.in_(ids), *conditions)
+        .values(version=Session.version + 1, change_seq=_change_seq(db), **values)
+        .returning(Session)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).all()
+    _commit(db)
 
-    db.commit()
-    db.refresh(session)
+    for session in swept:
+        _publish(action, session)
 
-    return session
+    return len(swept)
 
 
-# 🔹 SESSION HISTORY (🔥 FIXED TIMER ISSUE HERE)
-def get_session_history(db):
-    sessions = db.query(Session).all()
-    history = []
-
-    for session in sessions:
-
-        pause_count = db.query(Interruption).filter(
-            Interruption.session_id == session.id
-        ).count()
-
-        actual_duration = None
-        completion_ratio = None
-        focus_score = None
-
-        if session.start_time and session.end_time:
-            actual_duration = (
-                session.end_time - session.start_time
-            ).total_seconds() / 60
-
-            actual_duration = round(actual_duration, 2)
-
-            completion_ratio = round(
-                actual_duration / session.scheduled_duration, 2
-            )
-
-        if session.scheduled_duration > 0:
-            focus_score = round(
-                (1 - (pause_count / session.scheduled_duration)) * 100,
-                2
-            )
-
-        history.append({
-            "id": session.id,
-            "title": session.title,
-            "goal": session.goal,
-            "scheduled_duration": session.scheduled_duration,
-            "actual_duration": actual_duration,
-            "pause_count": pause_count,
-            "status": session.status,
-            "completion_ratio": completion_ratio,
-            "focus_score": focus_score,
-            "start_time": to_ist(session.start_time).isoformat() if session.start_time else None,
-            "end_time": to_ist(session.end_time).isoformat() if session.end_time else None
-        })
+def sweep_abandoned(db, cutoff, batch_size):
+    """Paused sessions whose last pause is older than cutoff -> abandoned."""
+    return _sweep(db, _abandoned_conditions(cutoff), "abandoned", {"status": "abandoned"}, batch_size)
+
+
+def sweep_overdue(db, now, batch_size):
+    """Active sessions already past 110% of their schedule get overdue_at; they stay active."""
+    return _sweep(db, _overrun_conditions(now), "overdue", {"overdue_at": now}, batch_size)
+
+
+# 🔹 ARCHIVAL (finished sessions older than a cutoff move to the archive tables)
+# One chunk per call and per transaction, so a large backlog never holds the
+# write lock for long. Rows keep their ids (the hot tables never reuse one).
+ARCHIVE_STATUSES = ("completed", "overdue", "interrupted", "abandoned")
+ARCHIVES = {Session: ArchivedSession, Interruption: ArchivedInterruption}
 
+
+def _archivable_conditions(cutoff):
+    return (
+        Session.status.in_(ARCHIVE_STATUSES),
+        Session.created_at < cutoff,
+    )
+
+
+def _move(db, model, condition):
+    columns = [column.name for column in model.__table__.columns]
+    db.execute(insert(ARCHIVES[model]).from_select(columns, select(model.__table__).where(condition)))
+    db.execute(delete(model).where(condition).execution_options(synchronize_session=False))
+
+
+def archive_sessions(db, cutoff, batch_size):
+    """Move up to batch_size archivable sessions (and their interruptions); returns how many moved."""
+    ids = db.scalars(
+        select(Session.id).where(*_archivable_conditions(cutoff)).order_by(Session.id).limit(batch_size)
+    ).all()
+    db.rollback()
+    if not ids:
+        return 0
+
+    # bump first: takes the write lock, then re-check the chunk under it
+    _change_seq(db)
+    ids = db.scalars(select(Session.id).where(Session.id.in_(ids), *_archivable_conditions(cutoff))).all()
+
+    _move(db, Interruption, Interruption.session_id.in_(ids))
+    _move(db, Session, Session.id.in_(ids))
+    _commit(db)
+
+    return len(ids)
+
+
+# Hot rows only, or hot and archived rows together: (query, id column to order/page by)
+def _with_archive(build, model, include_archived=False):
+    if not include_archived:
+        return build(model), model.id
+
+    rows = union_all(build(model), build(ARCHIVES[model])).subquery()
+    return select(rows), rows.c.id
+
+
+# 🔹 SESSION HISTORY QUERY
+# Derived metrics are stored on the row, so history is a plain column fetch.
+def _history_query(model=Session):
+    return select(
+        model.id,
+        model.title,
+        model.goal,
+        model.scheduled_duration,
+        model.actual_duration,
+        model.pause_count,
+        model.status,
+        model.completion_ratio,
+        model.focus_score,
+        model.paused_minutes,
+        model.focused_minutes,
+        model.overdue_at,
+        model.start_time,
+        model.end_time,
+    )
+
+
+# 🔹 HISTORY FILTERS
+def _filter_sessions(query, model=Session, status=None, created_from=None, created_to=None, title_prefix=None):
+    if status:
+        query = query.where(model.status.in_(status))
+
+    if created_from:
+        query = query.where(model.created_at >= created_from)
+
+    if created_to:
+        query = query.where(model.created_at < created_to)
+
+    if title_prefix:
+        # Range predicate instead of LIKE so the title index can be used
+        query = query.where(
+            model.title >= title_prefix,
+            model.title < title_prefix + "\U0010ffff"
+        )
+
+    return query
+
+
+def _history_item(row):
+    return {
+        "id": row.id,
+        "title": row.title,
+        "goal": row.goal,
+        "scheduled_duration": row.scheduled_duration,
+        "actual_duration": row.actual_duration,
+        "pause_count": row.pause_count,
+        "status": row.status,
+        "completion_ratio": row.completion_ratio,
+        "focus_score": row.focus_score,
+        "paused_minutes": row.paused_minutes,
+        "focused_minutes": row.focused_minutes,
+        "overdue_at": to_ist(row.overdue_at).isoformat() if row.overdue_at else None,
+        "start_time": to_ist(row.start_time).isoformat() if row.start_time else None,
+        "end_time": to_ist(row.end_time).isoformat() if row.end_time else None
+    }
+
+
+# 🔹 SESSION HISTORY PAGE (keyset on id, newest first)
+@cache.cached
+def get_session_history_page(db, limit=None, cursor=None, include_archived=False, **filters):
+    def build(model):
+        query = _filter_sessions(_history_query(model), model, **filters)
+        return query.where(model.id < cursor) if cursor else query
+
+    query, id_column = _with_archive(build, Session, include_archived)
+    query = query.order_by(id_column.desc())
+
+    if limit:
+        # Fetch one extra row to know whether another page exists
+        query = query.limit(limit + 1)
+
+    rows = db.execute(query).all()
+
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+
+    return [_history_item(row) for row in rows], next_cursor
+
+
+# 🔹 CHANGES (delta sync: rows written after a token, plus the token to send next time)
+# Sessions and interruptions form one stream ordered by (change_seq, table, id).
+# Between pages the token is that position ("seq:table:id"), so a page can stop
+# inside one large write; once has_more is false it is the plain data version
+# and the client holds a consistent snapshot.
+CHANGES_LIMIT = 1000
+CHANGE_TABLES = (Session, Interruption)
+
+
+def _change_item(row):
+    return {**_history_item(row), "version": row.version, "change_seq": row.change_seq}
+
+
+def _interruption_item(row):
+    return {
+        "id": row.id,
+        "session_id": row.session_id,
+        "reason": row.reason,
+        "pause_time": to_ist(row.pause_time).isoformat() if row.pause_time else None,
+        "resume_time": to_ist(row.resume_time).isoformat() if row.resume_time else None,
+        "change_seq": row.change_seq,
+    }
+
+
+def _change_position(token):
+    try:
+        parts = [int(part) for part in str(token).split(":")]
+    except ValueError:
+        parts = []
+    if len(parts) == 1:
+        return parts[0], len(CHANGE_TABLES), 0  # past every row of that version
+    if len(parts) == 3:
+        return tuple(parts)
+    raise HTTPException(status_code=400, detail="Invalid changes token")
+
+
+def _after(model, position):
+    seq, table, row_id = position
+    kind = CHANGE_TABLES.index(model)
+    if kind > table:
+        return model.change_seq >= seq
+    if kind < table:
+        return model.change_seq > seq
+    return tuple_(model.change_seq, model.id) > tuple_(seq, row_id)
+
+
+def get_changes(db, since="0", limit=CHANGES_LIMIT):
+    position = _change_position(since)
+    version = get_data_version(db)
+
+    sessions = db.execute(
+        _history_query()
+        .add_columns(Session.version, Session.change_seq)
+        .where(_after(Session, position), Session.change_seq <= version)
+        .order_by(Session.change_seq, Session.id)
+        .limit(limit + 1)
+    ).all()
+    interruptions = db.execute(
+        select(Interruption)
+        .where(_after(Interruption, position), Interruption.change_seq <= version)
+        .order_by(Interruption.change_seq, Interruption.id)
+        .limit(limit + 1)
+    ).scalars().all()
+
+    stream = sorted(
+        [(row.change_seq, 0, row.id, row) for row in sessions]
+        + [(row.change_seq, 1, row.id, row) for row in interruptions],
+        key=lambda entry: entry[:3],
+    )
+    has_more = len(stream) > limit
+    page = stream[:limit]
+    token = ":".join(map(str, page[-1][:3])) if has_more else str(version)
+
+    return {
+        "token": token,
+        "has_more": has_more,
+        "sessions": [_change_item(row) for _, kind, _, row in page if kind == 0],
+        "interruptions": [_interruption_item(row) for _, kind, _, row in page if kind == 1],
+    }
+
+
+# 🔹 SEARCH (FTS5 over titles, goals and interruption reasons; best bm25 matches first)
+# A session's score adds up its own match and those of its interruptions, with
+# title hits weighted above goal and reason hits. Hot tables only.
+SEARCH_LIMIT = 20
+SEARCH_WEIGHTS = {"title": 10.0, "goal": 5.0, "reason": 3.0}
+
+SEARCH_SQL = text("""
+    WITH hits AS (
+        SELECT rowid AS session_id, bm25(sessions_fts, :title_weight, :goal_weight) AS score
+        FROM sessions_fts WHERE sessions_fts MATCH :query
+        UNION ALL
+        SELECT session_id, bm25(interruptions_fts, :reason_weight) AS score
+        FROM interruptions_fts WHERE interruptions_fts MATCH :query
+    )
+    SELECT session_id, -SUM(score) AS score
+    FROM hits
+    GROUP BY session_id
+    ORDER BY score DESC, session_id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def _match_query(q):
+    """User text -> FTS5 query: every word must match; a trailing * makes it a prefix."""
+    terms = []
+    for word in q.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+@cache.cached
+def search_sessions(db, q, limit=SEARCH_LIMIT, cursor=None):
+    query = _match_query(q)
+    if not query:
+        return [], None
+
+    offset = cursor or 0
+    hits = db.execute(SEARCH_SQL, {
+        "query": query,
+        "title_weight": SEARCH_WEIGHTS["title"],
+        "goal_weight": SEARCH_WEIGHTS["goal"],
+        "reason_weight": SEARCH_WEIGHTS["reason"],
+        # one extra row tells whether another page exists
+        "limit": limit + 1,
+        "offset": offset,
+    }).all()
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = offset + limit
+
+    scores = {hit.session_id: hit.score for hit in hits}
+    rows = {row.id: row for row in db.execute(_history_query().where(Session.id.in_(scores)))}
+
+    return [
+        {**_history_item(rows[session_id]), "score": round(score, 4)}
+        for session_id, score in scores.items()
+        if session_id in rows
+    ], next_cursor
+
+
+# 🔹 SESSION HISTORY (🔥 FIXED TIMER ISSUE HERE)
+def get_session_history(db, limit=None, cursor=None, include_archived=False, **filters):
+    history, _ = get_session_history_page(
+        db, limit=limit, cursor=cursor, include_archived=include_archived, **filters
+    )
     return history
 
 
-# 🔹 WEEKLY REPORT
-def get_weekly_report(db):
-    current_year = datetime.utcnow().year
-    current_week = datetime.utcnow().isocalendar()[1]
+# 🔹 WEEK HELPERS
+MAX_REPORT_WEEKS = 520
+
+
+def _week_start(day):
+    return day - timedelta(days=day.weekday())
+
 
-    sessions = db.query(Session).all()
+def _week_label(monday):
+    year, week, _ = monday.isocalendar()
+    return f"{year}-W{week:02d}"
 
-    total_sessions = 0
-    completed_sessions = 0
-    overdue_sessions = 0
-    interrupted_sessions = 0
 
-    for session in sessions:
-        if session.created_at:
-            year = session.created_at.isocalendar()[0]
-            week = session.created_at.isocalendar()[1]
+# 🔹 WEEKLY REPORT (current week, or every week between date_from and date_to)
+def get_weekly_report(db, date_from=None, date_to=None):
+    today = datetime.utcnow().date()
+    first_week = _week_start(date_from or date_to or today)
+    last_week = _week_start(date_to or today)
 
-            if year == current_year and week == current_week:
-                total_sessions += 1
+    if last_week < first_week:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
 
-                if session.status == "completed":
-                    completed_sessions += 1
-                elif session.status == "overdue":
-                    overdue_sessions += 1
-                elif session.status == "interrupted":
-                    interrupted_sessions += 1
+    week_count = (last_week - first_week).days // 7 + 1
+    if week_count > MAX_REPORT_WEEKS:
+        raise HTTPException(status_code=400, detail=f"Report range is limited to {MAX_REPORT_WEEKS} weeks")
 
-    return [{
-        "week": f"{current_year}-W{current_week:02d}",
-        "total_sessions": total_sessions,
-        "completed_sessions": completed_sessions,
-        "overdue_sessions": overdue_sessions,
-        "interrupted_sessions": interrupted_sessions
-    }]
+    # Cached on the resolved weeks, so the default range rolls over with the date
+    return _weekly_report(db, first_week, week_count)
+
+
+@cache.cached
+def _weekly_report(db, first_week, week_count):
+    last_week = first_week + timedelta(weeks=week_count - 1)
+
+    def in_range(model):
+        return select(
+            # Monday of the row's week: jump to the next Sunday (or stay), then back six days
+            func.date(model.created_at, "weekday 0", "-6 days").label("week_start"),
+            model.status,
+            model.focused_minutes,
+            model.paused_minutes,
+        ).where(
+            model.created_at >= datetime.combine(first_week, time.min),
+            model.created_at < datetime.combine(last_week + timedelta(days=7), time.min)
+        )
+
+    # Archived weeks still count; the created_at index makes the archive side a
+    # range seek that finds nothing when the weeks are all hot
+    sessions = union_all(in_range(Session), in_range(ArchivedSession)).subquery()
+
+    rows = db.execute(
+        select(
+            sessions.c.week_start,
+            sessions.c.status,
+            func.count().label("count"),
+            func.sum(sessions.c.focused_minutes).label("focused_minutes"),
+            func.sum(sessions.c.paused_minutes).label("paused_minutes"),
+        )
+        .group_by(sessions.c.week_start, sessions.c.status)
+    )
+
+    weeks = {}
+    for i in range(week_count):
+        monday = first_week + timedelta(weeks=i)
+        weeks[monday] = {
+            "week": _week_label(monday),
+            "total_sessions": 0,
+            "completed_sessions": 0,
+            "overdue_sessions": 0,
+            "interrupted_sessions": 0,
+            "focused_minutes": 0,
+            "paused_minutes": 0
+        }
+
+    for row in rows:
+        week = weeks.get(date.fromisoformat(row.week_start))
+        if week is None:
+            continue
+
+        week["total_sessions"] += row.count
+        week["focused_minutes"] = round(week["focused_minutes"] + (row.focused_minutes or 0), 2)
+        week["paused_minutes"] = round(week["paused_minutes"] + (row.paused_minutes or 0), 2)
+
+        if row.status == "completed":
+            week["completed_sessions"] += row.count
+        elif row.status == "overdue":
+            week["overdue_sessions"] += row.count
+        elif row.status == "interrupted":
+            week["interrupted_sessions"] += row.count
+
+    return list(weeks.values())
 
 
 # 🔹 EXPORT CSV
-def export_sessions_csv(db):
-    history = get_session_history(db)
-    file_path = "sessions_export.csv"
-
-    with open(file_path, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([
-            "ID", "Title", "Goal", "Status", 
-            "Scheduled Duration (min)", "Actual Duration (min)", 
-            "Pause Count", "Focus Score (%)", 
-            "Start Time", "End Time"
-        ])
-
-        for s in history:
-            # Format times in IST for better readability (DD-MM-YYYY HH:mm)
-            start_dt = to_ist(db.query(Session).get(s["id"]).start_time) if s["start_time"] else None
-            end_dt = to_ist(db.query(Session).get(s["id"]).end_time) if s["end_time"] else None
-            
-            start_str = start_dt.strftime("%d-%m-%Y %H:%M") if start_dt else "N/A"
-            end_str = end_dt.strftime("%d-%m-%Y %H:%M") if end_dt else "N/A"
-            
-            writer.writerow([
-                s["id"],
-                s["title"],
-                s["goal"] or "N/A",
-                s["status"],
-                s["scheduled_duration"],
-                s["actual_duration"] or 0,
-                s["pause_count"],
-                f"{s['focus_score']}%" if s['focus_score'] is not None else "N/A",
-                start_str,
-                end_str
-            ])
-
-    return file_path
+CSV_HEADER = [
+    "ID", "Title", "Goal", "Status",
+    "Scheduled Duration (min)", "Actual Duration (min)",
+    "Pause Count", "Focus Score (%)",
+    "Start Time", "End Time",
+    "Focused (min)", "Paused (min)"
+]
+
+EXPORT_BATCH_SIZE = 500
+
+
+def _format_ist(utc_dt):
+    # Format times in IST for better readability (DD-MM-YYYY HH:mm)
+    ist_dt = to_ist(utc_dt)
+    return ist_dt.strftime("%d-%m-%Y %H:%M") if ist_dt else "N/A"
+
+
+def _csv_row(row):
+    return [
+        row.id,
+        row.title,
+        row.goal or "N/A",
+        row.status,
+        row.scheduled_duration,
+        row.actual_duration or 0,
+        row.pause_count,
+        f"{row.focus_score}%" if row.focus_score is not None else "N/A",
+        _format_ist(row.start_time),
+        _format_ist(row.end_time),
+        row.focused_minutes if row.focused_minutes is not None else "N/A",
+        row.paused_minutes
+    ]
+
+
+def _csv_text(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _export_query(batch_size, include_archived=False):
+    query, id_column = _with_archive(_history_query, Session, include_archived)
+    return query.order_by(id_column).execution_options(yield_per=batch_size)
+
+
+# Yields the CSV in chunks of EXPORT_BATCH_SIZE rows, read through a streaming
+# cursor, so memory stays flat and nothing is written to disk.
+def export_sessions_csv(db, batch_size=EXPORT_BATCH_SIZE, include_archived=False):
+    yield _csv_text([CSV_HEADER])
+
+    result = db.execute(_export_query(batch_size, include_archived))
+
+    for rows in result.partitions():
+        yield _csv_text(_csv_row(row) for row in rows)
+
+
+# 🔹 EXPORT PARQUET / ARROW (typed columns, UTC timestamps, nulls kept as nulls)
+COLUMNAR_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Parquet/Arrow export needs the optional 'pyarrow' package")
+    return pyarrow
+
+
+def _columnar_columns(table):
+    if table == "interruptions":
+        return [
+            Interruption.id, Interruption.session_id, Interruption.reason,
+            Interruption.pause_time, Interruption.resume_time,
+        ]
+    return [
+        Session.id, Session.title, Session.goal, Session.status,
+        Session.scheduled_duration, Session.actual_duration, Session.pause_count,
+        Session.completion_ratio, Session.focus_score, Session.paused_minutes, Session.focused_minutes,
+        Session.start_time, Session.end_time, Session.created_at, Session.version,
+    ]
+
+
+def _columnar_schema(pa, table):
+    timestamp = pa.timestamp("us", tz="UTC")  # stored as naive UTC
+    types = {
+        "id": pa.int64(), "session_id": pa.int64(), "reason": pa.string(),
+        "title": pa.string(), "goal": pa.string(), "status": pa.string(),
+        "scheduled_duration": pa.int32(), "actual_duration": pa.float64(), "pause_count": pa.int32(),
+        "completion_ratio": pa.float64(), "focus_score": pa.float64(), "version": pa.int32(),
+        "paused_minutes": pa.float64(), "focused_minutes": pa.float64(),
+        "start_time": timestamp, "end_time": timestamp, "created_at": timestamp,
+        "pause_time": timestamp, "resume_time": timestamp,
+    }
+    return pa.schema([(column.key, types[column.key]) for column in _columnar_columns(table)])
+
+
+def _columnar_query(table, batch_size, include_archived=False):
+    columns = _columnar_columns(table)
+    model = Interruption if table == "interruptions" else Session
+
+    def build(source):
+        return select(*(getattr(source, column.key) for column in columns))
+
+    query, id_column = _with_archive(build, model, include_archived)
+    return query.order_by(id_column).execution_options(yield_per=batch_size)
+
+
+class _ChunkSink(io.RawIOBase):
+    """File object the Arrow writers write into; drained after every record batch."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class _ColumnarWriter:
+    def __init__(self, fmt, table):
+        self.pa = _pyarrow()
+        self.schema = _columnar_schema(self.pa, table)
+        self.sink = _ChunkSink()
+        if fmt == "parquet":
+            self.writer = self.pa.parquet.ParquetWriter(self.sink, self.schema)
+        else:
+            self.writer = self.pa.ipc.new_stream(self.sink, self.schema)
+
+    def write(self, rows):
+        columns = list(zip(*rows)) or [()] * len(self.schema)
+        batch = self.pa.RecordBatch.from_arrays(
+            [self.pa.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema,
+        )
+        self.writer.write_batch(batch)
+        return self.sink.drain()
+
+    def close(self):
+        self.writer.close()
+        return self.sink.drain()
+
+
+def _columnar_chunks(db, writer, table, batch_size, include_archived):
+    result = db.execute(_columnar_query(table, batch_size, include_archived))
+
+    for rows in result.partitions():
+        yield writer.write(rows)
+
+    yield writer.close()
+
+
+# One record batch (Parquet row group) per EXPORT_BATCH_SIZE rows, streamed as it is written.
+# Not a generator itself, so a missing pyarrow is a 501 before the response starts.
+def export_sessions_columnar(db, fmt, table="sessions", batch_size=EXPORT_BATCH_SIZE, include_archived=False):
+    return _columnar_chunks(db, _ColumnarWriter(fmt, table), table, batch_size, include_archived)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import (
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    SWEEP_ABANDON_AFTER_MINUTES,
+    SWEEP_BATCH_SIZE,
+    SWEEP_INTERVAL_SECONDS,
+)
+from app.database import SessionLocal
+from app.metrics import metrics
+from app.services import session_services
+
+logger = logging.getLogger(__name__)
+
+# Gap between batches, so API writers waiting on the lock get in before the next one
+BATCH_PAUSE_SECONDS = 0.01
+
+
+# 🔹 BACKGROUND SWEEPER
+# Moves sessions that nobody is going to finish out of their live states:
+#   paused, last pause older than SWEEP_ABANDON_AFTER_MINUTES -> abandoned
+#   active, already past 110% of the scheduled duration       -> overdue_at set (stays active)
+# and, when ARCHIVE_AFTER_DAYS is set, moves finished sessions older than that
+# into the archive tables.
+# Every batch is one short write transaction of at most SWEEP_BATCH_SIZE rows,
+# found through the status index, so a big backlog never holds the SQLite
+# write lock for longer than one batch.
+class Sweeper:
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        interval=SWEEP_INTERVAL_SECONDS,
+        batch_size=SWEEP_BATCH_SIZE,
+        abandon_after=timedelta(minutes=SWEEP_ABANDON_AFTER_MINUTES),
+        archive_after=timedelta(days=ARCHIVE_AFTER_DAYS) if ARCHIVE_AFTER_DAYS else None,
+        archive_batch_size=ARCHIVE_BATCH_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.abandon_after = abandon_after
+        self.archive_after = archive_after
+        self.archive_batch_size = archive_batch_size
+        self._task = None
+
+    def _drain(self, db, kind, sweep, batch_size):
+        total = 0
+        while True:
+            started = time.perf_counter()
+            swept = sweep(db, batch_size)
+            metrics.record_sweep_batch(kind, time.perf_counter() - started, swept)
+            total += swept
+            if swept < batch_size:
+                return total
+            time.sleep(BATCH_PAUSE_SECONDS)
+
+    def run_once(self):
+        """One full sweep; returns how many sessions became abandoned / overdue (and were archived)."""
+        now = datetime.utcnow()
+        cutoff = now - self.abandon_after
+        started = time.perf_counter()
+
+        try:
+            with self.session_factory() as db:
+                swept = {
+                    "abandoned": self._drain(
+                        db, "abandoned", lambda db, size: session_services.sweep_abandoned(db, cutoff, size),
+                        self.batch_size),
+                    "overdue": self._drain(
+                        db, "overdue", lambda db, size: session_services.sweep_overdue(db, now, size),
+                        self.batch_size),
+                }
+                if self.archive_after is not None:
+                    archive_cutoff = now - self.archive_after
+                    swept["archived"] = self._drain(
+                        db, "archived", lambda db, size: session_services.archive_sessions(db, archive_cutoff, size),
+                        self.archive_batch_size)
+        except Exception:
+            metrics.record_sweep("error", time.perf_counter() - started)
+            raise
+
+        metrics.record_sweep("ok", time.perf_counter() - started)
+        return swept
+
+    async def _run(self):
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception:
+                logger.exception("Session sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
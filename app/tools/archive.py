@@ -0,0 +1,59 @@
+"""Move finished sessions older than a cutoff into the archive tables.
+
+Completed, overdue, interrupted and abandoned sessions created more than
+--older-than-days ago are copied, with their interruptions, into
+sessions_archive / interruptions_archive and deleted from the hot tables,
+--batch-size sessions per transaction. History and export only read them
+back with include_archived=true.
+
+    python -m app.tools.archive --older-than-days 90
+"""
+import argparse
+import time as clock
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, DATABASE_URL
+from app.database import configure_engine
+from app.services.session_services import archive_sessions
+
+DEFAULT_AGE_DAYS = 90
+
+
+def archive(engine, older_than, batch_size=ARCHIVE_BATCH_SIZE, progress=None):
+    """Archive everything eligible, one chunk per transaction; returns the number of sessions moved."""
+    cutoff = datetime.utcnow() - older_than
+    moved = 0
+
+    with sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as db:
+        while True:
+            count = archive_sessions(db, cutoff, batch_size)
+            moved += count
+            if progress and count:
+                progress(moved)
+            if count < batch_size:
+                return moved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--older-than-days", type=int, default=ARCHIVE_AFTER_DAYS or DEFAULT_AGE_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE, help="sessions per transaction")
+    args = parser.parse_args(argv)
+
+    engine = configure_engine(create_engine(args.database_url))
+    started = clock.perf_counter()
+
+    def progress(moved):
+        print(f"{moved:>10} sessions archived {moved / (clock.perf_counter() - started):>10.0f} rows/s")
+
+    moved = archive(engine, timedelta(days=args.older_than_days), args.batch_size, progress)
+    print(f"done: {moved} sessions archived")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
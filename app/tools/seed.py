@@ -0,0 +1,243 @@
+"""Bulk-generate synthetic sessions and interruptions.
+
+Every row is walked through the real state machine (scheduled -> active ->
+paused/resumed -> completed / overdue / interrupted), so pause counts,
+interruption rows, versions and derived metrics agree with what the API
+would have written. Rows go in through chunked Core executemany inserts,
+many chunks per transaction. Timestamps count back from --now (a fixed
+anchor by default), so the same --seed and --now give identical rows on an
+empty database.
+
+    python -m app.tools.seed --sessions 1000000 --seed 42
+    python -m app.tools.seed --sessions 100000 --now 2026-06-01T00:00:00
+    python -m app.tools.seed --database-url sqlite:///./scratch.db --create-tables \\
+        --sessions 100000 --status-weights completed=70,overdue=10,interrupted=5,scheduled=15
+"""
+import argparse
+import math
+import random
+import time as clock
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, select
+
+from app.config import DATABASE_URL
+from app.database import Base, configure_engine
+from app.models import ArchivedSession, Interruption, Session
+from app.services.session_services import _bump_data_version, _focus_score
+
+# 🔹 DEFAULT DISTRIBUTIONS
+STATUS_WEIGHTS = {
+    "completed": 55,
+    "overdue": 10,
+    "interrupted": 8,
+    "active": 7,
+    "paused": 5,
+    "scheduled": 15,
+}
+DURATIONS = (25, 30, 45, 60, 90)
+PAUSE_MEAN = 1.0
+SPREAD_DAYS = 365
+NOW = datetime(2026, 1, 1)  # created_at values are spread over the SPREAD_DAYS before this
+CHUNK_SIZE = 10_000
+TRANSACTION_SIZE = 200_000
+
+INTERRUPTED_AT = 4  # the 4th pause marks a session "interrupted" (see _apply_pause)
+TITLES = ("Deep work", "Writing", "Code review", "Study", "Design", "Planning", "Research")
+REASONS = ("Phone call", "Coffee", "Slack", "Meeting", "Email", "Colleague")
+
+
+def _pauses(rng, status, pause_mean):
+    if status == "scheduled":
+        return 0
+    if status == "interrupted":
+        return INTERRUPTED_AT
+
+    # Poisson draw, capped below the interruption threshold
+    limit, count, product = math.exp(-pause_mean), 0, rng.random()
+    while product > limit and count < INTERRUPTED_AT - 1:
+        count += 1
+        product *= rng.random()
+
+    return max(count, 1) if status == "paused" else count
+
+
+def generate(first_id, count, rng, now, status_weights=None, durations=DURATIONS,
+             pause_mean=PAUSE_MEAN, spread_days=SPREAD_DAYS):
+    """Rows for sessions first_id .. first_id + count - 1 and their interruptions."""
+    statuses, weights = zip(*(status_weights or STATUS_WEIGHTS).items())
+    sessions, interruptions = [], []
+
+    for session_id in range(first_id, first_id + count):
+        status = rng.choices(statuses, weights)[0]
+        scheduled = rng.choice(durations)
+        pauses = _pauses(rng, status, pause_mean)
+        created_at = now - timedelta(seconds=rng.randint(0, spread_days * 86400))
+
+        row = {
+            "id": session_id,
+            "title": f"{rng.choice(TITLES)} #{session_id}",
+            "goal": None,
+            "scheduled_duration": scheduled,
+            "status": status,
+            "created_at": created_at,
+            "start_time": None,
+            "end_time": None,
+            "pause_count": pauses,
+            "actual_duration": None,
+            "completion_ratio": None,
+            "focus_score": _focus_score(scheduled, pauses),
+            "paused_minutes": 0,
+            "focused_minutes": None,
+            "version": 1,
+        }
+
+        if status != "scheduled":
+            start_time = created_at + timedelta(minutes=rng.uniform(0, 60))
+            row["start_time"] = start_time
+
+            if status == "overdue":
+                minutes = scheduled * rng.uniform(1.11, 1.6)
+            elif status == "completed":
+                minutes = scheduled * rng.uniform(0.5, 1.1)
+            else:
+                minutes = scheduled * rng.uniform(0.1, 0.9)
+
+            # start, then pause/resume pairs; paused/interrupted sessions stop on a pause
+            resumes = pauses - 1 if status in ("paused", "interrupted") else pauses
+            row["version"] = 2 + pauses + resumes
+
+            gap = minutes / (pauses + 1)
+            paused_minutes = 0.0
+            for n in range(pauses):
+                pause_time = start_time + timedelta(minutes=gap * (n + 1))
+                resume_time = None
+                if n < resumes:
+                    # each break lasts a fraction of the focus block that follows it
+                    length = gap * rng.uniform(0.1, 0.5)
+                    resume_time = pause_time + timedelta(minutes=length)
+                    paused_minutes += length
+                interruptions.append({
+                    "session_id": session_id,
+                    "reason": rng.choice(REASONS),
+                    "pause_time": pause_time,
+                    "resume_time": resume_time,
+                })
+            row["paused_minutes"] = round(paused_minutes, 2)
+
+            if status in ("completed", "overdue"):
+                row["version"] += 1
+                row["end_time"] = start_time + timedelta(minutes=minutes)
+                row["actual_duration"] = round(minutes, 2)
+                row["completion_ratio"] = round(minutes / scheduled, 2)
+                row["focused_minutes"] = round(minutes - paused_minutes, 2)
+
+        sessions.append(row)
+
+    return sessions, interruptions
+
+
+def seed(engine, sessions, seed=0, now=NOW, chunk_size=CHUNK_SIZE, transaction_size=TRANSACTION_SIZE,
+         progress=None, **distributions):
+    """Append `sessions` generated rows after the current max id; returns (sessions, interruptions)."""
+    rng = random.Random(seed)
+    totals = [0, 0]
+
+    with engine.connect() as conn:
+        # archived sessions keep their ids, so those are taken too
+        next_id = max(
+            conn.execute(select(func.max(Session.id))).scalar() or 0,
+            conn.execute(select(func.max(ArchivedSession.id))).scalar() or 0,
+        ) + 1
+
+    remaining = sessions
+    while remaining:
+        with engine.begin() as conn:
+            # ETags, the read cache and /sessions/changes key off this counter
+            change_seq = _bump_data_version(conn)
+            in_transaction = min(remaining, transaction_size)
+            for offset in range(0, in_transaction, chunk_size):
+                count = min(chunk_size, in_transaction - offset)
+                session_rows, interruption_rows = generate(next_id, count, rng, now, **distributions)
+                for row in (*session_rows, *interruption_rows):
+                    row["change_seq"] = change_seq
+
+                conn.execute(insert(Session), session_rows)
+                if interruption_rows:
+                    conn.execute(insert(Interruption), interruption_rows)
+
+                next_id += count
+                totals[0] += count
+                totals[1] += len(interruption_rows)
+
+        remaining -= in_transaction
+        if progress:
+            progress(*totals)
+
+    return tuple(totals)
+
+
+def _weights(text):
+    weights = {}
+    for part in text.split(","):
+        status, _, weight = part.partition("=")
+        if status not in STATUS_WEIGHTS:
+            raise argparse.ArgumentTypeError(f"unknown status {status!r}")
+        weights[status] = float(weight)
+    return weights
+
+
+def _durations(text):
+    return tuple(int(minutes) for minutes in text.split(","))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--now", type=datetime.fromisoformat, default=NOW,
+                        help="UTC anchor the generated timestamps count back from (default %(default)s)")
+    parser.add_argument("--status-weights", type=_weights, default=STATUS_WEIGHTS,
+                        help="e.g. completed=55,overdue=10,interrupted=8,active=7,paused=5,scheduled=15")
+    parser.add_argument("--durations", type=_durations, default=DURATIONS,
+                        help="scheduled durations to pick from, in minutes (e.g. 25,30,45,60,90)")
+    parser.add_argument("--pause-mean", type=float, default=PAUSE_MEAN,
+                        help="mean pauses per non-interrupted session")
+    parser.add_argument("--spread-days", type=int, default=SPREAD_DAYS,
+                        help="created_at is spread over this many past days")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per executemany")
+    parser.add_argument("--transaction-size", type=int, default=TRANSACTION_SIZE, help="rows per commit")
+    parser.add_argument("--create-tables", action="store_true",
+                        help="create missing tables (scratch databases; real ones use alembic)")
+    args = parser.parse_args(argv)
+
+    engine = configure_engine(create_engine(args.database_url))
+    if args.create_tables:
+        Base.metadata.create_all(engine)
+
+    started = clock.perf_counter()
+
+    def progress(session_count, interruption_count):
+        elapsed = clock.perf_counter() - started
+        print(f"{session_count:>10} sessions {interruption_count:>10} interruptions "
+              f"{session_count / elapsed:>10.0f} rows/s")
+
+    seed(
+        engine,
+        args.sessions,
+        seed=args.seed,
+        now=args.now,
+        chunk_size=args.chunk_size,
+        transaction_size=args.transaction_size,
+        progress=progress,
+        status_weights=args.status_weights,
+        durations=args.durations,
+        pause_mean=args.pause_mean,
+        spread_days=args.spread_days,
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""NumPy analytics vs a per-row Python loop over the same sessions.
+
+Seeds a scratch database (1M sessions by default), then times
+analytics_services.get_analytics against the row-at-a-time approach the
+history endpoint used to take: fetch each session and accumulate in Python.
+
+    python benchmarks/bench_analytics.py --sessions 1000000 --repeat 3
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from common import seed_database
+from app.cache import cache
+from app.models import Session
+from app.services.analytics_services import get_analytics
+from app.services.session_services import to_ist
+
+
+def per_row_analytics(db, days=30, window=7):
+    focus, completion, actual = [], [], []
+    by_status = defaultdict(lambda: {"count": 0, "focus": [], "completion": [], "pauses": []})
+    by_hour = defaultdict(lambda: [0, [], 0])
+    by_day = defaultdict(list)
+
+    for row in db.execute(select(Session)).scalars():
+        group = by_status[row.status]
+        group["count"] += 1
+        group["pauses"].append(row.pause_count)
+        if row.focus_score is not None:
+            focus.append(row.focus_score)
+            group["focus"].append(row.focus_score)
+        if row.completion_ratio is not None:
+            completion.append(row.completion_ratio)
+            group["completion"].append(row.completion_ratio)
+        if row.actual_duration is not None:
+            actual.append(row.actual_duration)
+        if row.start_time is not None:
+            hour = by_hour[to_ist(row.start_time).hour]
+            hour[0] += 1
+            hour[2] += row.status == "completed"
+            if row.focus_score is not None:
+                hour[1].append(row.focus_score)
+        by_day[to_ist(row.created_at).date()].append(row.focus_score)
+
+    def summary(values):
+        return {"mean": statistics.fmean(values), "quantiles": statistics.quantiles(values, n=100)} if values else {}
+
+    last_day = max(by_day)
+    rolling = []
+    for offset in range(days - 1, -1, -1):
+        day = last_day - timedelta(days=offset)
+        scored = [
+            score
+            for back in range(window)
+            for score in by_day.get(day - timedelta(days=back), [])
+            if score is not None
+        ]
+        rolling.append((day, statistics.fmean(scored) if scored else None))
+
+    return {
+        "focus_score": summary(focus),
+        "completion_ratio": summary(completion),
+        "actual_duration": summary(actual),
+        "by_status": {
+            status: (g["count"], statistics.fmean(g["focus"]) if g["focus"] else None)
+            for status, g in by_status.items()
+        },
+        "by_hour": {hour: (h[0], statistics.fmean(h[1]) if h[1] else None, h[2] / h[0]) for hour, h in by_hour.items()},
+        "rolling": rolling,
+    }
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        cache.clear()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed_database(db_path, args.sessions)
+        engine = create_engine(f"sqlite:///{db_path}")
+        db = sessionmaker(bind=engine)()
+
+        numpy_s = best_of(args.repeat, lambda: get_analytics(db))
+        per_row_s = best_of(args.repeat, lambda: (per_row_analytics(db), db.expunge_all()))
+
+        db.close()
+        engine.dispose()
+
+    print(f"{'approach':<10} {'seconds':>10}")
+    print(f"{'per-row':<10} {per_row_s:>10.3f}")
+    print(f"{'numpy':<10} {numpy_s:>10.3f}")
+    print(f"speedup: {per_row_s / numpy_s:.1f}x on {args.sessions} sessions")
+
+
+if __name__ == "__main__":
+    main()
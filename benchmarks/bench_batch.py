@@ -0,0 +1,62 @@
+"""Driving N sessions through create -> start -> complete: one call per item vs POST /sessions/batch.
+
+    python benchmarks/bench_batch.py --sessions 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from common import ROOT, prepare_database, start_server, stop_server
+
+sys.path.append(ROOT)
+
+from deepwork_sdk import DeepWorkClient  # noqa: E402
+
+BATCH_SIZE = 1000
+
+
+def one_by_one(client, count):
+    for i in range(count):
+        session = client.create_session(f"Single {i}", None, 30)
+        client.start_session(session["id"])
+        client.complete_session(session["id"])
+
+
+def batched(client, count):
+    for offset in range(0, count, BATCH_SIZE):
+        size = min(BATCH_SIZE, count - offset)
+        created = client.batch(
+            {"op": "create", "title": f"Batch {offset + i}", "scheduled_duration": 30} for i in range(size)
+        )
+        ids = [result["session"]["id"] for result in created]
+        client.batch({"op": "start", "id": session_id} for session_id in ids)
+        client.batch({"op": "complete", "id": session_id} for session_id in ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    print(f"{'path':<12} {'seconds':>9} {'sessions/s':>11}")
+    for name, drive in (("one-by-one", one_by_one), ("batch", batched)):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "batch.db")
+            prepare_database(db_path, 0)
+            server = start_server(db_path, args.port)
+            try:
+                client = DeepWorkClient(f"http://127.0.0.1:{args.port}")
+                started = time.perf_counter()
+                drive(client, args.sessions)
+                elapsed = time.perf_counter() - started
+            finally:
+                stop_server(server)
+
+        print(f"{name:<12} {elapsed:>9.2f} {args.sessions / elapsed:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
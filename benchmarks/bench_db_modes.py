@@ -0,0 +1,77 @@
+"""Requests/second of the sessions API in sync vs async DB mode.
+
+Starts one uvicorn server per mode on a scratch SQLite file, seeds it, then
+drives it with concurrent httpx clients for a fixed duration.
+
+    python benchmarks/bench_db_modes.py --sessions 2000 --concurrency 64 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from common import prepare_database, start_server, stop_server
+
+
+async def drive(base_url, concurrency, duration):
+    completed = 0
+    errors = 0
+    stop_at = time.perf_counter() + duration
+
+    async def worker(client, worker_id):
+        nonlocal completed, errors
+        i = 0
+        while time.perf_counter() < stop_at:
+            # Mostly reads, with a write every tenth call
+            if i % 10 == 9:
+                response = await client.post(
+                    "/sessions/", json={"title": f"W{worker_id}", "scheduled_duration": 30}
+                )
+            elif i % 2:
+                response = await client.get("/sessions/weekly-report")
+            else:
+                response = await client.get("/sessions/history", params={"limit": 50})
+
+            if response.status_code == 200:
+                completed += 1
+            else:
+                errors += 1
+            i += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client, n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return completed / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'req/s':>10} {'errors':>8}")
+    for mode in ("sync", "async"):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bench.db")
+            prepare_database(db_path, args.sessions)
+            server = start_server(db_path, args.port, DEEPWORK_DB_MODE=mode)
+            try:
+                rps, errors = asyncio.run(
+                    drive(f"http://127.0.0.1:{args.port}", args.concurrency, args.duration)
+                )
+            finally:
+                stop_server(server)
+        print(f"{mode:<6} {rps:>10.1f} {errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""SDK throughput against a local uvicorn: unpooled requests vs pooled DeepWorkClient vs AsyncDeepWorkClient.
+
+    python benchmarks/bench_sdk.py --requests 2000 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from common import ROOT, prepare_database, start_server, stop_server
+
+sys.path.append(ROOT)
+
+from deepwork_sdk import AsyncDeepWorkClient, DeepWorkClient  # noqa: E402
+
+
+def unpooled(base_url, total, concurrency):
+    # What the SDK used to do: module-level requests.get, a new connection per call
+    def call(_):
+        requests.get(f"{base_url}/sessions/history", params={"limit": 10}).json()
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(call, range(total)))
+
+
+def pooled(base_url, total, concurrency):
+    with DeepWorkClient(base_url, pool_size=concurrency) as client:
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(lambda _: client.get_history(limit=10), range(total)))
+
+
+def async_client(base_url, total, concurrency):
+    async def run():
+        async with AsyncDeepWorkClient(base_url, pool_size=concurrency) as client:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def call():
+                async with semaphore:
+                    await client.get_history(limit=10)
+
+            await asyncio.gather(*(call() for _ in range(total)))
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8768)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "sdk.db")
+        prepare_database(db_path, args.sessions)
+        server = start_server(db_path, args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+        try:
+            print(f"{'client':<14} {'seconds':>9} {'req/s':>9}")
+            for name, drive in (("unpooled", unpooled), ("pooled", pooled), ("async", async_client)):
+                started = time.perf_counter()
+                drive(base_url, args.requests, args.concurrency)
+                elapsed = time.perf_counter() - started
+                print(f"{name:<14} {elapsed:>9.2f} {args.requests / elapsed:>9.1f}")
+        finally:
+            stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
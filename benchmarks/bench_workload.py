@@ -0,0 +1,276 @@
+"""Mixed-workload benchmark: throughput and p50/p95/p99 latency per route.
+
+Seeds a scratch SQLite file with N sessions (plus interruptions), then drives a
+weighted mix of creates, transitions, history, weekly-report and export calls
+against the app in-process (httpx ASGI transport) and/or a local uvicorn.
+Results are written as JSON so runs can be compared across commits.
+
+    python benchmarks/bench_workload.py --sessions 10000 --duration 10
+    python benchmarks/bench_workload.py --sessions 100000 --target uvicorn --workers 4
+    python benchmarks/bench_workload.py --sessions 10000 --compare benchmarks/results/<old>.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+import httpx
+
+from common import ROOT, git_commit, percentile, seed_database, start_server, stop_server
+
+DEFAULT_MIX = "create=10,transition=25,history=40,weekly=20,export=5"
+TRANSITIONS = ("start", "pause", "resume", "complete")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("create", "transition", "history", "weekly", "export"):
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r} in --mix")
+        mix[name] = float(weight)
+    return mix
+
+
+async def drive(client, mix, concurrency, duration, seed):
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    stop_at = time.perf_counter() + duration
+    operations, weights = zip(*mix.items())
+
+    async def call(route, method, url, **kwargs):
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        if method == "GET" and url == "/sessions/export":
+            await response.aread()
+        latencies[route].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            errors[route] += 1
+        return response
+
+    async def create(pending, worker_id):
+        response = await call(
+            "POST /sessions/", "POST", "/sessions/",
+            json={"title": f"Load {worker_id}", "scheduled_duration": 30},
+        )
+        if response.status_code == 200:
+            pending.append((response.json()["id"], 0))
+
+    async def worker(worker_id):
+        rng = random.Random(seed + worker_id)
+        # sessions this worker created, with the index of their next transition
+        pending = deque()
+
+        while time.perf_counter() < stop_at:
+            op = rng.choices(operations, weights)[0]
+
+            if op == "create" or (op == "transition" and not pending):
+                await create(pending, worker_id)
+            elif op == "transition":
+                session_id, step = pending.popleft()
+                action = TRANSITIONS[step]
+                await call(
+                    f"PATCH /sessions/{{id}}/{action}", "PATCH", f"/sessions/{session_id}/{action}",
+                    json={"reason": "Benchmark"} if action == "pause" else None,
+                )
+                if step + 1 < len(TRANSITIONS):
+                    pending.append((session_id, step + 1))
+            elif op == "history":
+                params = {"limit": 100}
+                if rng.random() < 0.5:
+                    params["status"] = rng.choice(["completed", "active", "paused"])
+                await call("GET /sessions/history", "GET", "/sessions/history", params=params)
+            elif op == "weekly":
+                await call("GET /sessions/weekly-report", "GET", "/sessions/weekly-report")
+            else:
+                await call("GET /sessions/export", "GET", "/sessions/export")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    routes = {
+        route: {
+            "count": len(samples),
+            "errors": errors[route],
+            "rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p95_ms": round(percentile(samples, 95), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+        }
+        for route, samples in sorted(latencies.items())
+    }
+    total = sum(len(samples) for samples in latencies.values())
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "requests": total,
+        "errors": sum(errors.values()),
+        "throughput_rps": round(total / elapsed, 2),
+        "routes": routes,
+    }
+
+
+def asgi_session_dependency(db_path):
+    """A get_db override bound to db_path, for whichever DB mode the app was imported with."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.config import DB_MODE
+    from app.database import configure_engine, engine_options
+
+    if DB_MODE == "async":
+        url = f"sqlite+aiosqlite:///{db_path}"
+        engine = create_async_engine(url, **engine_options(url))
+        configure_engine(engine.sync_engine)
+        factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+        async def get_db():
+            async with factory() as db:
+                yield db
+
+        return get_db
+
+    url = f"sqlite:///{db_path}"
+    factory = sessionmaker(
+        bind=configure_engine(create_engine(url, **engine_options(url))),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    def get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return get_db
+
+
+async def run_asgi(db_path, args, mix):
+    from app.main import app
+    from app.routers.sessions import get_db
+
+    app.dependency_overrides[get_db] = asgi_session_dependency(db_path)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            return await drive(client, mix, args.concurrency, args.duration, args.seed)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+async def run_uvicorn(args, mix):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=120
+    ) as client:
+        return await drive(client, mix, args.concurrency, args.duration, args.seed)
+
+
+def print_report(target, result):
+    print(f"\n[{target}] {result['throughput_rps']:.1f} req/s, {result['errors']} errors")
+    print(f"{'route':<32} {'count':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, stats in result["routes"].items():
+        print(
+            f"{route:<32} {stats['count']:>7} {stats['rps']:>8.1f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+
+
+def print_comparison(baseline, current):
+    print(f"\nvs {baseline['commit']} ({baseline['timestamp']}): p95 change per route")
+    for target, result in current["targets"].items():
+        old = baseline["targets"].get(target)
+        if not old:
+            continue
+        for route, stats in result["routes"].items():
+            before = old["routes"].get(route)
+            if before and before["p95_ms"]:
+                change = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+                print(f"  [{target}] {route:<32} {before['p95_ms']:>8.2f} -> {stats['p95_ms']:>8.2f} ms ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10_000, help="e.g. 10000 / 100000 / 1000000")
+    parser.add_argument("--interruptions", type=int, default=1, help="average pauses per seeded session")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--target", choices=("asgi", "uvicorn", "both"), default="both")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument(
+        "--db-mode", choices=("sync", "async"), default="sync",
+        help="uvicorn only; the in-process app uses DEEPWORK_DB_MODE from the environment",
+    )
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/workload-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="earlier result file to diff p95 against")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {
+            "sessions": args.sessions,
+            "interruptions": args.interruptions,
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "workers": args.workers,
+            "db_mode": args.db_mode,
+            "seed": args.seed,
+        },
+        "targets": {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seeded = os.path.join(tmp, "seed.db")
+        started = time.perf_counter()
+        seed_database(seeded, args.sessions, args.interruptions, seed=args.seed)
+        print(f"seeded {args.sessions} sessions in {time.perf_counter() - started:.1f}s")
+
+        # Every target starts from an identical copy of the seeded file
+        if args.target in ("asgi", "both"):
+            db_path = os.path.join(tmp, "asgi.db")
+            shutil.copy(seeded, db_path)
+            results["targets"]["asgi"] = asyncio.run(run_asgi(db_path, args, args.mix))
+            print_report("asgi", results["targets"]["asgi"])
+
+        if args.target in ("uvicorn", "both"):
+            db_path = os.path.join(tmp, "uvicorn.db")
+            shutil.copy(seeded, db_path)
+            server = start_server(db_path, args.port, workers=args.workers, DEEPWORK_DB_MODE=args.db_mode)
+            try:
+                results["targets"]["uvicorn"] = asyncio.run(run_uvicorn(args, args.mix))
+            finally:
+                stop_server(server)
+            print_report("uvicorn", results["targets"]["uvicorn"])
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"workload-{results['commit']}-{results['timestamp'].replace(':', '')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as fh:
+        json.dump(results, fh, indent=2)
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as fh:
+            print_comparison(json.load(fh), results)
+
+
+if __name__ == "__main__":
+    main()
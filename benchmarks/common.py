@@ -0,0 +1,87 @@
+"""Shared helpers for the benchmark scripts: scratch databases and uvicorn servers."""
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from app.database import Base  # noqa: E402
+from app.models import Session  # noqa: E402
+from app.tools.seed import seed as seed_sessions  # noqa: E402
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def prepare_database(path, sessions):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    if not sessions:
+        engine.dispose()
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Session),
+            [
+                {"title": f"Bench {i}", "goal": "Benchmark", "scheduled_duration": 30, "status": "scheduled"}
+                for i in range(sessions)
+            ],
+        )
+    engine.dispose()
+
+
+def seed_database(path, sessions, interruptions_per_session=1, seed=0):
+    """Bulk-load `sessions` rows in mixed states, with interruptions (see app.tools.seed)."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    # anchored at the real date, so current-week reads in the workloads find rows
+    seed_sessions(engine, sessions, seed=seed, now=datetime.utcnow(), pause_mean=interruptions_per_session)
+    engine.dispose()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def start_server(db_path, port, workers=1, **env_overrides):
+    env = dict(os.environ, DEEPWORK_DATABASE_URL=f"sqlite:///{db_path}", **env_overrides)
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=0.5)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError(f"uvicorn did not start on port {port}")
+
+
+def stop_server(process):
+    process.terminate()
+    process.wait()
@@ -0,0 +1,105 @@
+"""Mixed read/write load against SQLite before and after the connection tuning.
+
+"before" runs the server with the old rollback journal (DELETE, synchronous=FULL,
+default cache/mmap); "after" uses the defaults from app/config.py (WAL,
+synchronous=NORMAL, larger cache, mmap). Both run several uvicorn workers so
+writers in one process contend with readers in another.
+
+    python benchmarks/load_sqlite_contention.py --workers 4 --writers 16 --readers 32 --duration 15
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from common import percentile, prepare_database, start_server, stop_server
+
+PROFILES = {
+    "before": {
+        "DEEPWORK_SQLITE_JOURNAL_MODE": "DELETE",
+        "DEEPWORK_SQLITE_SYNCHRONOUS": "FULL",
+        "DEEPWORK_SQLITE_MMAP_SIZE": "0",
+        "DEEPWORK_SQLITE_CACHE_SIZE": "-2000",
+    },
+    "after": {},
+}
+
+
+async def run_load(base_url, writers, readers, duration):
+    latencies = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+
+    async def timed(request):
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            response = await request
+            failed = response.status_code >= 500
+        except httpx.HTTPError:
+            response, failed = None, True
+        latencies.append(time.perf_counter() - started)
+        if failed:
+            errors += 1
+        return response
+
+    async def writer(client, n):
+        while time.perf_counter() < stop_at:
+            created = await timed(client.post("/sessions/", json={"title": f"Load {n}", "scheduled_duration": 30}))
+            if created is None or created.status_code != 200:
+                continue
+            session_id = created.json()["id"]
+            await timed(client.patch(f"/sessions/{session_id}/start"))
+            await timed(client.patch(f"/sessions/{session_id}/pause", json={"reason": "load"}))
+            await timed(client.patch(f"/sessions/{session_id}/resume"))
+            await timed(client.patch(f"/sessions/{session_id}/complete"))
+
+    async def reader(client):
+        while time.perf_counter() < stop_at:
+            await timed(client.get("/sessions/history", params={"limit": 100}))
+            await timed(client.get("/sessions/weekly-report"))
+
+    limits = httpx.Limits(max_connections=writers + readers)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await asyncio.gather(
+            *(writer(client, n) for n in range(writers)),
+            *(reader(client) for _ in range(readers)),
+        )
+
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--readers", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    print(f"{'profile':<8} {'requests':>9} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, env in PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "load.db")
+            prepare_database(db_path, args.sessions)
+            server = start_server(db_path, args.port, workers=args.workers, **env)
+            try:
+                latencies, errors = asyncio.run(
+                    run_load(f"http://127.0.0.1:{args.port}", args.writers, args.readers, args.duration)
+                )
+            finally:
+                stop_server(server)
+
+        print(
+            f"{name:<8} {len(latencies):>9} {errors:>7} "
+            f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 99) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,3 @@
-from .client import DeepWorkClient
\ No newline at end of file
+from .client import DeepWorkClient
+from .async_client import AsyncDeepWorkClient
+from .mirror import SessionMirror, AsyncSessionMirror
\ No newline at end of file
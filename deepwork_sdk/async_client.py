@@ -0,0 +1,176 @@
+import asyncio
+
+import httpx
+
+from .client import IDEMPOTENT_METHODS, RETRY_STATUSES, _ConditionalCache, _EventParser, _archived, _params
+from .mirror import AsyncSessionMirror
+
+
+class AsyncDeepWorkClient:
+    """asyncio counterpart of DeepWorkClient, for driving many sessions concurrently.
+
+        async with AsyncDeepWorkClient() as client:
+            sessions = await asyncio.gather(*(client.create_session(t, None, 30) for t in titles))
+    """
+
+    def __init__(
+        self,
+        base_url="http://127.0.0.1:8000",
+        pool_size=10,
+        timeout=10.0,
+        retries=3,
+        backoff_factor=0.2,
+        transport=None,
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=transport,
+        )
+        self._cache = _ConditionalCache()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _request(self, method, path, **kwargs):
+        attempts = self.retries + 1 if method in IDEMPOTENT_METHODS else 1
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    return response
+
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+    async def _get_cached(self, path, params):
+        key = self._cache.key(path, params)
+        entry = self._cache.lookup(key)
+        response = await self._request("GET", path, params=params, headers=self._cache.headers(entry))
+        return self._cache.resolve(key, entry, response)
+
+    async def create_session(self, title, goal, scheduled_duration):
+        response = await self._request(
+            "POST",
+            "/sessions/",
+            json={
+                "title": title,
+                "goal": goal,
+                "scheduled_duration": scheduled_duration,
+            },
+        )
+        return response.json()
+
+    async def start_session(self, session_id):
+        return (await self._request("PATCH", f"/sessions/{session_id}/start")).json()
+
+    async def pause_session(self, session_id, reason):
+        response = await self._request(
+            "PATCH",
+            f"/sessions/{session_id}/pause",
+            json={"reason": reason},
+        )
+        return response.json()
+
+    async def resume_session(self, session_id):
+        return (await self._request("PATCH", f"/sessions/{session_id}/resume")).json()
+
+    async def complete_session(self, session_id):
+        return (await self._request("PATCH", f"/sessions/{session_id}/complete")).json()
+
+    async def batch(self, items):
+        response = await self._request(
+            "POST",
+            "/sessions/batch",
+            json={"items": list(items)},
+        )
+        return response.json()
+
+    async def get_history(self, limit=None, cursor=None, **filters):
+        return await self._get_cached(
+            "/sessions/history",
+            _params(limit=limit, cursor=cursor, **filters),
+        )
+
+    async def iter_history(self, page_size=100, **filters):
+        """Async generator over every matching session, page by page."""
+        params = _params(limit=page_size, **filters)
+
+        while True:
+            response = await self._request("GET", "/sessions/history", params=params)
+            for item in response.json():
+                yield item
+
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+    async def search(self, q, limit=None):
+        response = await self._request("GET", "/sessions/search", params=_params(q=q, limit=limit))
+        response.raise_for_status()
+        return response.json()
+
+    async def iter_search(self, q, page_size=None):
+        """Async generator over every match for q in rank order, page by page."""
+        params = _params(q=q, limit=page_size)
+
+        while True:
+            response = await self._request("GET", "/sessions/search", params=params)
+            response.raise_for_status()
+            for item in response.json():
+                yield item
+
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+    async def get_changes(self, since="0", limit=None):
+        response = await self._request("GET", "/sessions/changes", params=_params(since=since, limit=limit))
+        response.raise_for_status()
+        return response.json()
+
+    def mirror(self, page_size=None):
+        return AsyncSessionMirror(self, page_size)
+
+    async def get_weekly_report(self, date_from=None, date_to=None):
+        return await self._get_cached(
+            "/sessions/weekly-report",
+            _params(**{"from": date_from, "to": date_to}),
+        )
+
+    async def export_csv(self, include_archived=False):
+        return await self._request("GET", "/sessions/export", params=_archived(include_archived))
+
+    async def export_arrow(self, table="sessions", include_archived=False):
+        import pyarrow
+
+        response = await self._request(
+            "GET", "/sessions/export", params={"format": "arrow", "table": table, **_archived(include_archived)}
+        )
+        response.raise_for_status()
+        return pyarrow.ipc.open_stream(response.content).read_all()
+
+    async def subscribe(self):
+        """Async generator over live change events from /sessions/events."""
+        parser = _EventParser()
+        async with self.client.stream("GET", "/sessions/events", timeout=httpx.Timeout(None)) as response:
+            async for line in response.aiter_lines():
+                event = parser.feed(line)
+                if event is not None:
+                    yield event
@@ -1,13 +1,144 @@
+import json
+import threading
+from collections import OrderedDict
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .mirror import SessionMirror
+
+# Only calls that are safe to repeat are retried; transitions are not
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = (502, 503, 504)
+CONDITIONAL_CACHE_SIZE = 128
+
+
+def _params(**params):
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _archived(include_archived):
+    return {"include_archived": "true"} if include_archived else {}
+
+
+class _ConditionalCache:
+    """Remembers the last ETag and body per GET so unchanged reads come back as 304s.
+
+    Shared by every thread using a client: a request carries the (etag, body)
+    entry it looked up, so a 304 is answered from that entry even if another
+    thread evicted or replaced it meanwhile.
+    """
+
+    def __init__(self, maxsize=CONDITIONAL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(path, params):
+        return path, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def lookup(self, key):
+        with self.lock:
+            return self.entries.get(key)
+
+    @staticmethod
+    def headers(entry):
+        return {"If-None-Match": entry[0]} if entry else {}
+
+    def resolve(self, key, entry, response):
+        if response.status_code == 304 and entry is not None:
+            with self.lock:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+            return entry[1]
+
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag and response.status_code == 200:
+            with self.lock:
+                self.entries[key] = (etag, body)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return body
+
+
+class _EventParser:
+    """Turns Server-Sent Events lines into decoded event dicts."""
+
+    def __init__(self):
+        self.data = []
+
+    def feed(self, line):
+        if line:
+            field, _, value = line.partition(":")
+            if field == "data":
+                self.data.append(value[1:] if value.startswith(" ") else value)
+            return None
+
+        # blank line dispatches the event (comments/heartbeats carry no data)
+        if not self.data:
+            return None
+        event = json.loads("\n".join(self.data))
+        self.data = []
+        return event
 
 
 class DeepWorkClient:
-    def __init__(self, base_url="http://127.0.0.1:8000"):
+    def __init__(
+        self,
+        base_url="http://127.0.0.1:8000",
+        pool_size=10,
+        timeout=10.0,
+        retries=3,
+        backoff_factor=0.2,
+    ):
         self.base_url = base_url
+        self.timeout = timeout
+
+        # One keep-alive connection pool for every call made by this client
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=IDEMPOTENT_METHODS,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._cache = _ConditionalCache()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def _get_cached(self, path, params):
+        key = self._cache.key(path, params)
+        entry = self._cache.lookup(key)
+        response = self._request("GET", path, params=params, headers=self._cache.headers(entry))
+        return self._cache.resolve(key, entry, response)
 
     def create_session(self, title, goal, scheduled_duration):
-        response = requests.post(
-            f"{self.base_url}/sessions/",
+        response = self._request(
+            "POST",
+            "/sessions/",
             json={
                 "title": title,
                 "goal": goal,
@@ -17,37 +148,112 @@ class DeepWorkClient:
         return response.json()
 
     def start_session(self, session_id):
-        return requests.patch(
-            f"{self.base_url}/sessions/{session_id}/start"
-        ).json()
+        return self._request("PATCH", f"/sessions/{session_id}/start").json()
 
     def pause_session(self, session_id, reason):
-        return requests.patch(
-            f"{self.base_url}/sessions/{session_id}/pause",
+        return self._request(
+            "PATCH",
+            f"/sessions/{session_id}/pause",
             json={"reason": reason},
         ).json()
 
     def resume_session(self, session_id):
-        return requests.patch(
-            f"{self.base_url}/sessions/{session_id}/resume"
-        ).json()
+        return self._request("PATCH", f"/sessions/{session_id}/resume").json()
 
     def complete_session(self, session_id):
-        return requests.patch(
-            f"{self.base_url}/sessions/{session_id}/complete"
-        ).json()
+        return self._request("PATCH", f"/sessions/{session_id}/complete").json()
 
-    def get_history(self):
-        return requests.get(
-            f"{self.base_url}/sessions/history"
-        ).json()
+    def batch(self, items):
+        """Apply many creates/transitions in one request and one transaction.
 
-    def get_weekly_report(self):
-        return requests.get(
-            f"{self.base_url}/sessions/weekly-report"
+        items: dicts like {"op": "create", "title": ..., "scheduled_duration": ...}
+        or {"op": "start" | "pause" | "resume" | "complete", "id": ..., "reason": ...}.
+        Returns one result per item, in order.
+        """
+        return self._request(
+            "POST",
+            "/sessions/batch",
+            json={"items": list(items)},
         ).json()
 
-    def export_csv(self):
-        return requests.get(
-            f"{self.base_url}/sessions/export"
-        )
\ No newline at end of file
+    def get_history(self, limit=None, cursor=None, **filters):
+        return self._get_cached(
+            "/sessions/history",
+            _params(limit=limit, cursor=cursor, **filters),
+        )
+
+    def iter_history(self, page_size=100, **filters):
+        """Yield every matching session, following X-Next-Cursor page by page."""
+        params = _params(limit=page_size, **filters)
+
+        while True:
+            response = self._request("GET", "/sessions/history", params=params)
+            yield from response.json()
+
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+    def search(self, q, limit=None):
+        """Best-matching sessions for q (titles, goals, interruption reasons), highest score first."""
+        response = self._request("GET", "/sessions/search", params=_params(q=q, limit=limit))
+        response.raise_for_status()
+        return response.json()
+
+    def iter_search(self, q, page_size=None):
+        """Yield every match for q in rank order, following X-Next-Cursor page by page."""
+        params = _params(q=q, limit=page_size)
+
+        while True:
+            response = self._request("GET", "/sessions/search", params=params)
+            response.raise_for_status()
+            yield from response.json()
+
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+    def get_changes(self, since="0", limit=None):
+        """Sessions and interruptions written after token `since`, and the token to pass next."""
+        response = self._request("GET", "/sessions/changes", params=_params(since=since, limit=limit))
+        response.raise_for_status()
+        return response.json()
+
+    def mirror(self, page_size=None):
+        """A SessionMirror over this client; call .sync() to bring it up to date."""
+        return SessionMirror(self, page_size)
+
+    def get_weekly_report(self, date_from=None, date_to=None):
+        return self._get_cached(
+            "/sessions/weekly-report",
+            _params(**{"from": date_from, "to": date_to}),
+        )
+
+    def export_csv(self, include_archived=False):
+        return self._request("GET", "/sessions/export", params=_archived(include_archived))
+
+    def export_arrow(self, table="sessions", include_archived=False):
+        """Load sessions (or interruptions) straight into a pyarrow.Table, typed, with UTC timestamps."""
+        import pyarrow
+
+        response = self._request(
+            "GET", "/sessions/export", params={"format": "arrow", "table": table, **_archived(include_archived)}
+        )
+        response.raise_for_status()
+        return pyarrow.ipc.open_stream(response.content).read_all()
+
+    def subscribe(self):
+        """Yield live change events from /sessions/events.
+
+        Each event is {"type": "session", "action": ..., "version": ..., "session": {...}}
+        with the same fields as a history row, or {"type": "resync"} when the
+        server dropped events and a fresh get_history() snapshot is needed.
+        """
+        parser = _EventParser()
+        with self._request("GET", "/sessions/events", stream=True, timeout=(self.timeout, None)) as response:
+            for line in response.iter_lines(decode_unicode=True):
+                event = parser.feed(line)
+                if event is not None:
+                    yield event
@@ -0,0 +1,59 @@
+class _MirrorState:
+    """Sessions and interruptions by id, plus the token of the last page applied."""
+
+    def __init__(self, page_size=None):
+        self.page_size = page_size
+        self.token = "0"
+        self.sessions = {}
+        self.interruptions = {}
+
+    def apply(self, page):
+        for session in page["sessions"]:
+            self.sessions[session["id"]] = session
+        for interruption in page["interruptions"]:
+            self.interruptions[interruption["id"]] = interruption
+        self.token = page["token"]
+        return len(page["sessions"]) + len(page["interruptions"])
+
+    def interruptions_for(self, session_id):
+        return sorted(
+            (item for item in self.interruptions.values() if item["session_id"] == session_id),
+            key=lambda item: item["id"],
+        )
+
+
+class SessionMirror(_MirrorState):
+    """Local copy of every session, kept current from /sessions/changes.
+
+        mirror = client.mirror()
+        mirror.sync()  # first call pulls everything, later calls only what changed
+    """
+
+    def __init__(self, client, page_size=None):
+        super().__init__(page_size)
+        self.client = client
+
+    def sync(self):
+        """Pull every change since the last sync; returns the number of rows applied."""
+        applied = 0
+        while True:
+            page = self.client.get_changes(since=self.token, limit=self.page_size)
+            applied += self.apply(page)
+            if not page["has_more"]:
+                return applied
+
+
+class AsyncSessionMirror(_MirrorState):
+    """SessionMirror for AsyncDeepWorkClient."""
+
+    def __init__(self, client, page_size=None):
+        super().__init__(page_size)
+        self.client = client
+
+    async def sync(self):
+        applied = 0
+        while True:
+            page = await self.client.get_changes(since=self.token, limit=self.page_size)
+            applied += self.apply(page)
+            if not page["has_more"]:
+                return applied
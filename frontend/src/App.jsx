@@ -5,6 +5,11 @@ import ActiveSession from "./components/ActiveSession";
 
 const API = "http://127.0.0.1:8000";
 
+// Our own actions always re-fetch, so they show up even when another worker
+// handled them (each worker streams only its own events). With Server-Sent Events
+// the list is also patched from /sessions/events deltas written by other clients.
+const LIVE_UPDATES = typeof EventSource !== "undefined";
+
 function App() {
   const [title, setTitle] = useState("");
   const [goal, setGoal] = useState("");
@@ -42,6 +47,48 @@ function App() {
     fetchWeekly();
   }, []);
 
+  /* ================= LIVE UPDATES (SSE) ================= */
+
+  useEffect(() => {
+    if (!LIVE_UPDATES) return undefined;
+
+    const source = new EventSource(`${API}/sessions/events`);
+    let connectedBefore = false;
+
+    source.onopen = () => {
+      // After a reconnect we may have missed deltas: take one fresh snapshot
+      if (connectedBefore) {
+        fetchHistory();
+        fetchWeekly();
+      }
+      connectedBefore = true;
+    };
+
+    source.addEventListener("session", (e) => {
+      const { action, session } = JSON.parse(e.data);
+
+      setHistory((prev) => {
+        const index = prev.findIndex((item) => item.id === session.id);
+        if (index === -1) return [session, ...prev];
+
+        const updated = [...prev];
+        updated[index] = session;
+        return updated;
+      });
+
+      if (action !== "start" && action !== "resume") {
+        fetchWeekly();
+      }
+    });
+
+    source.addEventListener("resync", () => {
+      fetchHistory();
+      fetchWeekly();
+    });
+
+    return () => source.close();
+  }, []);
+
   /* ================= REAL TIMER (FIXED UTC ISSUE) ================= */
 
   useEffect(() => {
@@ -242,7 +289,7 @@ function App() {
         <div className="section history-section">
           <h2>Session History</h2>
           <div className="history-scroll-container">
-            {history.filter(item => ["completed", "overdue", "interrupted"].includes(item.status)).map((item) => (
+            {history.filter(item => ["completed", "overdue", "interrupted", "abandoned"].includes(item.status)).map((item) => (
               <div className="history-item" key={item.id}>
                 <div className="top-row">
                   <strong>{item.title}</strong>
@@ -255,7 +302,7 @@ function App() {
                 </div>
               </div>
             ))}
-            {history.filter(item => ["completed", "overdue", "interrupted"].includes(item.status)).length === 0 && (
+            {history.filter(item => ["completed", "overdue", "interrupted", "abandoned"].includes(item.status)).length === 0 && (
               <p className="empty-msg">No history records yet.</p>
             )}
           </div>
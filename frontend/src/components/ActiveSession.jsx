@@ -23,6 +23,11 @@ const ActiveSession = ({
         <span className={`badge ${item.status}`}>
           {item.status}
         </span>
+
+        {/* Still running, but past 110% of the schedule (flagged by the sweeper) */}
+        {item.overdue_at && (
+          <span className="badge overdue">overdue</span>
+        )}
       </div>
 
       {item.status === "active" && (
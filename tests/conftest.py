@@ -1,25 +1,33 @@
 import sys
 import os
+import shutil
+import tempfile
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app.database import Base
+from fastapi.testclient import TestClient
+from app.cache import cache
+from app.database import Base, configure_engine
 from app.models import Session, Interruption
+from app.main import app
+from app.routers.sessions import get_db
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Create test database (in memory)
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Create test database (scratch file, so concurrent API worker threads each get their own connection)
+TEST_DB_DIR = tempfile.mkdtemp(prefix="deepwork-tests-")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(TEST_DB_DIR, 'test.db')}"
 
-engine = create_engine(
+engine = configure_engine(create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False}
-)
+))
 
 TestingSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,  # same as app.database.SessionLocal
     bind=engine
 )
 
@@ -27,10 +35,62 @@ TestingSessionLocal = sessionmaker(
 Base.metadata.create_all(bind=engine)
 
 
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[get_db] = override_get_db
+
+
+# Stands in for the SessionCreate schema when calling create_session directly
+class MockSessionData:
+    def __init__(self, title, goal, scheduled_duration):
+        self.title = title
+        self.goal = goal
+        self.scheduled_duration = scheduled_duration
+
+
+def pytest_sessionfinish(session, exitstatus):
+    engine.dispose()
+    shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # some tests write rows directly through db_session, which bypasses invalidation
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
 @pytest.fixture
 def db_session():
     db = TestingSessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@pytest.fixture
+def sql_statements():
+    """Collects every SQL statement sent to the test engine."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+from app.models import Session
+from app.services.analytics_services import get_analytics
+
+
+def _add(db, **fields):
+    db.add(Session(title="Analytics", scheduled_duration=30, **fields))
+
+
+def test_analytics_statistics(db_session):
+    db_session.query(Session).delete()
+    now = datetime(2026, 3, 10, 4, 30)  # 10:00 IST
+    for i in range(10):
+        _add(db_session, status="completed", focus_score=90.0 + i, completion_ratio=1.0,
+             pause_count=1, start_time=now, created_at=now - timedelta(days=i % 3))
+    _add(db_session, status="interrupted", focus_score=40.0, pause_count=4,
+         start_time=now + timedelta(hours=5), created_at=now)
+    _add(db_session, status="scheduled", focus_score=None, created_at=now)
+    db_session.commit()
+
+    stats = get_analytics(db_session, days=3, window=2)
+
+    assert stats["sessions"] == 12
+    assert stats["focus_score"]["count"] == 11
+    assert stats["focus_score"]["max"] == 99.0
+    assert stats["focus_score"]["p50"] == 94.0
+    assert stats["completion_ratio"]["mean"] == 1.0
+
+    assert stats["by_status"]["completed"]["count"] == 10
+    assert stats["by_status"]["interrupted"]["avg_pause_count"] == 4.0
+    assert stats["by_status"]["scheduled"]["avg_focus_score"] is None
+
+    by_hour = {row["hour"]: row for row in stats["by_hour"]}
+    assert by_hour[10]["sessions"] == 10 and by_hour[10]["completion_rate"] == 1.0
+    assert by_hour[15]["sessions"] == 1 and by_hour[15]["completion_rate"] == 0.0
+
+    assert sum(b["sessions"] for b in stats["focus_distribution"]) == 11
+    assert stats["focus_distribution"][-1]["sessions"] == 10
+
+    rolling = stats["rolling_focus"]
+    assert [row["date"] for row in rolling] == ["2026-03-08", "2026-03-09", "2026-03-10"]
+    assert rolling[-1]["sessions"] == 6
+    # 2-day window over the last two days: all scored sessions created on the 9th and 10th
+    assert rolling[-1]["rolling_avg_focus_score"] == round((90 + 93 + 96 + 99 + 40 + 91 + 94 + 97) / 8, 2)
+
+
+def test_analytics_endpoint(client, db_session):
+    db_session.query(Session).delete()
+    db_session.commit()
+
+    assert client.get("/sessions/analytics").json()["sessions"] == 0
+
+    client.post("/sessions/", json={"title": "Analytics API", "scheduled_duration": 30})
+    body = client.get("/sessions/analytics", params={"days": 7}).json()
+
+    assert body["sessions"] == 1
+    assert body["by_status"]["scheduled"]["avg_focus_score"] == 100.0
+    assert len(body["rolling_focus"]) == 7
+    assert client.get("/sessions/analytics", params={"window": 0}).status_code == 422
@@ -0,0 +1,150 @@
+import csv
+import io
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func, select
+
+from app.database import Base
+from app.models import ArchivedInterruption, ArchivedSession, Interruption, Session
+from app.services.analytics_services import get_analytics
+from app.services.session_services import (
+    archive_sessions,
+    create_session,
+    export_sessions_csv,
+    get_session_history_page,
+    get_weekly_report,
+    start_session,
+)
+from app.sweeper import Sweeper
+from app.tools.archive import main
+from conftest import MockSessionData, TestingSessionLocal
+
+
+def _reset(db):
+    for model in (Interruption, Session, ArchivedInterruption, ArchivedSession):
+        db.query(model).delete()
+    db.commit()
+
+
+def _add(db, title, status, age_days, end_time=True, pauses=0):
+    created = datetime.utcnow() - timedelta(days=age_days)
+    session = Session(
+        title=title, status=status, scheduled_duration=30, created_at=created,
+        start_time=created, end_time=created + timedelta(minutes=30) if end_time else None,
+    )
+    db.add(session)
+    db.flush()
+    for n in range(pauses):
+        db.add(Interruption(session_id=session.id, reason=f"Pause {n}", pause_time=created))
+    db.commit()
+    return session.id
+
+
+def test_archive_moves_old_finished_sessions_in_chunks(db_session):
+    _reset(db_session)
+    old = [_add(db_session, f"Old {i}", "completed", 100, pauses=2) for i in range(3)]
+    still_running = _add(db_session, "Still running", "active", 100, end_time=False)
+    recent = _add(db_session, "Recent", "completed", 1)
+    cutoff = datetime.utcnow() - timedelta(days=90)
+
+    assert archive_sessions(db_session, cutoff, 2) == 2
+    assert archive_sessions(db_session, cutoff, 2) == 1
+    assert archive_sessions(db_session, cutoff, 2) == 0
+
+    hot = set(db_session.scalars(select(Session.id)))
+    assert hot == {still_running, recent}
+    assert set(db_session.scalars(select(ArchivedSession.id))) == set(old)
+    assert db_session.scalar(select(func.count()).select_from(ArchivedInterruption)) == 6
+    assert db_session.scalar(select(func.count()).select_from(Interruption)) == 0
+
+    # ids are never handed out again, even though the highest ones were archived
+    assert create_session(db_session, MockSessionData("New", None, 30)).id > max(old)
+    with pytest.raises(HTTPException) as exc:
+        start_session(db_session, old[0])
+    assert exc.value.status_code == 404
+
+
+def test_history_and_export_include_archived_only_when_asked(client, db_session):
+    _reset(db_session)
+    archived = [_add(db_session, f"Cold {i}", "completed", 200) for i in range(2)]
+    hot = [_add(db_session, f"Hot {i}", "completed", 1) for i in range(2)]
+    archive_sessions(db_session, datetime.utcnow() - timedelta(days=90), 100)
+
+    items, _ = get_session_history_page(db_session)
+    assert [item["id"] for item in items] == hot[::-1]
+
+    # keyset paging runs across both tables, newest first
+    seen, cursor = [], None
+    while True:
+        items, cursor = get_session_history_page(db_session, limit=3, cursor=cursor, include_archived=True)
+        seen += [item["id"] for item in items]
+        if cursor is None:
+            break
+    assert seen == (archived + hot)[::-1]
+
+    filtered, _ = get_session_history_page(db_session, include_archived=True, title_prefix="Cold")
+    assert [item["id"] for item in filtered] == archived[::-1]
+
+    rows = list(csv.reader(io.StringIO("".join(export_sessions_csv(db_session, include_archived=True)))))
+    assert [int(row[0]) for row in rows[1:]] == archived + hot
+
+    response = client.get("/sessions/history", params={"include_archived": "true"})
+    assert [item["id"] for item in response.json()] == (archived + hot)[::-1]
+    assert "Cold 0" not in client.get("/sessions/export").text
+    assert "Cold 0" in client.get("/sessions/export", params={"include_archived": "true"}).text
+
+
+def test_weekly_trend_counts_archived_weeks(db_session):
+    _reset(db_session)
+    _add(db_session, "Cold week", "completed", 200)
+    _add(db_session, "Hot week", "completed", 1)
+    today = datetime.utcnow().date()
+    trend = lambda: get_weekly_report(db_session, date_from=today - timedelta(weeks=51), date_to=today)
+
+    before = trend()
+    archive_sessions(db_session, datetime.utcnow() - timedelta(days=90), 100)
+
+    assert trend() == before
+    assert sum(week["completed_sessions"] for week in before) == 2
+
+
+def test_analytics_counts_archived_sessions_only_when_asked(db_session):
+    _reset(db_session)
+    _add(db_session, "Cold", "completed", 200)
+    _add(db_session, "Hot", "completed", 1)
+    archive_sessions(db_session, datetime.utcnow() - timedelta(days=90), 100)
+
+    assert get_analytics(db_session)["sessions"] == 1
+    assert get_analytics(db_session, include_archived=True)["sessions"] == 2
+
+
+def test_sweeper_archives_when_configured(db_session):
+    _reset(db_session)
+    old = _add(db_session, "Swept to archive", "completed", 40)
+
+    assert "archived" not in Sweeper(TestingSessionLocal).run_once()
+    swept = Sweeper(TestingSessionLocal, archive_after=timedelta(days=30), archive_batch_size=1).run_once()
+
+    assert swept["archived"] == 1
+    assert db_session.get(ArchivedSession, old) is not None
+
+
+def test_archive_cli(tmp_path, capsys):
+    url = f"sqlite:///{tmp_path / 'archive.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Session.__table__.insert(), [
+            {"title": f"CLI {i}", "status": "completed", "scheduled_duration": 30,
+             "created_at": datetime.utcnow() - timedelta(days=400)}
+            for i in range(5)
+        ])
+
+    main(["--database-url", url, "--older-than-days", "365", "--batch-size", "2"])
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(ArchivedSession)).scalar() == 5
+    engine.dispose()
+    assert "done: 5 sessions archived" in capsys.readouterr().out
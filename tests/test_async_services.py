@@ -0,0 +1,80 @@
+import asyncio
+import csv
+import io
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.services import async_session_services as services
+from conftest import MockSessionData
+
+
+def run_with_db(scenario):
+    async def _run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        try:
+            async with session_factory() as db:
+                return await scenario(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_run())
+
+
+def test_async_lifecycle():
+    async def scenario(db):
+        session = await services.create_session(db, MockSessionData("Async", "Goal", 30))
+        await services.start_session(db, session.id)
+        await services.pause_session(db, session.id, "Coffee")
+        await services.resume_session(db, session.id)
+        completed = await services.complete_session(db, session.id)
+        history = await services.get_session_history(db)
+        return completed, history
+
+    completed, history = run_with_db(scenario)
+
+    assert completed.status == "completed"
+    assert history[0]["pause_count"] == 1
+
+
+def test_async_errors():
+    async def scenario(db):
+        await services.start_session(db, 999)
+
+    with pytest.raises(HTTPException) as exc:
+        run_with_db(scenario)
+    assert exc.value.status_code == 404
+
+
+def test_async_weekly_report_and_export():
+    async def scenario(db):
+        await services.create_session(db, MockSessionData("Export me", None, 30))
+        report = await services.get_weekly_report(db)
+        chunks = [chunk async for chunk in services.export_sessions_csv(db)]
+        return report, chunks
+
+    report, chunks = run_with_db(scenario)
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+
+    assert report[0]["total_sessions"] == 1
+    assert rows[0][0] == "ID"
+    assert rows[1][1] == "Export me"
+
+
+def test_async_columnar_export():
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    async def scenario(db):
+        await services.create_session(db, MockSessionData("Parquet me", None, 30))
+        return [chunk async for chunk in services.export_sessions_columnar(db, "parquet")]
+
+    table = pq.read_table(io.BytesIO(b"".join(run_with_db(scenario))))
+
+    assert table.column("title").to_pylist() == ["Parquet me"]
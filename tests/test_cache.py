@@ -0,0 +1,105 @@
+from datetime import date
+
+from app.cache import MemoryBackend, ServiceCache, cache
+from app.models import Session
+from app.services.session_services import (
+    _bump_data_version,
+    _change_seq,
+    create_session,
+    get_session_history,
+    get_weekly_report,
+    start_session,
+)
+from conftest import MockSessionData
+
+
+def test_history_served_from_cache_until_a_write(db_session, sql_statements):
+    create_session(db_session, MockSessionData("Cached", None, 30))
+
+    first = get_session_history(db_session, title_prefix="Cached")
+    sql_statements.clear()
+    second = get_session_history(db_session, title_prefix="Cached")
+
+    assert second == first
+    # only the data_version lookup the cache key is built from
+    assert len(sql_statements) == 1 and "data_version" in sql_statements[0]
+    assert cache.stats()["hits"] == 1
+
+    start_session(db_session, first[0]["id"])
+    third = get_session_history(db_session, title_prefix="Cached")
+
+    assert third[0]["status"] == "active"
+
+
+def test_weekly_report_cached_per_range(db_session):
+    get_weekly_report(db_session)
+    get_weekly_report(db_session)
+    get_weekly_report(db_session, date_from=date(2024, 1, 1), date_to=date(2024, 1, 14))
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_memory_backend_evicts_and_expires():
+    clock = {"ttl": 60}
+    local = ServiceCache(MemoryBackend(maxsize=2), ttl=clock["ttl"], version=lambda db: 0)
+    calls = []
+
+    @local.cached
+    def square(db, n):
+        calls.append(n)
+        return n * n
+
+    for n in (1, 2, 3, 1):
+        square(None, n)
+
+    # 1 was evicted by 3, so it is computed twice
+    assert calls == [1, 2, 3, 1]
+    assert local.stats()["size"] == 2
+
+    local.ttl = -1
+    square(None, 4)
+    square(None, 4)
+    assert calls[-2:] == [4, 4]
+
+
+def test_entries_are_keyed_by_data_version():
+    state = {"version": 1, "rows": 1}
+    local = ServiceCache(MemoryBackend(), version=lambda db: state["version"])
+
+    @local.cached
+    def count(db):
+        return state["rows"]
+
+    assert count(None) == 1
+    # another process writes: nothing in this process calls invalidate()
+    state.update(version=2, rows=2)
+    assert count(None) == 2
+
+
+def test_history_etag_and_body_agree_after_write_that_skips_commit_hook(client, db_session):
+    first = client.get("/sessions/history", params={"title_prefix": "Elsewhere"})
+
+    # what a second worker or a CLI tool does: bump the version and commit, no cache.invalidate()
+    _bump_data_version(db_session)
+    db_session.add(Session(title="Elsewhere", scheduled_duration=10, status="scheduled"))
+    db_session.commit()
+
+    second = client.get(
+        "/sessions/history",
+        params={"title_prefix": "Elsewhere"},
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert len(second.json()) == len(first.json()) + 1
+
+
+def test_reads_inside_a_write_transaction_bypass_the_cache(db_session):
+    # the transaction has bumped the version but not committed
+    _change_seq(db_session)
+    get_session_history(db_session, title_prefix="Uncommitted")
+    db_session.rollback()
+
+    assert cache.stats()["size"] == 0
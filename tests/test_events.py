@@ -0,0 +1,63 @@
+import asyncio
+
+from app.events import EventHub, hub
+from app.services.session_services import create_session, start_session
+from deepwork_sdk.client import _EventParser
+from conftest import MockSessionData
+
+
+def test_hub_delivers_to_subscribers():
+    async def scenario():
+        events = EventHub(queue_size=10)
+        first = events.subscribe()
+        second = events.subscribe()
+
+        events.publish({"type": "session", "n": 1})
+        await asyncio.sleep(0)
+
+        return first[1].get_nowait(), second[1].get_nowait()
+
+    assert asyncio.run(scenario()) == ({"type": "session", "n": 1}, {"type": "session", "n": 1})
+
+
+def test_hub_overflow_asks_for_resync():
+    async def scenario():
+        events = EventHub(queue_size=2)
+        _, queue = events.subscribe()
+
+        for n in range(3):
+            events.publish({"type": "session", "n": n})
+        await asyncio.sleep(0)
+
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [{"type": "resync"}]
+
+
+def test_transitions_publish_deltas(db_session):
+    async def scenario():
+        subscriber = hub.subscribe()
+        try:
+            session = create_session(db_session, MockSessionData("Live", None, 30))
+            start_session(db_session, session.id)
+            await asyncio.sleep(0)
+            _, queue = subscriber
+            return session, [queue.get_nowait() for _ in range(queue.qsize())]
+        finally:
+            hub.unsubscribe(subscriber)
+
+    session, events = asyncio.run(scenario())
+
+    assert [e["action"] for e in events] == ["create", "start"]
+    assert events[1]["session"]["id"] == session.id
+    assert events[1]["session"]["status"] == "active"
+    assert events[1]["version"] == 2
+
+
+def test_sdk_event_parser():
+    parser = _EventParser()
+    lines = ["retry: 3000", "", ": keep-alive", "", "event: session", 'data: {"type": "session", "action": "start"}', ""]
+
+    events = [e for e in map(parser.feed, lines) if e is not None]
+
+    assert events == [{"type": "session", "action": "start"}]
@@ -0,0 +1,41 @@
+import re
+
+from app.metrics import Histogram
+
+
+def _sample(body, name, **labels):
+    selector = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{re.escape(name)}{{{re.escape(selector)}}} (\S+)$", body, re.M)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_metrics_endpoint_reports_routes_and_sql(client):
+    before = client.get("/metrics").text
+
+    assert client.get("/sessions/history").status_code == 200
+    client.get("/sessions/does-not-exist")
+
+    body = client.get("/metrics").text
+    route = {"method": "GET", "route": "/sessions/history"}
+
+    assert _sample(body, "deepwork_http_requests_total", **route, status="200") == \
+        _sample(before, "deepwork_http_requests_total", **route, status="200") + 1
+    assert _sample(body, "deepwork_http_requests_total", method="GET", route="unmatched", status="404") >= 1
+    # history runs at least the data-version lookup
+    assert _sample(body, "deepwork_sql_statements_per_request_sum", **route) >= 1
+    assert _sample(body, "deepwork_http_response_size_bytes_count", **route) >= 1
+    assert "deepwork_http_requests_in_flight 1" in body  # the /metrics call itself
+    assert 'deepwork_cache_requests_total{result="miss"}' in body
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 5))
+    for value in (0.5, 3, 3, 10):
+        histogram.observe(("GET", "/x"), value)
+
+    lines = histogram.render("h", "help", ("method", "route"))
+
+    assert 'h_bucket{method="GET",route="/x",le="1"} 1' in lines
+    assert 'h_bucket{method="GET",route="/x",le="5"} 3' in lines
+    assert 'h_bucket{method="GET",route="/x",le="+Inf"} 4' in lines
+    assert 'h_count{method="GET",route="/x"} 4' in lines
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.profiling import ProfilingMiddleware, _active, in_thread
+
+
+def test_profile_inline_includes_worker_thread_and_sql(tmp_path):
+    client = TestClient(ProfilingMiddleware(app, directory=str(tmp_path)))
+    # warm up first (another cache key), so one-off import and compile work does not crowd the report
+    client.get("/sessions/history", params={"limit": 1})
+
+    response = client.get("/sessions/history", headers={"X-Deepwork-Profile": "inline"})
+
+    assert response.status_code == 200
+    assert response.headers["x-profile-status"] == "200"
+    assert response.headers["content-type"].startswith("text/plain")
+    # the service ran on a threadpool worker, which is profiled too
+    assert "get_session_history_page" in response.text
+    assert "SQL statements" in response.text
+
+
+def test_profile_written_to_directory_for_streamed_export(tmp_path, client):
+    client.post("/sessions/", json={"title": "Profiled", "scheduled_duration": 30})
+    profiled = TestClient(ProfilingMiddleware(app, directory=str(tmp_path)))
+
+    response = profiled.get("/sessions/export", params={"profile": "1"})
+
+    assert response.status_code == 200
+    assert response.text.startswith("ID,")
+    name = response.headers["x-profile"]
+    assert (tmp_path / f"{name}.prof").exists()
+    assert "export_sessions_csv" in (tmp_path / f"{name}.txt").read_text()
+    trace = json.loads((tmp_path / f"{name}.sql.json").read_text())
+    assert any("FROM sessions" in entry["statement"] for entry in trace)
+
+
+def test_untriggered_requests_are_untouched(tmp_path):
+    client = TestClient(ProfilingMiddleware(app, directory=str(tmp_path)))
+
+    response = client.get("/sessions/history")
+
+    assert response.status_code == 200
+    assert "x-profile" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+    assert _active.get() is None
+
+    def fn():
+        return None
+    assert in_thread(fn) is fn
+
+
+def test_sql_trace_not_installed_unless_profiling_enabled():
+    check = (
+        "from sqlalchemy import event; from sqlalchemy.engine import Engine; "
+        "import app.main, app.profiling as p; "
+        "app.main.app.build_middleware_stack(); "
+        "print(event.contains(Engine, 'before_cursor_execute', p._before_cursor_execute))"
+    )
+
+    def installed(enabled):
+        env = {**os.environ, "DEEPWORK_PROFILING_ENABLED": enabled}
+        return subprocess.run([sys.executable, "-c", check], env=env, capture_output=True, text=True).stdout.strip()
+
+    assert installed("0") == "False"
+    assert installed("1") == "True"
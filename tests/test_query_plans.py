@@ -0,0 +1,126 @@
+"""EXPLAIN QUERY PLAN every statement the service layer sends, and fail on full table scans.
+
+Each case runs real service calls, captures the SQL they execute and re-plans it
+with the same parameters, so a dropped index or a rewritten filter shows up here.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select
+
+from app.models import Interruption, Session
+from app.services import session_services as services
+from conftest import MockSessionData, engine
+
+# Cases that read the whole table on purpose
+ALLOWED_SCANS = {
+    "export": "streams every session by design",
+    "history_first_page": "walks the rowid newest-first and stops at LIMIT",
+    "history_archived": "opt-in cold path; merges hot and archived rows newest-first",
+}
+SCANNED_TABLES = ("sessions", "interruptions", "sessions_archive")
+
+
+@pytest.fixture
+def captured():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _lifecycle(db):
+    session = services.create_session(db, MockSessionData("Plan", None, 30))
+    services.start_session(db, session.id)
+    services.pause_session(db, session.id, "Call")
+    services.resume_session(db, session.id)
+    services.complete_session(db, session.id)
+
+
+def _failed_transitions(db):
+    session = services.create_session(db, MockSessionData("Plan fail", None, 30))
+    with pytest.raises(Exception):
+        services.pause_session(db, session.id, "Not active")
+    with pytest.raises(Exception):
+        services.start_session(db, session.id, expected_version=99)
+
+
+def _interruptions(db):
+    session = services.create_session(db, MockSessionData("Plan rel", None, 30))
+    db.execute(
+        select(Interruption)
+        .where(Interruption.session_id == session.id)
+        .order_by(Interruption.pause_time)
+    ).all()
+    db.expire(session)
+    session.interruptions
+
+
+CASES = {
+    "lifecycle": _lifecycle,
+    "failed_transitions": _failed_transitions,
+    "interruptions": _interruptions,
+    "data_version": services.get_data_version,
+    "history_first_page": lambda db: services.get_session_history_page(db, limit=50),
+    "history_cursor": lambda db: services.get_session_history_page(db, limit=50, cursor=10),
+    "history_status": lambda db: services.get_session_history_page(db, limit=50, status=["completed"]),
+    "history_created": lambda db: services.get_session_history_page(
+        db, limit=50, created_from=datetime.utcnow() - timedelta(days=7), created_to=datetime.utcnow()
+    ),
+    "history_archived": lambda db: services.get_session_history_page(db, limit=50, include_archived=True),
+    "archive": lambda db: services.archive_sessions(db, datetime.utcnow() - timedelta(days=30), 50),
+    "history_title": lambda db: services.get_session_history_page(db, limit=50, title_prefix="Plan"),
+    "search": lambda db: services.search_sessions(db, "plan*"),
+    "changes": lambda db: services.get_changes(db, since=services.get_data_version(db) - 1),
+    "changes_mid_write": lambda db: services.get_changes(db, since=f"{services.get_data_version(db) - 1}:0:10"),
+    "sweep_abandoned": lambda db: services.sweep_abandoned(db, datetime.utcnow(), 50),
+    "sweep_overdue": lambda db: services.sweep_overdue(db, datetime.utcnow(), 50),
+    "weekly_report": services.get_weekly_report,
+    "weekly_report_trend": lambda db: services.get_weekly_report(
+        db, date_from=datetime.utcnow().date() - timedelta(weeks=51), date_to=datetime.utcnow().date()
+    ),
+    "export": lambda db: list(services.export_sessions_csv(db)),
+}
+
+
+def _plan(db, statement, parameters):
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[3] for row in rows]
+
+
+def _full_scans(plan):
+    return [
+        detail for detail in plan
+        if detail.startswith("SCAN ") and detail.split()[1] in SCANNED_TABLES
+    ]
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_service_queries_use_indexes(name, db_session, captured):
+    CASES[name](db_session)
+    assert captured, "case executed no SQL"
+
+    scans = {}
+    for statement, parameters in captured:
+        found = _full_scans(_plan(db_session, statement, parameters))
+        if found:
+            scans[statement] = found
+
+    if name in ALLOWED_SCANS:
+        return
+    assert not scans, f"full table scan in {name}: {scans}"
+
+
+def test_redundant_primary_key_index_is_gone():
+    indexed = {tuple(column.name for column in index.columns) for index in Session.__table__.indexes}
+    assert ("id",) not in indexed
+    assert ("session_id", "pause_time") in {
+        tuple(column.name for column in index.columns) for index in Interruption.__table__.indexes
+    }
@@ -0,0 +1,126 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.main import app
+from deepwork_sdk import AsyncDeepWorkClient, DeepWorkClient
+from deepwork_sdk.client import _ConditionalCache
+
+
+def test_client_uses_pooled_session_with_retries():
+    with DeepWorkClient(pool_size=4, retries=2, timeout=3) as client:
+        adapter = client.session.get_adapter("http://127.0.0.1:8000")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 2
+        assert "PATCH" not in adapter.max_retries.allowed_methods
+        assert client.timeout == 3
+
+
+def test_conditional_cache_answers_304_after_concurrent_eviction():
+    cache = _ConditionalCache(maxsize=1)
+    key = cache.key("/sessions/history", {})
+    cache.resolve(key, None, httpx.Response(200, json=["cached"], headers={"ETag": 'W/"1"'}))
+
+    entry = cache.lookup(key)
+    assert cache.headers(entry) == {"If-None-Match": 'W/"1"'}
+    # another thread fills the cache and evicts the entry while the request is in flight
+    cache.resolve(cache.key("/sessions/weekly-report", {}), None,
+                  httpx.Response(200, json=[], headers={"ETag": 'W/"2"'}))
+
+    assert cache.resolve(key, entry, httpx.Response(304)) == ["cached"]
+
+
+def test_async_client_drives_sessions_concurrently():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncDeepWorkClient("http://testserver", transport=transport) as client:
+            created = await asyncio.gather(
+                *(client.create_session(f"Async SDK {i}", None, 30) for i in range(5))
+            )
+            await asyncio.gather(*(client.start_session(s["id"]) for s in created))
+            history = [item async for item in client.iter_history(page_size=2, title_prefix="Async SDK")]
+            return created, history
+
+    created, history = asyncio.run(scenario())
+
+    assert len({s["id"] for s in created}) == 5
+    assert {h["id"] for h in history} >= {s["id"] for s in created}
+    assert all(h["status"] == "active" for h in history)
+
+
+def test_async_client_retries_idempotent_calls():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[])
+
+    async def scenario():
+        async with AsyncDeepWorkClient(
+            "http://testserver", backoff_factor=0, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.get_weekly_report()
+
+    assert asyncio.run(scenario()) == []
+    assert calls == ["GET", "GET"]
+
+
+def test_async_client_revalidates_history_with_etag():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncDeepWorkClient("http://testserver", transport=transport) as client:
+            seen = []
+            client.client.event_hooks["response"].append(lambda r: _record(seen, r))
+
+            first = await client.get_history(limit=5)
+            second = await client.get_history(limit=5)
+            return first, second, seen
+
+    async def _record(seen, response):
+        seen.append(response.status_code)
+
+    first, second, seen = asyncio.run(scenario())
+
+    assert second == first
+    assert seen == [200, 304]
+
+
+def test_async_client_exports_arrow_table():
+    pytest.importorskip("pyarrow")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncDeepWorkClient("http://testserver", transport=transport) as client:
+            await client.create_session("Arrow SDK", None, 30)
+            return await client.export_arrow()
+
+    table = asyncio.run(scenario())
+
+    assert "Arrow SDK" in table.column("title").to_pylist()
+    assert str(table.schema.field("created_at").type) == "timestamp[us, tz=UTC]"
+
+
+def test_async_mirror_pulls_only_changes():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncDeepWorkClient("http://testserver", transport=transport) as client:
+            mirror = client.mirror(page_size=2)
+            await client.create_session("Mirror A", None, 30)
+            created = await client.create_session("Mirror B", None, 30)
+            await mirror.sync()
+
+            await client.start_session(created["id"])
+            await client.pause_session(created["id"], "Call")
+            applied = await mirror.sync()
+            return mirror, created, applied
+
+    mirror, created, applied = asyncio.run(scenario())
+
+    assert applied == 2  # the paused session and its interruption
+    assert mirror.sessions[created["id"]]["status"] == "paused"
+    assert [i["reason"] for i in mirror.interruptions_for(created["id"])] == ["Call"]
+    assert {"Mirror A", "Mirror B"} <= {s["title"] for s in mirror.sessions.values()}
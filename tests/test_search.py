@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+
+from app.cache import cache
+from app.main import app
+from app.models import Interruption, Session
+from app.services.session_services import search_sessions
+from deepwork_sdk import AsyncDeepWorkClient
+
+
+def _reset(db, filler=10):
+    for model in (Interruption, Session):
+        db.query(model).delete()
+    db.commit()
+    # bm25 weighs terms by rarity, so give the corpus some unrelated rows
+    for n in range(filler):
+        _add(db, f"Filler {n}", goal="Nothing to see", reasons=["Coffee"])
+
+
+def _add(db, title, goal=None, reasons=()):
+    session = Session(title=title, goal=goal, status="scheduled", scheduled_duration=30)
+    db.add(session)
+    db.flush()
+    for reason in reasons:
+        db.add(Interruption(session_id=session.id, reason=reason))
+    db.commit()
+    # rows written straight through the session skip the service-layer cache invalidation
+    cache.clear()
+    return session.id
+
+
+def _ids(items):
+    return [item["id"] for item in items]
+
+
+def test_title_matches_rank_above_goal_and_reason_matches(db_session):
+    _reset(db_session)
+    by_reason = _add(db_session, "Inbox zero", reasons=["Kernel build broke"])
+    by_goal = _add(db_session, "Reading", goal="Kernel scheduler chapter")
+    by_title = _add(db_session, "Kernel patch review")
+
+    items, next_cursor = search_sessions(db_session, "kernel")
+
+    assert _ids(items) == [by_title, by_goal, by_reason]
+    assert items[0]["score"] > items[1]["score"] > items[2]["score"] > 0
+    assert next_cursor is None
+
+
+def test_search_stems_and_supports_prefixes(db_session):
+    _reset(db_session)
+    writing = _add(db_session, "Writing the design doc")
+    _add(db_session, "Refactoring")
+
+    assert _ids(search_sessions(db_session, "writes")[0]) == [writing]
+    assert _ids(search_sessions(db_session, "desi*")[0]) == [writing]
+    # every word has to match
+    assert search_sessions(db_session, "design refactoring")[0] == []
+
+
+def test_index_follows_updates_and_deletes(db_session):
+    _reset(db_session)
+    session_id = _add(db_session, "Draft slides", reasons=["Slack ping"])
+
+    session = db_session.get(Session, session_id)
+    session.title = "Quarterly budget"
+    db_session.commit()
+    cache.clear()
+
+    assert search_sessions(db_session, "slides")[0] == []
+    assert _ids(search_sessions(db_session, "budget")[0]) == [session_id]
+    assert _ids(search_sessions(db_session, "slack")[0]) == [session_id]
+
+    db_session.query(Interruption).filter_by(session_id=session_id).delete()
+    db_session.commit()
+    cache.clear()
+    assert search_sessions(db_session, "slack")[0] == []
+
+
+def test_query_syntax_is_treated_as_plain_text(db_session):
+    _reset(db_session)
+    session_id = _add(db_session, 'Fix "NEAR" OR crash in parser')
+
+    for q in ['"near', "OR crash", "parser)", "NEAR(", "*", "-"]:
+        items, _ = search_sessions(db_session, q)
+        assert _ids(items) in ([session_id], [])
+
+    assert _ids(search_sessions(db_session, 'near" OR "crash')[0]) == [session_id]
+
+
+def test_search_endpoint_pages_in_rank_order(client, db_session):
+    _reset(db_session)
+    ids = [_add(db_session, f"Sprint planning {i}", reasons=["planning"] * i) for i in range(5)]
+
+    first = client.get("/sessions/search", params={"q": "planning", "limit": 2})
+    assert first.status_code == 200
+    assert first.headers["X-Next-Cursor"] == "2"
+
+    items = first.json()
+    cursor = first.headers["X-Next-Cursor"]
+    while cursor:
+        page = client.get("/sessions/search", params={"q": "planning", "limit": 2, "cursor": cursor})
+        items += page.json()
+        cursor = page.headers.get("X-Next-Cursor")
+
+    assert sorted(_ids(items)) == sorted(ids)
+    scores = [item["score"] for item in items]
+    assert scores == sorted(scores, reverse=True)
+
+    assert client.get("/sessions/search", params={"q": ""}).status_code == 422
+
+
+def test_async_client_searches():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncDeepWorkClient("http://testserver", transport=transport) as client:
+            created = await client.create_session("Searchable tax return", "File before April", 30)
+            top = await client.search("tax", limit=1)
+            every = [item async for item in client.iter_search("april", page_size=1)]
+            return created, top, every
+
+    created, top, every = asyncio.run(scenario())
+
+    assert _ids(top) == [created["id"]]
+    assert created["id"] in _ids(every)
@@ -0,0 +1,76 @@
+import random
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, select
+
+from app.database import Base
+from app.models import Session
+from app.tools.seed import generate, main, seed
+
+
+def test_generate_is_deterministic_and_follows_state_machine():
+    now = datetime(2026, 1, 1)
+    first = generate(1, 500, random.Random(7), now)
+    second = generate(1, 500, random.Random(7), now)
+    assert first == second
+
+    sessions, interruptions = first
+    pauses = {}
+    for row in interruptions:
+        pauses[row["session_id"]] = pauses.get(row["session_id"], 0) + 1
+
+    for row in sessions:
+        assert row["pause_count"] == pauses.get(row["id"], 0)
+        if row["status"] == "scheduled":
+            assert row["start_time"] is None and row["version"] == 1
+        if row["status"] == "interrupted":
+            assert row["pause_count"] == 4
+        if row["status"] == "overdue":
+            assert row["actual_duration"] > row["scheduled_duration"] * 1.1
+        if row["status"] == "completed":
+            assert row["actual_duration"] <= row["scheduled_duration"] * 1.1
+
+
+def test_seed_appends_in_chunks(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    Base.metadata.create_all(engine)
+
+    seed(engine, 250, seed=1, chunk_size=40, transaction_size=100, status_weights={"completed": 1})
+    sessions, _ = seed(engine, 10, seed=2)
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(Session)).scalar() == 260
+        assert conn.execute(select(func.max(Session.id))).scalar() == 260
+    assert sessions == 10
+    engine.dispose()
+
+
+def test_seed_output_is_reproducible(tmp_path):
+    def rows(name):
+        engine = create_engine(f"sqlite:///{tmp_path / name}")
+        Base.metadata.create_all(engine)
+        seed(engine, 50, seed=3)
+        with engine.connect() as conn:
+            result = conn.execute(select(Session).order_by(Session.id)).all()
+        engine.dispose()
+        return result
+
+    assert rows("first.db") == rows("second.db")
+
+
+def test_seed_cli(tmp_path, capsys):
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    main(["--database-url", url, "--create-tables", "--sessions", "50", "--durations", "30",
+          "--status-weights", "scheduled=1,completed=1", "--now", "2025-06-01T00:00:00"])
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        durations = conn.execute(select(Session.scheduled_duration).distinct()).scalars().all()
+        statuses = set(conn.execute(select(Session.status)).scalars())
+        created = conn.execute(select(Session.created_at)).scalars().all()
+    engine.dispose()
+
+    assert durations == [30]
+    assert max(created) < datetime(2025, 6, 1)
+    assert statuses <= {"scheduled", "completed"}
+    assert "50 sessions" in capsys.readouterr().out
@@ -1,7 +1,11 @@
 import pytest
 import os
+import csv
+import io
 from datetime import datetime, timedelta
 from fastapi import HTTPException
+from app.cache import cache
+from app.events import hub
 from app.models import Session, Interruption
 from app.services.session_services import (
     create_session,
@@ -10,16 +14,18 @@ from app.services.session_services import (
     resume_session,
     complete_session,
     get_session_history,
+    get_session_history_page,
     get_weekly_report,
     export_sessions_csv,
+    export_sessions_columnar,
+    apply_batch,
+    get_data_version,
+    get_changes,
     to_ist
 )
+from app.schemas import BatchItem
+from conftest import MockSessionData
 
-class MockSessionData:
-    def __init__(self, title, goal, scheduled_duration):
-        self.title = title
-        self.goal = goal
-        self.scheduled_duration = scheduled_duration
 
 # --- Basic Service Tests ---
 
@@ -163,23 +169,182 @@ def test_complete_session_errors(db_session):
         complete_session(db_session, session.id)
     assert exc.value.status_code == 400
 
-def test_get_session_history(db_session):
-    # Create a complex session
-    session = Session(
-        title="History Test",
-        goal="Goal",
-        scheduled_duration=30,
-        status="completed",
-        start_time=datetime.utcnow() - timedelta(minutes=40),
-        end_time=datetime.utcnow() - timedelta(minutes=10)
-    )
-    db_session.add(session)
+def test_transition_is_single_statement(db_session, sql_statements):
+    session = create_session(db_session, MockSessionData("Atomic", None, 30))
+
+    sql_statements.clear()
+    started = start_session(db_session, session.id)
+
+    assert started.status == "active"
+    assert started.version == 2
+    # the data-version bump that stamps change_seq, then the conditional UPDATE
+    assert len(sql_statements) == 2
+    assert "data_version" in sql_statements[0]
+    assert sql_statements[1].lstrip().upper().startswith("UPDATE SESSIONS")
+
+def test_transition_version_conflict(db_session):
+    session = create_session(db_session, MockSessionData("Versioned", None, 30))
+    started = start_session(db_session, session.id, expected_version=1)
+
+    # A second client still holding version 1 loses the race
+    with pytest.raises(HTTPException) as exc:
+        pause_session(db_session, session.id, "Stale", expected_version=1)
+    assert exc.value.status_code == 409
+
+    paused = pause_session(db_session, session.id, "Fresh", expected_version=started.version)
+    assert paused.status == "paused"
+    assert db_session.query(Interruption).filter_by(session_id=session.id).count() == 1
+
+def test_transition_if_match_header(client, db_session):
+    session = create_session(db_session, MockSessionData("Header", None, 30))
+
+    response = client.patch(f"/sessions/{session.id}/start", headers={"If-Match": '"1"'})
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+
+    response = client.patch(f"/sessions/{session.id}/pause", json={"reason": "Late"}, headers={"If-Match": '"1"'})
+    assert response.status_code == 409
+
+def test_apply_batch(db_session, sql_statements):
+    existing = create_session(db_session, MockSessionData("Existing", None, 30))
+
+    items = [
+        BatchItem(op="create", title="Bulk 1", scheduled_duration=30),
+        BatchItem(op="start", id=existing.id),
+        BatchItem(op="create", title="Bulk 2", goal="G", scheduled_duration=45),
+        BatchItem(op="resume", id=existing.id),
+        BatchItem(op="pause", id=existing.id, reason="Batch"),
+        BatchItem(op="start", id=999999),
+    ]
+
+    sql_statements.clear()
+    results = apply_batch(db_session, items)
+
+    assert [r["ok"] for r in results] == [True, True, True, False, True, False]
+    assert results[0]["session"].title == "Bulk 1"
+    assert results[2]["session"].scheduled_duration == 45
+    assert results[3]["status_code"] == 400
+    assert results[4]["session"].status == "paused"
+    assert results[5]["status_code"] == 404
+    # both creates share one INSERT
+    assert sum(statement.lstrip().upper().startswith("INSERT INTO SESSIONS") for statement in sql_statements) == 1
+
+def test_apply_batch_results_show_each_step(db_session, monkeypatch):
+    published = []
+    monkeypatch.setattr(hub, "publish", published.append)
+    session = create_session(db_session, MockSessionData("Steps", None, 30))
+    published.clear()
+
+    results = apply_batch(db_session, [
+        BatchItem(op="start", id=session.id),
+        BatchItem(op="pause", id=session.id, reason="Step"),
+        BatchItem(op="resume", id=session.id),
+    ])
+
+    assert [(r["session"].status, r["session"].version) for r in results] == [
+        ("active", 2), ("paused", 3), ("active", 4)
+    ]
+    assert [(e["action"], e["session"]["status"], e["version"]) for e in published] == [
+        ("start", "active", 2), ("pause", "paused", 3), ("resume", "active", 4)
+    ]
+
+def _running_with_closed_pause(db):
+    # started 30 minutes ago, paused from minute 10 to minute 20
+    now = datetime.utcnow()
+    session = Session(title="Batch pauses", scheduled_duration=60, status="active", version=4,
+                      start_time=now - timedelta(minutes=30), pause_count=1, paused_minutes=10)
+    db.add(session)
+    db.flush()
+    db.add(Interruption(session_id=session.id, reason="Earlier", pause_time=now - timedelta(minutes=20),
+                        resume_time=now - timedelta(minutes=10)))
+    db.commit()
+    return session.id
+
+
+def _open_pauses(db, session_id):
+    return db.query(Interruption).filter_by(session_id=session_id, resume_time=None).count()
+
+
+def test_apply_batch_pause_then_resume_same_session(db_session):
+    session_id = _running_with_closed_pause(db_session)
+
+    results = apply_batch(db_session, [
+        BatchItem(op="pause", id=session_id, reason="Quick"),
+        BatchItem(op="resume", id=session_id),
+    ])
+
+    assert [r["ok"] for r in results] == [True, True]
+    # the new pause lasted a moment; the earlier closed one is not counted again
+    assert 10 <= results[1]["session"].paused_minutes < 10.1
+    assert _open_pauses(db_session, session_id) == 0
+
+
+def test_apply_batch_pause_then_complete_same_session(db_session):
+    session_id = _running_with_closed_pause(db_session)
+
+    results = apply_batch(db_session, [
+        BatchItem(op="pause", id=session_id, reason="Done for now"),
+        BatchItem(op="complete", id=session_id),
+    ])
+
+    completed = results[1]["session"]
+    assert completed.status == "completed"
+    assert 10 <= completed.paused_minutes < 10.1
+    assert 19.9 < completed.focused_minutes <= 20
+    # completing while paused ends that pause at end_time
+    assert _open_pauses(db_session, session_id) == 0
+    latest = db_session.query(Interruption).filter_by(session_id=session_id, reason="Done for now").one()
+    assert latest.resume_time == completed.end_time
+
+
+def test_complete_keeps_focused_minutes_unknown_for_legacy_pauses(db_session):
+    now = datetime.utcnow()
+    legacy = Session(title="Legacy pauses", scheduled_duration=60, status="active", version=4,
+                     start_time=now - timedelta(minutes=30), pause_count=1)
+    db_session.add(legacy)
+    db_session.flush()
+    # paused and resumed before resume times were recorded
+    db_session.add(Interruption(session_id=legacy.id, reason="Old", pause_time=now - timedelta(minutes=20)))
     db_session.commit()
-    
-    # Add a pause
-    db_session.add(Interruption(session_id=session.id, reason="R1"))
+
+    completed = complete_session(db_session, legacy.id)
+
+    assert completed.actual_duration is not None
+    assert completed.focused_minutes is None
+
+    # a pause that is still open when completing is measured, so it does not count as legacy
+    paused = create_session(db_session, MockSessionData("Paused at complete", None, 60))
+    start_session(db_session, paused.id)
+    pause_session(db_session, paused.id, "Break")
+    assert complete_session(db_session, paused.id).focused_minutes is not None
+
+
+def test_batch_endpoint(client):
+    response = client.post("/sessions/batch", json={"items": [
+        {"op": "create", "title": "API bulk", "scheduled_duration": 20},
+        {"op": "complete", "id": 999999},
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0]["ok"] is True
+    assert body[0]["session"]["status"] == "scheduled"
+    assert body[1]["status_code"] == 404
+
+    response = client.post("/sessions/batch", json={"items": [{"op": "pause", "id": 1}]})
+    assert response.status_code == 422
+
+def test_get_session_history(db_session):
+    # Drive a session through the transitions that maintain its metrics
+    session = create_session(db_session, MockSessionData("History Test", "Goal", 30))
+    start_session(db_session, session.id)
+    pause_session(db_session, session.id, "R1")
+    resume_session(db_session, session.id)
+
+    session.start_time = datetime.utcnow() - timedelta(minutes=30)
     db_session.commit()
-    
+    complete_session(db_session, session.id)
+
     history = get_session_history(db_session)
     assert len(history) >= 1
     item = next(h for h in history if h["id"] == session.id)
@@ -187,7 +352,248 @@ def test_get_session_history(db_session):
     assert item["pause_count"] == 1
     assert item["actual_duration"] == 30.0
     assert item["completion_ratio"] == 1.0
-    assert item["focus_score"] is not None
+    assert item["focus_score"] == round((1 - 1 / 30) * 100, 2)
+
+def test_pause_session_persists_metrics(db_session, sql_statements):
+    session = create_session(db_session, MockSessionData("Metrics", None, 10))
+    assert session.pause_count == 0
+    assert session.focus_score == 100.0
+
+    start_session(db_session, session.id)
+    sql_statements.clear()
+    paused = pause_session(db_session, session.id, "Coffee")
+
+    assert paused.pause_count == 1
+    assert paused.focus_score == 90.0
+    assert not any("count(" in statement.lower() for statement in sql_statements)
+
+def test_get_session_history_fixed_statement_count(db_session, sql_statements):
+    def add_sessions(count):
+        for i in range(count):
+            session = Session(
+                title=f"N+1 {i}",
+                scheduled_duration=30,
+                status="completed",
+                start_time=datetime.utcnow() - timedelta(minutes=30),
+                end_time=datetime.utcnow()
+            )
+            db_session.add(session)
+            db_session.flush()
+            db_session.add(Interruption(session_id=session.id, reason="R"))
+        db_session.commit()
+        cache.invalidate()  # raw inserts bypass the service layer's invalidation
+
+    add_sessions(3)
+    sql_statements.clear()
+    get_session_history(db_session)
+    small = len(sql_statements)
+
+    add_sessions(25)
+    sql_statements.clear()
+    get_session_history(db_session)
+
+    # the data_version read for the cache key, then one history SELECT
+    assert small == 2
+    assert len(sql_statements) == small
+
+def test_get_session_history_keyset_pages(db_session):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    for i in range(5):
+        db_session.add(Session(title=f"Page {i}", scheduled_duration=30, status="scheduled"))
+    db_session.commit()
+
+    first, cursor = get_session_history_page(db_session, limit=2)
+    second, cursor = get_session_history_page(db_session, limit=2, cursor=cursor)
+    third, cursor = get_session_history_page(db_session, limit=2, cursor=cursor)
+
+    assert [h["title"] for h in first] == ["Page 4", "Page 3"]
+    assert [h["title"] for h in second] == ["Page 2", "Page 1"]
+    assert [h["title"] for h in third] == ["Page 0"]
+    assert cursor is None
+
+def test_get_session_history_filters(db_session):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    now = datetime.utcnow()
+    db_session.add(Session(title="Write report", scheduled_duration=30, status="completed", created_at=now - timedelta(days=10)))
+    db_session.add(Session(title="Write code", scheduled_duration=30, status="active", created_at=now))
+    db_session.add(Session(title="Read paper", scheduled_duration=30, status="active", created_at=now))
+    db_session.commit()
+
+    assert {h["title"] for h in get_session_history(db_session, title_prefix="Write")} == {"Write report", "Write code"}
+    assert {h["title"] for h in get_session_history(db_session, status=["active"])} == {"Write code", "Read paper"}
+    assert {h["title"] for h in get_session_history(db_session, created_from=now - timedelta(days=1))} == {"Write code", "Read paper"}
+    assert {h["title"] for h in get_session_history(db_session, created_to=now - timedelta(days=1))} == {"Write report"}
+
+def test_history_endpoint_next_cursor(client, db_session):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    for i in range(3):
+        db_session.add(Session(title=f"API {i}", scheduled_duration=30, status="scheduled"))
+    db_session.commit()
+
+    response = client.get("/sessions/history", params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    response = client.get("/sessions/history", params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]})
+    assert [h["title"] for h in response.json()] == ["API 0"]
+    assert "X-Next-Cursor" not in response.headers
+
+def test_history_endpoint_unpaged_without_limit(client, db_session):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    db_session.add_all(Session(title=f"Unpaged {i}", scheduled_duration=30, status="scheduled") for i in range(150))
+    db_session.commit()
+
+    # existing callers (the frontend, get_history()) still get every session
+    response = client.get("/sessions/history")
+    assert len(response.json()) == 150
+    assert "X-Next-Cursor" not in response.headers
+
+def test_data_version_bumped_by_writes(db_session):
+    before = get_data_version(db_session)
+    session = create_session(db_session, MockSessionData("Versioned data", None, 30))
+    start_session(db_session, session.id)
+    apply_batch(db_session, [BatchItem(op="create", title="Bulk", scheduled_duration=10)])
+
+    assert get_data_version(db_session) == before + 3
+
+def test_writes_stamp_change_seq(db_session):
+    session = create_session(db_session, MockSessionData("Stamped", None, 30))
+    created_seq = session.change_seq
+    assert created_seq == get_data_version(db_session)
+
+    start_session(db_session, session.id)
+    paused = pause_session(db_session, session.id, "Call")
+    interruption = db_session.query(Interruption).filter_by(session_id=session.id).one()
+
+    assert paused.change_seq == interruption.change_seq == get_data_version(db_session)
+    assert paused.change_seq > created_seq
+
+def test_changes_since_token(db_session):
+    token = get_data_version(db_session)
+    untouched = create_session(db_session, MockSessionData("Untouched", None, 30))
+    changed = create_session(db_session, MockSessionData("Changed", None, 30))
+
+    first = get_changes(db_session, since=token)
+    assert [s["id"] for s in first["sessions"]] == [untouched.id, changed.id]
+    assert first["token"] == str(get_data_version(db_session))
+
+    start_session(db_session, changed.id)
+    pause_session(db_session, changed.id, "Call")
+
+    delta = get_changes(db_session, since=first["token"])
+    assert [(s["id"], s["status"]) for s in delta["sessions"]] == [(changed.id, "paused")]
+    assert [i["reason"] for i in delta["interruptions"]] == ["Call"]
+    assert get_changes(db_session, since=delta["token"])["sessions"] == []
+
+def test_changes_pages_split_a_large_write(db_session):
+    token = get_data_version(db_session)
+    single = create_session(db_session, MockSessionData("Single", None, 30))
+    created = apply_batch(db_session, [BatchItem(op="create", title=f"Bulk {i}", scheduled_duration=10) for i in range(5)])
+    ids = [item["session"].id for item in created]
+    apply_batch(db_session, [BatchItem(op="start", id=session_id) for session_id in ids])
+    apply_batch(db_session, [BatchItem(op="pause", id=session_id, reason="Call") for session_id in ids])
+
+    # the last write (the pauses) restamped all five sessions and added five interruptions
+    seen_sessions, seen_interruptions, pages = [], [], 0
+    while True:
+        page = get_changes(db_session, since=token, limit=2)
+        assert len(page["sessions"]) + len(page["interruptions"]) <= 2
+        seen_sessions += [s["id"] for s in page["sessions"]]
+        seen_interruptions += [i["session_id"] for i in page["interruptions"]]
+        token, pages = page["token"], pages + 1
+        if not page["has_more"]:
+            break
+
+    assert pages == 6  # 11 rows, two at a time
+    assert seen_sessions == [single.id] + ids
+    assert seen_interruptions == ids
+    assert token == str(get_data_version(db_session))
+    assert get_changes(db_session, since=token, limit=2) == {
+        "token": token, "has_more": False, "sessions": [], "interruptions": []
+    }
+
+def test_changes_rejects_a_malformed_token(db_session):
+    with pytest.raises(HTTPException) as error:
+        get_changes(db_session, since="3:x")
+    assert error.value.status_code == 400
+
+def test_resume_and_complete_split_focused_and_paused_time(db_session):
+    session = create_session(db_session, MockSessionData("Split", None, 60))
+    start_session(db_session, session.id)
+    pause_session(db_session, session.id, "Coffee")
+
+    # pretend the session started 40 minutes ago and the break began 15 minutes ago
+    now = datetime.utcnow()
+    interruption = db_session.query(Interruption).filter_by(session_id=session.id).one()
+    interruption.pause_time = now - timedelta(minutes=15)
+    db_session.query(Session).filter_by(id=session.id).update({"start_time": now - timedelta(minutes=40)})
+    db_session.commit()
+
+    resumed = resume_session(db_session, session.id)
+    assert resumed.paused_minutes == pytest.approx(15, abs=0.1)
+    db_session.refresh(interruption)
+    assert interruption.resume_time is not None
+
+    completed = complete_session(db_session, session.id)
+    assert completed.actual_duration == pytest.approx(40, abs=0.1)
+    assert completed.focused_minutes == pytest.approx(25, abs=0.1)
+
+    item = next(h for h in get_session_history(db_session) if h["id"] == session.id)
+    assert item["focused_minutes"] == completed.focused_minutes
+    assert item["paused_minutes"] == completed.paused_minutes
+
+def test_complete_while_paused_ends_the_pause(db_session):
+    session = create_session(db_session, MockSessionData("Ends paused", None, 60))
+    start_session(db_session, session.id)
+    pause_session(db_session, session.id, "Done early")
+
+    now = datetime.utcnow()
+    db_session.query(Interruption).filter_by(session_id=session.id).update({"pause_time": now - timedelta(minutes=10)})
+    db_session.query(Session).filter_by(id=session.id).update({"start_time": now - timedelta(minutes=30)})
+    db_session.commit()
+
+    completed = complete_session(db_session, session.id)
+    assert completed.paused_minutes == pytest.approx(10, abs=0.1)
+    assert completed.focused_minutes == pytest.approx(20, abs=0.1)
+
+def test_weekly_report_sums_focused_and_paused_minutes(db_session):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    now = datetime.utcnow()
+    db_session.add(Session(title="F1", status="completed", created_at=now, scheduled_duration=30,
+                           focused_minutes=25, paused_minutes=5))
+    db_session.add(Session(title="F2", status="overdue", created_at=now, scheduled_duration=30,
+                           focused_minutes=30.5, paused_minutes=4))
+    db_session.commit()
+
+    week = get_weekly_report(db_session)[0]
+    assert week["focused_minutes"] == 55.5
+    assert week["paused_minutes"] == 9
+
+def test_history_conditional_get(client, db_session, sql_statements):
+    first = client.get("/sessions/history")
+    etag = first.headers["ETag"]
+
+    sql_statements.clear()
+    cached = client.get("/sessions/history", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert not any("FROM sessions" in statement for statement in sql_statements)
+
+    # different query -> different tag
+    assert client.get("/sessions/history", params={"limit": 5}).headers["ETag"] != etag
+
+    create_session(db_session, MockSessionData("Invalidates", None, 30))
+    fresh = client.get("/sessions/history", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+
+def test_weekly_report_conditional_get(client):
+    etag = client.get("/sessions/weekly-report").headers["ETag"]
+    assert client.get("/sessions/weekly-report", headers={"If-None-Match": etag}).status_code == 304
 
 def test_weekly_report(db_session):
     # Clear and add sessions for current week
@@ -205,18 +611,103 @@ def test_weekly_report(db_session):
     assert report[0]["overdue_sessions"] == 1
     assert report[0]["interrupted_sessions"] == 1
 
+def test_weekly_report_range(db_session):
+    db_session.query(Session).delete()
+    monday = datetime(2026, 3, 2, 9, 0)
+    db_session.add(Session(title="W1", status="completed", created_at=monday, scheduled_duration=10))
+    db_session.add(Session(title="W1", status="overdue", created_at=monday + timedelta(days=6), scheduled_duration=10))
+    db_session.add(Session(title="W3", status="interrupted", created_at=monday + timedelta(weeks=2), scheduled_duration=10))
+    db_session.add(Session(title="Outside", status="completed", created_at=monday + timedelta(weeks=5), scheduled_duration=10))
+    db_session.commit()
+
+    report = get_weekly_report(db_session, date_from=monday.date(), date_to=(monday + timedelta(weeks=2, days=3)).date())
+
+    assert [w["week"] for w in report] == ["2026-W10", "2026-W11", "2026-W12"]
+    assert [w["total_sessions"] for w in report] == [2, 0, 1]
+    assert report[0]["completed_sessions"] == 1
+    assert report[0]["overdue_sessions"] == 1
+    assert report[2]["interrupted_sessions"] == 1
+
+def test_weekly_report_invalid_range(db_session):
+    with pytest.raises(HTTPException) as exc:
+        get_weekly_report(db_session, date_from=datetime(2026, 3, 9).date(), date_to=datetime(2026, 3, 2).date())
+    assert exc.value.status_code == 400
+
 def test_export_csv(db_session):
     # Ensure there is at least one session
-    db_session.add(Session(title="CSV Test", scheduled_duration=30, status="completed", start_time=datetime.utcnow()))
+    session = Session(title="CSV Test", scheduled_duration=30, status="completed", start_time=datetime(2026, 1, 1, 12, 0))
+    db_session.add(session)
     db_session.commit()
-    
-    file_path = export_sessions_csv(db_session)
-    assert os.path.exists(file_path)
-    assert file_path == "sessions_export.csv"
-    
-    # Clean up
-    if os.path.exists(file_path):
-        os.remove(file_path)
+
+    rows = list(csv.reader(io.StringIO("".join(export_sessions_csv(db_session)))))
+
+    assert rows[0][0] == "ID"
+    row = next(r for r in rows[1:] if r[0] == str(session.id))
+    assert row[1] == "CSV Test"
+    assert row[8] == "01-01-2026 17:30"
+    assert row[9] == "N/A"
+    assert not os.path.exists("sessions_export.csv")
+
+def test_export_csv_batches(db_session, sql_statements):
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    for i in range(5):
+        db_session.add(Session(title=f"Batch {i}", scheduled_duration=30, status="scheduled"))
+    db_session.commit()
+
+    sql_statements.clear()
+    chunks = list(export_sessions_csv(db_session, batch_size=2))
+
+    # header + three partitions of at most two rows, from a single statement
+    assert len(chunks) == 4
+    assert len(sql_statements) == 1
+
+def test_export_endpoint_streams_csv(client, db_session):
+    db_session.add(Session(title="Streamed", scheduled_duration=30, status="scheduled"))
+    db_session.commit()
+
+    response = client.get("/sessions/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "Streamed" in response.text
+
+def test_export_parquet_batches_are_typed(db_session):
+    pq = pytest.importorskip("pyarrow.parquet")
+    db_session.query(Interruption).delete()
+    db_session.query(Session).delete()
+    for i in range(5):
+        db_session.add(Session(title=f"Columnar {i}", scheduled_duration=30, status="scheduled"))
+    db_session.add(Session(title="Done", scheduled_duration=30, status="completed",
+                           start_time=datetime(2026, 1, 1, 12, 0), actual_duration=25.5))
+    db_session.commit()
+
+    chunks = list(export_sessions_columnar(db_session, "parquet", batch_size=2))
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+
+    assert table.num_rows == 6
+    assert pq.ParquetFile(io.BytesIO(b"".join(chunks))).num_row_groups == 3
+    assert str(table.schema.field("start_time").type) == "timestamp[us, tz=UTC]"
+    assert table.column("actual_duration").null_count == 5
+    done = table.to_pylist()[-1]
+    assert done["actual_duration"] == 25.5
+    assert done["start_time"].hour == 12
+
+def test_export_endpoint_arrow_stream(client, db_session):
+    pa = pytest.importorskip("pyarrow")
+    session = create_session(db_session, MockSessionData("Arrow", None, 30))
+    start_session(db_session, session.id)
+    pause_session(db_session, session.id, "Call")
+
+    response = client.get("/sessions/export", params={"format": "arrow", "table": "interruptions"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["id", "session_id", "reason", "pause_time", "resume_time"]
+    assert session.id in table.column("session_id").to_pylist()
+
+    assert client.get("/sessions/export", params={"table": "interruptions"}).status_code == 400
+    assert client.get("/sessions/export", params={"format": "xlsx"}).status_code == 422
 
 def test_to_ist_edge_cases():
     assert to_ist(None) is None
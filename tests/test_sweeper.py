@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.metrics import metrics
+from app.models import Interruption, Session
+from app.services.session_services import complete_session, pause_session, resume_session
+from app.sweeper import Sweeper
+from conftest import TestingSessionLocal
+
+
+def _add(db, status, start_minutes_ago=None, pause_minutes_ago=None, scheduled=30):
+    now = datetime.utcnow()
+    session = Session(
+        title=f"Sweep {status}",
+        scheduled_duration=scheduled,
+        status=status,
+        start_time=now - timedelta(minutes=start_minutes_ago) if start_minutes_ago is not None else None,
+    )
+    db.add(session)
+    db.flush()
+    if pause_minutes_ago is not None:
+        db.add(Interruption(session_id=session.id, reason="Away", pause_time=now - timedelta(minutes=pause_minutes_ago)))
+    db.commit()
+    return session.id
+
+
+def test_sweep_marks_abandoned_and_overdue_in_batches(db_session):
+    stale = [_add(db_session, "paused", 300, pause_minutes_ago=240) for _ in range(3)]
+    recent = _add(db_session, "paused", 20, pause_minutes_ago=5)
+    overrun = _add(db_session, "active", start_minutes_ago=40, scheduled=30)
+    on_time = _add(db_session, "active", start_minutes_ago=10, scheduled=30)
+    batches_before = metrics.sweep_batch_seconds.series[("abandoned",)][2]
+
+    swept = Sweeper(TestingSessionLocal, batch_size=2).run_once()
+
+    assert swept["abandoned"] >= 3 and swept["overdue"] >= 1
+    rows = {row.id: row for row in db_session.query(Session.id, Session.status, Session.overdue_at).filter(
+        Session.id.in_([*stale, recent, overrun, on_time])
+    )}
+    assert [rows[i].status for i in stale] == ["abandoned"] * 3
+    assert rows[recent].status == "paused"
+    # an overrun session keeps running; the sweep only records when it went over
+    assert rows[overrun].status == "active" and rows[overrun].overdue_at is not None
+    assert rows[on_time].status == "active" and rows[on_time].overdue_at is None
+    # batch_size=2 -> at least two write transactions for three stale sessions
+    assert metrics.sweep_batch_seconds.series[("abandoned",)][2] - batches_before >= 2
+
+    # a second run finds nothing
+    assert Sweeper(TestingSessionLocal, batch_size=2).run_once() == {"abandoned": 0, "overdue": 0}
+
+    with pytest.raises(HTTPException):
+        resume_session(db_session, stale[0])
+
+    # it can still be paused, resumed and completed (once), ending as overdue
+    pause_session(db_session, overrun, "Still here")
+    resume_session(db_session, overrun)
+    assert complete_session(db_session, overrun).status == "overdue"
+    with pytest.raises(HTTPException) as exc:
+        complete_session(db_session, overrun)
+    assert exc.value.status_code == 400
+
+
+def test_sweeper_task_starts_and_stops():
+    async def scenario():
+        sweeper = Sweeper(TestingSessionLocal, interval=3600)
+        runs = metrics.sweep_runs["ok"]
+        sweeper.start()
+        while metrics.sweep_runs["ok"] == runs:
+            await asyncio.sleep(0.01)
+        await sweeper.stop()
+        return sweeper
+
+    assert asyncio.run(scenario())._task is None
+
+
+def test_sweep_metrics_exposed(client):
+    Sweeper(TestingSessionLocal).run_once()
+    body = client.get("/metrics").text
+
+    assert 'deepwork_sweep_runs_total{result="ok"}' in body
+    assert "deepwork_sweep_duration_seconds_count " in body
+    assert 'deepwork_sweep_batch_seconds_bucket{kind="overdue",le="+Inf"}' in body